@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+
+Times every filter, FilterManager.apply_all / apply_all_with_details and
+every ExcelExporter method on seeded synthetic candidate pools, and writes
+machine-readable results that can be compared across commits.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 10000,100000] [--repeat 3]
+                                        [--export-size 10000] [--output PATH]
+                                        [--compare BASELINE.json]
+"""
+
+import sys
+import os
+import json
+import argparse
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Any
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from src.filter_manager import FilterManager
+from src.filters import (
+    AgeFilter,
+    ExperienceFilter,
+    LocationFilter,
+    BackgroundFilter
+)
+from src.exporter import ExcelExporter
+from src.synthetic_data import SyntheticDistribution, generate_candidates
+
+
+def build_filters() -> List:
+    """Create the default filters from settings."""
+    filter_settings = settings.filter
+    return [
+        AgeFilter(filter_settings.min_age, filter_settings.max_age),
+        ExperienceFilter(filter_settings.min_experience_years, filter_settings.max_experience_years),
+        LocationFilter(filter_settings.excluded_locations),
+        BackgroundFilter(filter_settings.preferred_backgrounds, filter_settings.excluded_backgrounds),
+    ]
+
+
+def time_it(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Time a callable several times.
+
+    Args:
+        func: Zero-argument callable to time
+        repeat: Number of runs
+
+    Returns:
+        Dictionary with min and mean seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {"seconds_min": min(timings), "seconds_mean": sum(timings) / len(timings)}
+
+
+def run_benchmarks(sizes: List[int], repeat: int, export_size: int, seed: int) -> List[Dict[str, Any]]:
+    """
+    Run all benchmarks.
+
+    Args:
+        sizes: Candidate pool sizes for filter benchmarks
+        repeat: Runs per benchmark
+        export_size: Pool size for exporter benchmarks
+        seed: Random seed for the synthetic pools
+
+    Returns:
+        List of result records
+    """
+    distribution = SyntheticDistribution.from_filter_settings(settings.filter)
+    results = []
+
+    def record(name: str, size: int, func: Callable[[], Any]) -> None:
+        timing = time_it(func, repeat)
+        timing["ns_per_item"] = timing["seconds_min"] / size * 1e9 if size else 0.0
+        results.append({"name": name, "size": size, **timing})
+        print(f"  {name:<40}{size:>10}{timing['seconds_min']:>12.4f}s{timing['ns_per_item']:>12.0f} ns/item")
+
+    for size in sizes:
+        candidates = list(generate_candidates(size, seed=seed, distribution=distribution))
+        filters = build_filters()
+
+        for filter_instance in filters:
+            record(
+                f"filter.{filter_instance.name}", size,
+                lambda f=filter_instance: [f.apply(c) for c in candidates]
+            )
+
+        manager = FilterManager()
+        for filter_instance in filters:
+            manager.add_filter(filter_instance)
+        record("FilterManager.apply_all", size, lambda: manager.apply_all(candidates))
+        record("FilterManager.apply_all_with_details", size,
+               lambda: manager.apply_all_with_details(candidates))
+
+    candidates = list(generate_candidates(export_size, seed=seed, distribution=distribution))
+    manager = FilterManager()
+    for filter_instance in build_filters():
+        manager.add_filter(filter_instance)
+    details = manager.apply_all_with_details(candidates)
+
+    with tempfile.TemporaryDirectory() as output_directory:
+        exporter = ExcelExporter(output_directory=output_directory)
+        record("ExcelExporter.export", export_size, lambda: exporter.export(candidates))
+        record("ExcelExporter.export_detailed", export_size, lambda: exporter.export_detailed(candidates))
+        record("ExcelExporter.export_summary", export_size, lambda: exporter.export_summary(
+            total_candidates=len(candidates),
+            filtered_candidates=len(details["passed"]),
+            filter_details=details
+        ))
+
+    return results
+
+
+def git_revision() -> str:
+    """Return the current git commit hash, or 'unknown'."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any]) -> None:
+    """
+    Print the speed ratio of each result against a baseline report.
+
+    Args:
+        results: Current results
+        baseline: Report written by a previous run
+    """
+    previous = {(r["name"], r["size"]): r for r in baseline["results"]}
+
+    print(f"\nComparison against {baseline.get('revision', 'baseline')}:")
+    for result in results:
+        old = previous.get((result["name"], result["size"]))
+        if old is None:
+            continue
+        ratio = old["seconds_min"] / result["seconds_min"] if result["seconds_min"] else 0.0
+        print(f"  {result['name']:<40}{result['size']:>10}{ratio:>10.2f}x")
+
+
+def main():
+    """Main entry point for the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Run filter and exporter benchmarks")
+    parser.add_argument("--sizes", default="10000,100000", help="Comma-separated pool sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark")
+    parser.add_argument("--export-size", type=int, default=10000, help="Pool size for exporters")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", default="output/benchmarks.json", help="Results JSON path")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print(f"  {'Benchmark':<40}{'Size':>10}{'Best':>13}{'Per item':>20}")
+    results = run_benchmarks(sizes, args.repeat, args.export_size, args.seed)
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if baseline is not None:
+        compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
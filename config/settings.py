@@ -1,7 +1,7 @@
 """Configuration settings for the applicant filter system."""
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List
 
 
 @dataclass
@@ -32,6 +32,33 @@ class FilterSettings:
         "Yemen", "Egypt", "Israel", "Palestine"  # Middle East
     ])
 
+    # Skill / language filter settings (boolean queries, empty = disabled)
+    # e.g. "Compliance AND (Mandarin OR Cantonese)"
+    skill_query: str = ""
+    language_query: str = ""
+
+    # Position filter settings (titles to match, empty = any position)
+    positions: List[str] = field(default_factory=list)
+
+    # Suppression list of contacted/rejected candidates
+    # (base path of the .bloom/.sqlite files, empty = disabled)
+    suppression_list: str = ""
+
+
+@dataclass
+class ScoringSettings:
+    """Ranking criteria configuration (used with --top-k)."""
+    target_experience_years: float = 2.0
+    experience_tolerance: float = 2.0
+    target_skills: List[str] = field(default_factory=lambda: [
+        "Compliance", "Operations", "Sales", "Risk Management", "Mandarin"
+    ])
+
+    # Relative weights of each criterion
+    experience_weight: float = 0.4
+    background_weight: float = 0.3
+    skill_weight: float = 0.3
+
 
 @dataclass
 class LinkedInAPISettings:
@@ -47,14 +74,106 @@ class ExportSettings:
     """Export configuration."""
     output_directory: str = "output"
     excel_filename: str = "candidates.xlsx"
+    # Indexed JSON Lines shortlist read by scripts/display_candidates.sh
+    results_filename: str = "candidates.jsonl"
+
+
+@dataclass
+class DedupSettings:
+    """Deduplication limits (memory is bounded by these caps)."""
+    fuzzy_threshold: float = 0.9
+    block_size: int = 64
+    max_blocks: int = 100_000
+    max_keys: int = 5_000_000  # Exact URL/email/phone hashes remembered
+
+
+@dataclass
+class CacheSettings:
+    """Persistent filter result cache configuration (used with --cache)."""
+    path: str = "output/filter_cache.sqlite"
+    max_entries: int = 5_000_000
+
+
+@dataclass
+class ServiceSettings:
+    """Screening service configuration (used by `main.py serve`)."""
+    host: str = "127.0.0.1"
+    port: int = 8080
+    socket_path: str = ""  # Serve on a Unix socket instead of TCP if set
+    page_size: int = 50
+
+
+@dataclass
+class WatchSettings:
+    """Watch-folder ingestion configuration (used by `main.py watch`)."""
+    input_directory: str = "input"
+    state_path: str = "output/watch_state.json"
+    output_filename: str = "candidates_watch.xlsx"
+    poll_interval: float = 5.0
+    settle_seconds: float = 2.0
+
+
+@dataclass
+class StoreSettings:
+    """SQLite candidate store configuration (used by --store)."""
+    path: str = "output/candidates.sqlite"
+    batch_size: int = 5000
+
+
+@dataclass
+class PreviewSettings:
+    """Sampled pass rate preview configuration (used by --preview)."""
+    sample_size: int = 2000
+    confidence: float = 0.95
+    seed: int = 0
+
+
+@dataclass
+class CheckpointSettings:
+    """Checkpoint configuration for resumable runs (see --resume)."""
+    path: str = "output/checkpoint.json"
+    chunk_size: int = 10000
+    interval_seconds: float = 30.0
+
+
+@dataclass
+class SuppressionSettings:
+    """Suppression list sizing (applies when a new list is created)."""
+    expected_items: int = 10_000_000
+    false_positive_rate: float = 0.001
+
+
+@dataclass
+class ShardSettings:
+    """Partitioned run configuration (used by --shard and `main.py merge`)."""
+    directory: str = "output/shards"
+
+
+@dataclass
+class PipelineSettings:
+    """Concurrent pipeline configuration (used with --pipeline)."""
+    chunk_size: int = 1000  # Candidates per batch
+    queue_size: int = 4  # Batches per queue before the producer blocks
+    workers: int = 1  # Filter threads (more only help with I/O-bound filters)
 
 
 @dataclass
 class Settings:
     """Main settings container."""
     filter: FilterSettings = field(default_factory=FilterSettings)
+    scoring: ScoringSettings = field(default_factory=ScoringSettings)
     linkedin_api: LinkedInAPISettings = field(default_factory=LinkedInAPISettings)
     export: ExportSettings = field(default_factory=ExportSettings)
+    dedup: DedupSettings = field(default_factory=DedupSettings)
+    cache: CacheSettings = field(default_factory=CacheSettings)
+    service: ServiceSettings = field(default_factory=ServiceSettings)
+    watch: WatchSettings = field(default_factory=WatchSettings)
+    store: StoreSettings = field(default_factory=StoreSettings)
+    preview: PreviewSettings = field(default_factory=PreviewSettings)
+    checkpoint: CheckpointSettings = field(default_factory=CheckpointSettings)
+    suppression: SuppressionSettings = field(default_factory=SuppressionSettings)
+    shard: ShardSettings = field(default_factory=ShardSettings)
+    pipeline: PipelineSettings = field(default_factory=PipelineSettings)
 
     # Target positions
     target_positions: List[str] = field(default_factory=lambda: [
@@ -63,6 +182,23 @@ class Settings:
         "Business Development Manager"
     ])
 
+    # Named filter profiles screened together with --filter-profiles (one per
+    # role): FilterSettings fields that differ from `filter` for that role.
+    # Criteria shared between profiles are evaluated once per candidate.
+    profiles: Dict[str, Dict[str, Any]] = field(default_factory=lambda: {
+        "Operation Manager": {
+            "positions": ["Operation Manager"],
+        },
+        "Compliance Advisor": {
+            "positions": ["Compliance Advisor"],
+            "max_experience_years": 4.0,
+        },
+        "Business Development Manager": {
+            "positions": ["Business Development Manager"],
+            "max_experience_years": 5.0,
+        },
+    })
+
 
 # Global settings instance
 settings = Settings()
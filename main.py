@@ -9,16 +9,66 @@ This system filters candidates based on configurable criteria:
 - Background: Prefers China/UK, excludes India/Middle East
 
 Usage:
-    python main.py [--verbose] [--detailed]
+    python main.py [run] [--verbose] [--detailed] [--profile]
+                   [--input FILE [FILE ...]] [--no-dedup] [--top-k N]
+                   [--skills QUERY] [--languages QUERY] [--cache]
+                   [--filter-profiles [NAME ...]] [--workers N]
+                   [--store [PATH]]
+                   [--preview [N]] [--resume]
+                   [--suppression PATH] [--suppress-exported]
+                   [--limit N] [--time-budget SECONDS] [--shard I/K]
+                   [--pipeline]
+    python main.py serve [--input FILE [FILE ...]] [--host HOST] [--port PORT]
+                   [--socket PATH]
+    python main.py watch [--dir DIR] [--once] [--suppress-exported]
+    python main.py suppress --input FILE [FILE ...] [--suppression PATH]
+    python main.py merge [--dir DIR] [--verbose] [--detailed]
+
+Modes:
+    run         Filter once, print and export the results (default)
+    serve       Load candidates once and answer filter queries over HTTP
+    watch       Filter new/changed files in a drop directory as they arrive
+    suppress    Add LinkedIn URLs / emails (text files, one per line) or
+                candidates (JSON/JSONL) to the suppression list
+    merge       Combine the outputs of a --shard run into the usual reports
 
 Options:
-    --verbose   Show detailed filtering results
+    --verbose   Show per-filter rejections (first failing filter only)
     --detailed  Export detailed Excel report
+    --profile   Print per-filter and per-stage timings and write them as JSON
+    --input     Load candidates from JSON/JSONL files instead of mock data
+    --no-dedup  Skip removing duplicate candidates before filtering
+    --top-k     Keep only the N best-scoring candidates, ranked by score
+    --skills    Boolean skill query, e.g. "Compliance AND (Mandarin OR Cantonese)"
+    --languages Boolean language query, e.g. "English AND Mandarin"
+    --cache     Reuse filter verdicts from previous runs (persistent cache)
+    --filter-profiles   Screen against the named filter profiles (all if no
+                        names) in one pass
+    --workers   Filter in N worker processes
+    --store     Screen the SQLite candidate store (after adding any --input files)
+    --preview   Estimate pass rates from a random sample of N candidates
+    --resume    Continue an interrupted run from its last checkpoint
+    --suppression       Suppression list to screen against (base path)
+    --suppress-exported Add exported candidates to the suppression list
+    --limit     Stop as soon as N candidates have passed (input is streamed)
+    --time-budget       Return whatever passed within this many seconds
+    --shard     Screen only shard I of K (by LinkedIn URL hash) and write
+                its output for `main.py merge` (requires --no-dedup)
+    --pipeline  Read, filter and export concurrently in bounded batches
+    --host      serve: interface to listen on
+    --port      serve: TCP port to listen on
+    --socket    serve: listen on this Unix socket instead of TCP
+    --dir       watch: directory to monitor; --shard/merge: shard output directory
+    --once      watch: process pending files once and exit
 """
 
 import sys
 import os
 import argparse
+import time
+from contextlib import nullcontext
+from itertools import chain
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,14 +76,33 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from config.settings import settings
 from src.candidate import Candidate
 from src.filter_manager import FilterManager
-from src.filters import (
-    AgeFilter,
-    ExperienceFilter,
-    LocationFilter,
-    BackgroundFilter
-)
+from src.filter_factory import add_default_filters, apply_filter_overrides, create_filter_manager
 from src.mock_data import get_mock_candidates
+from src.loader import load_candidates
+from src.dedup import Deduplicator
+from src.scorers import (
+    BaseScorer,
+    ExperienceScorer,
+    BackgroundScorer,
+    SkillScorer,
+    WeightedScorer
+)
 from src.exporter import ExcelExporter
+from src.query_planner import QueryPlanner
+from src.profiling import FilterProfiler
+from src.screening_stats import ScreeningStats
+from src.result_cache import ResultCache, filter_config_key
+from src.screening_service import ScreeningService, ScreeningServer
+from src.folder_watcher import FolderWatcher
+from src.candidate_store import CandidateStore
+from src.checkpoint import Checkpoint, CheckpointState, make_run_key, screen_with_checkpoints
+from src.suppression_list import SuppressionList, parse_entry
+from src.sharding import (
+    ShardSummary, merge_shards, parse_shard, select_shard, select_shard_from_files, write_shard
+)
+from src.pipeline import screen_pipelined
+from src.results_file import ResultsWriter, write_results
+from src.sampling import preview_pass_rates, reservoir_sample, sample_jsonl
 
 
 def setup_filters(filter_manager: FilterManager) -> None:
@@ -43,43 +112,651 @@ def setup_filters(filter_manager: FilterManager) -> None:
     Args:
         filter_manager: The filter manager instance
     """
-    filter_settings = settings.filter
+    add_default_filters(filter_manager, settings.filter, create_suppression_list())
+
+
+def setup_scorer() -> BaseScorer:
+    """
+    Build the weighted scorer used to rank candidates.
+
+    Returns:
+        WeightedScorer combining experience, background and skill scores
+    """
+    scoring = settings.scoring
+    return WeightedScorer([
+        ExperienceScorer(
+            target_years=scoring.target_experience_years,
+            tolerance=scoring.experience_tolerance,
+            weight=scoring.experience_weight
+        ),
+        BackgroundScorer(
+            preferred_backgrounds=settings.filter.preferred_backgrounds,
+            weight=scoring.background_weight
+        ),
+        SkillScorer(
+            target_skills=scoring.target_skills,
+            weight=scoring.skill_weight
+        ),
+    ])
+
+
+def display_candidate(candidate: Candidate) -> None:
+    """Display a single candidate's information."""
+    print(candidate)
+
+
+def create_deduplicator() -> Deduplicator:
+    """Build a deduplicator with the memory caps from settings."""
+    dedup_settings = settings.dedup
+    return Deduplicator(
+        fuzzy_threshold=dedup_settings.fuzzy_threshold,
+        block_size=dedup_settings.block_size,
+        max_blocks=dedup_settings.max_blocks,
+        max_keys=dedup_settings.max_keys
+    )
+
+
+def create_suppression_list() -> Optional[SuppressionList]:
+    """Open the configured suppression list with the sizing from settings (None if unset)."""
+    if not settings.filter.suppression_list:
+        return None
+    suppression_settings = settings.suppression
+    return SuppressionList(
+        settings.filter.suppression_list,
+        expected_items=suppression_settings.expected_items,
+        false_positive_rate=suppression_settings.false_positive_rate
+    )
+
+
+class CountingIterator:
+    """Iterator wrapper that counts the items taken from it."""
+
+    def __init__(self, items):
+        self._items = iter(items)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = next(self._items)
+        self.count += 1
+        return item
+
+
+def load_pool(args) -> list:
+    """
+    Load candidates from the input files (or mock data) and deduplicate.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        List of candidates
+    """
+    if args.input:
+        source = chain.from_iterable(load_candidates(path) for path in args.input)
+    else:
+        source = get_mock_candidates()
+    if not args.no_dedup:
+        source = create_deduplicator().dedupe(source)
+    return list(source)
+
+
+def results_path() -> str:
+    """Path of the indexed results file read by scripts/display_candidates.sh."""
+    return os.path.join(settings.export.output_directory, settings.export.results_filename)
+
+
+def results_meta(total: int, passed: int, filter_names: list) -> dict:
+    """
+    Describe a run for the results file index.
+
+    Args:
+        total: Candidates screened
+        passed: Candidates that passed
+        filter_names: Active filters
+
+    Returns:
+        Metadata dictionary
+    """
+    return {
+        "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "total": total,
+        "passed": passed,
+        "filters": filter_names,
+    }
 
-    # Add age filter
-    filter_manager.add_filter(
-        AgeFilter(
-            min_age=filter_settings.min_age,
-            max_age=filter_settings.max_age
+
+def run_key_parts(args, filter_manager: FilterManager, collect_stats: bool) -> list:
+    """
+    Describe everything that determines a run's results, for its checkpoint.
+
+    Args:
+        args: Parsed command line arguments
+        filter_manager: The configured filters
+        collect_stats: Whether screening statistics are collected
+
+    Returns:
+        List of strings for make_run_key()
+    """
+    parts = [f"dedup={not args.no_dedup}", f"stats={collect_stats}"]
+    for path in args.input or ["<mock data>"]:
+        if os.path.exists(path):
+            stat = os.stat(path)
+            parts.append(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}")
+        else:
+            parts.append(path)
+    for name in filter_manager.list_filters():
+        parts.append(f"{name}={filter_config_key(filter_manager.get_filter(name))}")
+    return parts
+
+
+def run_profiles(args, candidates: list) -> None:
+    """
+    Screen candidates against several filter profiles in a single pass.
+
+    Args:
+        args: Parsed command line arguments
+        candidates: Loaded candidates
+    """
+    names = args.filter_profiles or list(settings.profiles)
+    # Profiles only override settings.filter (which holds --skills etc.)
+    suppression_list = create_suppression_list()
+    profiles = {
+        name: create_filter_manager(
+            apply_filter_overrides(settings.filter, settings.profiles[name]), suppression_list
+        )
+        for name in names
+    }
+    print(f"Screening {len(profiles)} profiles in one pass...")
+    results = FilterManager.apply_profiles(candidates, profiles)
+
+    for name, passed in results.items():
+        print()
+        print("=" * 60)
+        print(f"       {name}: {len(passed)} candidates")
+        print("=" * 60)
+        for candidate in passed:
+            display_candidate(candidate)
+            print()
+
+    exporter = ExcelExporter(output_directory=settings.export.output_directory)
+    path = exporter.export_profiles(results, filename="candidates_by_profile.xlsx")
+    print(f"Exported: {path}")
+    if args.suppress_exported:
+        # Shortlisted for any profile counts as exported
+        added = suppression_list.add_candidates(
+            candidate for passed in results.values() for candidate in passed
         )
+        print(f"Suppression list: {added} new entries")
+
+    print()
+    print("=" * 60)
+    print("       SUMMARY")
+    print("=" * 60)
+    print(f"  Total candidates: {len(candidates)}")
+    for name, passed in results.items():
+        print(f"  {name}: {len(passed)} passed")
+    print("=" * 60)
+
+
+def run_store(args) -> None:
+    """
+    Screen the persistent candidate store with filters pushed down to SQL.
+
+    Candidates from --input files are added to the store first (existing
+    LinkedIn URLs are replaced), so the store accumulates across runs.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    filter_manager = FilterManager()
+    setup_filters(filter_manager)
+
+    # Only the filters left for Python see candidates (and feed the stats)
+    screening_stats = ScreeningStats() if args.verbose else None
+    filter_manager.set_stats(screening_stats)
+
+    with CandidateStore(args.store, batch_size=settings.store.batch_size) as store:
+        if args.input:
+            print("Adding candidates to the store...")
+            added = store.add_many(load_pool(args))
+            print(f"Stored {added} candidates")
+        print(f"Store {args.store}: {len(store)} candidates")
+
+        where, params, residual = filter_manager.to_sql()
+        if args.verbose:
+            print("--- Store Query ---")
+            print(f"  WHERE {where}")
+            print(f"  Parameters: {params}")
+            print(f"  Client-side: {residual}")
+            print()
+
+        print("Applying filters...")
+        total = len(store)
+        filtered_candidates = filter_manager.apply_store(store, limit=args.limit)
+
+    if args.verbose:
+        print("\n--- Filter Details ---")
+        if args.limit is None:
+            # Rows the SQL query returned were screened (or passed) in Python
+            returned = screening_stats.total if residual else len(filtered_candidates)
+            print(f"  SQL ({len(filter_manager) - len(residual)} filters): {total - returned} rejected")
+        for filter_name in residual:
+            rejected_count = screening_stats.rejections.get(filter_name, 0)
+            print(f"  {filter_name}: {rejected_count} rejected first")
+
+    print()
+    print("=" * 60)
+    print("       FILTERED CANDIDATES")
+    print("=" * 60)
+    for candidate in filtered_candidates:
+        display_candidate(candidate)
+        print()
+
+    exporter = ExcelExporter(output_directory=settings.export.output_directory)
+    path = exporter.export(filtered_candidates, filename=settings.export.excel_filename)
+    print(f"Exported: {path}")
+    path = write_results(
+        results_path(),
+        filtered_candidates,
+        results_meta(total, len(filtered_candidates), filter_manager.list_filters())
     )
+    print(f"Exported: {path}")
+
+    print()
+    print("=" * 60)
+    print("       SUMMARY")
+    print("=" * 60)
+    print(f"  Total candidates: {total}")
+    print(f"  Passed filters: {len(filtered_candidates)}")
+    print("=" * 60)
+
+
+def run_pipelined(args) -> None:
+    """
+    Screen the input with reading, filtering and exporting overlapped.
 
-    # Add experience filter
-    filter_manager.add_filter(
-        ExperienceFilter(
-            min_years=filter_settings.min_experience_years,
-            max_years=filter_settings.max_experience_years
+    Batches flow through bounded queues, so memory stays flat however
+    large the input is; passing candidates are written to the reports as
+    they arrive instead of being listed on screen.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    pipeline_settings = settings.pipeline
+    filter_manager = FilterManager()
+    setup_filters(filter_manager)
+    screening_stats = ScreeningStats() if args.verbose else None
+    filter_manager.set_stats(screening_stats)
+    print(f"Active filters: {filter_manager.list_filters()}")
+
+    if args.input:
+        source = chain.from_iterable(load_candidates(path) for path in args.input)
+    else:
+        source = get_mock_candidates()
+    deduplicator = None
+    if not args.no_dedup:
+        deduplicator = create_deduplicator()
+        source = deduplicator.dedupe(source)
+
+    exporter = ExcelExporter(output_directory=settings.export.output_directory)
+    reports = [exporter.open_stream(settings.export.excel_filename)]
+    if args.detailed:
+        reports.append(exporter.open_stream("candidates_detailed.xlsx", detailed=True))
+    reports.append(ResultsWriter(results_path()))
+    suppression_list = open_suppression_list(filter_manager) if args.suppress_exported else None
+    suppressed = 0
+
+    def write(passed):
+        nonlocal suppressed
+        for report in reports:
+            report.write(passed)
+        if suppression_list is not None:
+            suppressed += suppression_list.add_candidates(passed)
+
+    print("Screening (read -> filter -> export)...")
+    report = screen_pipelined(
+        filter_manager,
+        source,
+        write,
+        chunk_size=pipeline_settings.chunk_size,
+        queue_size=pipeline_settings.queue_size,
+        workers=args.workers or pipeline_settings.workers
+    )
+    paths = [stream.close() for stream in reports[:-1]]
+    paths.append(reports[-1].close(
+        results_meta(report.total, report.passed, filter_manager.list_filters())
+    ))
+
+    print()
+    print("--- Pipeline Stages ---")
+    print(report.format_table())
+    print()
+    if deduplicator:
+        dedup_stats = deduplicator.stats
+        print(
+            f"Duplicates removed: {dedup_stats.exact_duplicates} exact, "
+            f"{dedup_stats.fuzzy_duplicates} fuzzy"
         )
+    if args.verbose:
+        print("--- Filter Details ---")
+        for filter_name in filter_manager.list_filters():
+            rejected_count = screening_stats.rejections.get(filter_name, 0)
+            print(f"  {filter_name}: {rejected_count} rejected first")
+        paths.append(exporter.export_summary(
+            total_candidates=report.total,
+            filtered_candidates=report.passed,
+            filename="filter_summary.xlsx",
+            stats=screening_stats
+        ))
+        print()
+    for path in paths:
+        print(f"Exported: {path}")
+    if suppression_list is not None:
+        print(f"Suppression list: {suppressed} new entries")
+
+    print()
+    print("=" * 60)
+    print("       SUMMARY")
+    print("=" * 60)
+    print(f"  Total candidates: {report.total}")
+    print(f"  Passed filters: {report.passed}")
+    print(f"  Pass rate: {report.passed/max(report.total, 1)*100:.1f}%")
+    print("=" * 60)
+
+
+def preview(args) -> None:
+    """
+    Estimate overall and per-filter pass rates from a random sample.
+
+    JSON Lines inputs are sampled by seeking to random byte offsets, so
+    only the sampled records are read. Other inputs (and mock data) are
+    streamed through a reservoir sample. Duplicates are not removed.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    preview_settings = settings.preview
+    sample_size = args.preview
+    seed = preview_settings.seed
+    start = time.perf_counter()
+
+    weights = None
+    population = None
+    if args.input and all(path.endswith((".jsonl", ".ndjson")) for path in args.input):
+        sample, weights, population = sample_jsonl(args.input, sample_size, seed=seed)
+        if population <= sample_size:
+            # Small pool: read it whole rather than sampling with repeats
+            weights = None
+            population = None
+    if population is None:
+        if args.input:
+            source = chain.from_iterable(load_candidates(path) for path in args.input)
+        else:
+            source = get_mock_candidates()
+        counted = CountingIterator(source)
+        sample = reservoir_sample(counted, sample_size, seed=seed)
+        population = counted.count
+
+    filter_manager = FilterManager()
+    setup_filters(filter_manager)
+    result = preview_pass_rates(
+        filter_manager,
+        sample,
+        weights=weights,
+        population=population,
+        confidence=preview_settings.confidence
     )
+    elapsed = time.perf_counter() - start
 
-    # Add location filter
-    filter_manager.add_filter(
-        LocationFilter(
-            excluded_locations=filter_settings.excluded_locations
+    print("=" * 60)
+    print("       PASS RATE PREVIEW")
+    print("=" * 60)
+    approximate = "~" if weights is not None else ""
+    print(f"  Sample size: {result.sample_size} of {approximate}{round(population)} candidates")
+    print(f"  Confidence: {result.confidence:.0%}  (took {elapsed:.2f}s)")
+    print()
+    print(f"  {'Filter':<24}{'Pass rate':>10}  {'Interval':<17}{'Est. passing':>14}")
+    for rate in result.filters + [result.overall]:
+        estimate, low, high = rate.estimated_count(population)
+        print(
+            f"  {rate.name:<24}{rate.rate:>10.1%}  "
+            f"{f'{rate.low:.1%} - {rate.high:.1%}':<17}"
+            f"{estimate:>14}  ({low} - {high})"
         )
+    print("=" * 60)
+
+
+def open_suppression_list(filter_manager: FilterManager) -> SuppressionList:
+    """Return the suppression list used by a manager's Suppression filter."""
+    return filter_manager.get_filter("Suppression").suppression_list
+
+
+def suppress(args) -> None:
+    """
+    Add entries to the suppression list.
+
+    Text files hold one LinkedIn URL or email per line; JSON/JSONL files
+    hold candidates, which are suppressed by URL and email.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    with create_suppression_list() as suppression_list:
+        for path in args.input:
+            if path.endswith((".json", ".jsonl", ".ndjson")):
+                added = suppression_list.add_candidates(load_candidates(path))
+            else:
+                with open(path, encoding="utf-8") as f:
+                    added = suppression_list.add_keys(
+                        key for key in map(parse_entry, f) if key is not None
+                    )
+            print(f"  {path}: {added} new entries")
+        print(f"Suppression list {suppression_list.path}: {len(suppression_list)} entries")
+
+
+def run_shard(args, index: int, num_shards: int) -> None:
+    """
+    Screen one hash partition of the input and write its output.
+
+    Every shard reads the full input and keeps the candidates whose
+    LinkedIn URL hashes to it. Passed records keep their input position,
+    and statistics are always collected, so `main.py merge` can rebuild
+    the single-node reports.
+
+    Args:
+        args: Parsed command line arguments
+        index: Shard to screen
+        num_shards: Number of shards
+    """
+    filter_manager = FilterManager()
+    setup_filters(filter_manager)
+    screening_stats = ScreeningStats()
+    filter_manager.set_stats(screening_stats)
+
+    # Runs with --no-dedup only: fuzzy duplicates can land in different shards
+    if args.input:
+        selected = list(select_shard_from_files(args.input, index, num_shards))
+    else:
+        selected = list(select_shard(get_mock_candidates(), index, num_shards))
+    candidates = [candidate for _, candidate in selected]
+    print(f"Shard {index}/{num_shards}: {len(candidates)} candidates")
+
+    if args.workers:
+        passed = filter_manager.apply_parallel(candidates, workers=args.workers)
+    else:
+        passed = filter_manager.apply_all(candidates)
+
+    # Map passed candidates back to their input positions
+    passed_ids = {id(candidate) for candidate in passed}
+    summary = ShardSummary(
+        index=index,
+        num_shards=num_shards,
+        run_key=make_run_key(run_key_parts(args, filter_manager, True)),
+        filters=filter_manager.list_filters(),
+        stats=screening_stats.state(),
     )
+    path = write_shard(
+        args.dir or settings.shard.directory,
+        summary,
+        ((position, candidate) for position, candidate in selected if id(candidate) in passed_ids)
+    )
+    print(f"Shard {index}/{num_shards}: {len(passed)} passed, output {path}")
+
 
-    # Add background filter
-    filter_manager.add_filter(
-        BackgroundFilter(
-            preferred_backgrounds=filter_settings.preferred_backgrounds,
-            excluded_backgrounds=filter_settings.excluded_backgrounds
+def merge(args) -> None:
+    """
+    Merge the outputs of all shards into the single-node reports.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    merged = merge_shards(args.dir or settings.shard.directory)
+    screening_stats = merged.stats
+    filtered_candidates = list(merged.passed)
+    print(f"Merged {merged.num_shards} shards")
+    print(f"Total candidates loaded: {screening_stats.total}")
+    if args.verbose:
+        print("\n--- Filter Details ---")
+        for filter_name in merged.filters:
+            rejected_count = screening_stats.rejections.get(filter_name, 0)
+            print(f"  {filter_name}: {rejected_count} rejected first")
+        print()
+    print(f"Candidates after filtering: {len(filtered_candidates)}")
+
+    print("Exporting to Excel...")
+    exporter = ExcelExporter(output_directory=settings.export.output_directory)
+    basic_path = exporter.export(filtered_candidates, filename=settings.export.excel_filename)
+    print(f"  Basic report: {basic_path}")
+    results_file = write_results(
+        results_path(),
+        filtered_candidates,
+        results_meta(screening_stats.total, len(filtered_candidates), merged.filters)
+    )
+    print(f"  Results file: {results_file}")
+    if args.detailed:
+        detailed_path = exporter.export_detailed(
+            filtered_candidates,
+            filename="candidates_detailed.xlsx"
         )
+        print(f"  Detailed report: {detailed_path}")
+    if args.verbose:
+        summary_path = exporter.export_summary(
+            total_candidates=screening_stats.total,
+            filtered_candidates=len(filtered_candidates),
+            filename="filter_summary.xlsx",
+            stats=screening_stats
+        )
+        print(f"  Summary report: {summary_path}")
+
+    print()
+    print("=" * 60)
+    print("       SUMMARY")
+    print("=" * 60)
+    print(f"  Total candidates: {screening_stats.total}")
+    print(f"  Passed filters: {len(filtered_candidates)}")
+    print(f"  Pass rate: {len(filtered_candidates)/max(screening_stats.total, 1)*100:.1f}%")
+    print("=" * 60)
+
+
+def serve(args) -> None:
+    """
+    Load the candidate pool once and answer filter queries until interrupted.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    service_settings = settings.service
+    print("Loading candidates...")
+    service = ScreeningService(
+        load_pool(args),
+        settings.filter,
+        ExcelExporter(output_directory=settings.export.output_directory),
+        page_size=service_settings.page_size,
+        suppression_list=create_suppression_list()
+    )
+    server = ScreeningServer(
+        service,
+        host=args.host or service_settings.host,
+        port=args.port if args.port is not None else service_settings.port,
+        socket_path=args.socket or service_settings.socket_path or None
     )
+    print(f"Indexed {len(service.index)} candidates")
+    print(f"Serving on {server.address} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped.")
 
 
-def display_candidate(candidate: Candidate) -> None:
-    """Display a single candidate's information."""
-    print(candidate)
+def watch(args) -> None:
+    """
+    Filter candidate files as they land in a drop directory.
+
+    Only new or changed files are read, only their new records are
+    filtered, and passing candidates are appended to a running Excel
+    report. Progress is saved per file, so a restart resumes where it
+    stopped. Duplicates are removed across files seen in this session.
+
+    Rows are appended once per polling round, before the files of that
+    round are marked done. Candidates whose LinkedIn URL is already in
+    the report are not appended again, so records read a second time
+    (after a crash between the two steps, or from a rewritten file) do
+    not duplicate rows.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    watch_settings = settings.watch
+    directory = args.dir or watch_settings.input_directory
+    watcher = FolderWatcher(
+        directory,
+        watch_settings.state_path,
+        settle_seconds=0.0 if args.once else watch_settings.settle_seconds
+    )
+    filter_manager = FilterManager()
+    setup_filters(filter_manager)
+    exporter = ExcelExporter(output_directory=settings.export.output_directory)
+    deduplicator = None if args.no_dedup else create_deduplicator()
+    exported = exporter.exported_urls(watch_settings.output_filename)
+
+    print(f"Watching {directory} ({len(watcher.files)} files tracked in {watch_settings.state_path})")
+    try:
+        while True:
+            fresh = []
+            done = []
+            for name in watcher.pending():
+                try:
+                    candidates, state = watcher.read(name)
+                except (ValueError, KeyError) as e:
+                    watcher.mark_failed(name)
+                    print(f"  {name}: skipped, unreadable ({e!r})")
+                    continue
+                if deduplicator:
+                    candidates = list(deduplicator.dedupe(candidates))
+                passed = filter_manager.apply_all(candidates)
+                new_rows = 0
+                for candidate in passed:
+                    if not candidate.linkedin_url or candidate.linkedin_url not in exported:
+                        exported.add(candidate.linkedin_url)
+                        fresh.append(candidate)
+                        new_rows += 1
+                done.append((name, state, len(passed)))
+                skipped = f", {len(passed) - new_rows} already exported" if new_rows < len(passed) else ""
+                print(f"  {name}: {len(candidates)} new, {len(passed)} passed{skipped}")
+            if fresh:
+                exporter.append(fresh, filename=watch_settings.output_filename)
+                if args.suppress_exported:
+                    open_suppression_list(filter_manager).add_candidates(fresh)
+            for name, state, passed_count in done:
+                watcher.mark_done(name, state, passed_count)
+            if args.once:
+                break
+            time.sleep(watch_settings.poll_interval)
+    except KeyboardInterrupt:
+        print("\nStopped.")
 
 
 def main():
@@ -87,18 +764,256 @@ def main():
     parser = argparse.ArgumentParser(
         description="Filter candidates based on specified criteria"
     )
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        choices=["run", "serve", "watch", "suppress", "merge"],
+        default="run",
+        help="run: filter once (default); serve: answer queries over HTTP; "
+             "watch: filter files as they arrive in a directory; "
+             "suppress: add --input entries to the suppression list; "
+             "merge: combine --shard outputs into reports"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
-        help="Show detailed filtering results"
+        help="Show per-filter rejections (each rejected candidate is counted once, "
+             "for the first filter it failed in evaluation order)"
     )
     parser.add_argument(
         "--detailed", "-d",
         action="store_true",
         help="Export detailed Excel report"
     )
+    parser.add_argument(
+        "--profile", "-p",
+        action="store_true",
+        help="Print per-filter and per-stage timings and write them as JSON"
+    )
+    parser.add_argument(
+        "--input", "-i",
+        nargs="+",
+        metavar="FILE",
+        help="Load candidates from JSON/JSONL files instead of mock data"
+    )
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="Skip removing duplicate candidates before filtering"
+    )
+    parser.add_argument(
+        "--top-k", "-k",
+        type=int,
+        metavar="N",
+        help="Keep only the N best-scoring candidates, ranked by score"
+    )
+    parser.add_argument(
+        "--skills",
+        metavar="QUERY",
+        help='Boolean skill query, e.g. "Compliance AND (Mandarin OR Cantonese)"'
+    )
+    parser.add_argument(
+        "--languages",
+        metavar="QUERY",
+        help='Boolean language query, e.g. "English AND Mandarin"'
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse filter verdicts from previous runs (persistent cache)"
+    )
+    parser.add_argument(
+        "--filter-profiles",
+        nargs="*",
+        metavar="NAME",
+        help="Screen against the named filter profiles from settings (all if no names) in one pass"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Filter in N worker processes"
+    )
+    parser.add_argument(
+        "--store",
+        nargs="?",
+        const=settings.store.path,
+        metavar="PATH",
+        help="Screen the SQLite candidate store (default path from settings), "
+             "adding any --input files to it first"
+    )
+    parser.add_argument(
+        "--preview",
+        nargs="?",
+        type=int,
+        const=settings.preview.sample_size,
+        metavar="N",
+        help="Estimate overall and per-filter pass rates from a random sample "
+             f"of N candidates (default {settings.preview.sample_size})"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its last checkpoint"
+    )
+    parser.add_argument(
+        "--suppression",
+        metavar="PATH",
+        help="Suppression list of contacted/rejected candidates (base path of its files)"
+    )
+    parser.add_argument(
+        "--suppress-exported",
+        action="store_true",
+        help="Add exported candidates to the suppression list"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        metavar="N",
+        help="Stop as soon as N candidates have passed"
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Return whatever passed within this many seconds"
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="I/K",
+        help="Screen only shard I of K (0-based, by LinkedIn URL hash) for a later merge"
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Read, filter and export concurrently through bounded queues "
+             "(memory independent of input size; --workers sets filter threads)"
+    )
+    parser.add_argument(
+        "--host",
+        help="serve: interface to listen on"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        help="serve: TCP port to listen on"
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="serve: listen on this Unix socket instead of TCP"
+    )
+    parser.add_argument(
+        "--dir",
+        metavar="DIR",
+        help="watch: directory to monitor; --shard/merge: shard output directory"
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="watch: process pending files once and exit"
+    )
     args = parser.parse_args()
 
+    if args.skills:
+        settings.filter.skill_query = args.skills
+    if args.languages:
+        settings.filter.language_query = args.languages
+    if args.suppression:
+        settings.filter.suppression_list = args.suppression
+    if (args.mode == "suppress" or args.suppress_exported) and not settings.filter.suppression_list:
+        parser.error("no suppression list configured; use --suppression PATH")
+    if args.mode == "suppress" and not args.input:
+        parser.error("suppress needs --input files")
+
+    if args.limit is not None or args.time_budget is not None:
+        if args.top_k is not None or args.filter_profiles is not None or args.resume:
+            parser.error("--limit/--time-budget cannot be combined with --top-k, --filter-profiles or --resume")
+
+    if args.resume and (args.top_k is not None or args.filter_profiles is not None):
+        # Only the plain screening run saves checkpoints
+        parser.error("--resume cannot be combined with --top-k or --filter-profiles")
+
+    if args.store:
+        if (args.cache or args.profile or args.top_k is not None or args.workers
+                or args.detailed or args.resume or args.time_budget is not None):
+            parser.error(
+                "--store cannot be combined with --cache, --profile, --top-k, "
+                "--workers, --detailed, --resume or --time-budget"
+            )
+
+    if args.shard:
+        if not args.no_dedup:
+            # Fuzzy duplicates with different URLs can be split across shards
+            parser.error("--shard requires --no-dedup (deduplication is not shard-safe)")
+        if (args.top_k is not None or args.limit is not None or args.time_budget is not None
+                or args.cache or args.profile or args.resume or args.preview is not None
+                or args.store):
+            parser.error(
+                "--shard cannot be combined with --top-k, --limit, --time-budget, "
+                "--cache, --profile, --resume, --preview or --store"
+            )
+
+    if args.pipeline:
+        if (args.top_k is not None or args.filter_profiles is not None or args.resume
+                or args.limit is not None or args.time_budget is not None
+                or args.cache or args.profile or args.store or args.shard):
+            parser.error(
+                "--pipeline cannot be combined with --top-k, --filter-profiles, --resume, "
+                "--limit, --time-budget, --cache, --profile, --store or --shard"
+            )
+
+    if args.filter_profiles is not None:
+        if (args.cache or args.top_k is not None or args.verbose or args.workers
+                or args.profile or args.detailed or args.store or args.shard
+                or args.preview is not None):
+            parser.error(
+                "--filter-profiles cannot be combined with --cache, --top-k, --verbose, "
+                "--workers, --profile, --detailed, --store, --shard or --preview"
+            )
+
+    unknown_profiles = set(args.filter_profiles or []) - set(settings.profiles)
+    if unknown_profiles:
+        parser.error(
+            f"unknown profiles {sorted(unknown_profiles)}; "
+            f"available: {list(settings.profiles)}"
+        )
+
+    if args.mode == "serve":
+        serve(args)
+        return
+    if args.mode == "watch":
+        watch(args)
+        return
+    if args.mode == "suppress":
+        suppress(args)
+        return
+    if args.mode == "merge":
+        try:
+            merge(args)
+        except ValueError as e:
+            parser.error(str(e))
+        return
+    if args.shard:
+        try:
+            index, num_shards = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+        run_shard(args, index, num_shards)
+        return
+
+    if args.preview is not None:
+        if args.preview <= 0:
+            parser.error("--preview sample size must be positive")
+        preview(args)
+        return
+    if args.store:
+        run_store(args)
+        return
+    if args.pipeline:
+        run_pipelined(args)
+        return
+
     print("=" * 60)
     print("       Applicant Filter System")
     print("=" * 60)
@@ -108,32 +1023,153 @@ def main():
     filter_manager = FilterManager()
     setup_filters(filter_manager)
 
+    profiler = FilterProfiler() if args.profile else None
+    filter_manager.set_profiler(profiler)
+
+    # Streaming statistics for the summary report (no candidate lists kept)
+    screening_stats = ScreeningStats() if args.verbose or args.profile else None
+    filter_manager.set_stats(screening_stats)
+
+    result_cache = None
+    if args.cache:
+        result_cache = ResultCache(
+            settings.cache.path,
+            max_entries=settings.cache.max_entries
+        )
+        filter_manager.set_result_cache(result_cache)
+
+    def stage(name):
+        return profiler.stage(name) if profiler else nullcontext()
+
     print(f"Active filters: {filter_manager.list_filters()}")
     print()
 
-    # Get candidates (using mock data for now)
+    # Get candidates (mock data unless input files are given)
     print("Loading candidates...")
-    candidates = get_mock_candidates()
-    print(f"Total candidates loaded: {len(candidates)}")
+    with stage("load"):
+        if args.input:
+            source = chain.from_iterable(load_candidates(path) for path in args.input)
+        else:
+            source = get_mock_candidates()
+
+        deduplicator = None
+        if not args.no_dedup:
+            deduplicator = create_deduplicator()
+            source = deduplicator.dedupe(source)
+
+        # With a limit or time budget the input is only read as far as needed
+        early_exit = args.limit is not None or args.time_budget is not None
+        if early_exit:
+            candidates = CountingIterator(source)
+        else:
+            candidates = list(source)
+    if early_exit:
+        print("Streaming candidates (stops at the limit / time budget)")
+    else:
+        print(f"Total candidates loaded: {len(candidates)}")
+    if deduplicator and not early_exit:
+        dedup_stats = deduplicator.stats
+        print(
+            f"Duplicates removed: {dedup_stats.exact_duplicates} exact, "
+            f"{dedup_stats.fuzzy_duplicates} fuzzy"
+        )
     print()
 
+    if args.filter_profiles is not None:
+        run_profiles(args, candidates)
+        return
+
+    # Show which search parameters the filters would add to a LinkedIn search
+    if args.verbose and not early_exit:
+        plan = QueryPlanner().plan(filter_manager)
+        saved = plan.count_saved_fetches(candidates)
+        print("--- Search Plan ---")
+        print(f"  Keywords: {plan.keywords}")
+        print(f"  Excluded locations: {plan.excluded_locations}")
+        print(f"  Narrowed server-side: {[f.name for f in plan.partial_filters]}")
+        print(f"  Client-side: {[f.name for f in plan.residual_filters]}")
+        print(f"  Fetches saved: {saved}/{len(candidates)}")
+        print()
+
     # Apply filters
     print("Applying filters...")
-    if args.verbose:
-        results = filter_manager.apply_all_with_details(candidates)
-        filtered_candidates = results['passed']
+    ranked = None
+    checkpoint = None
+    checkpoint_state = None
+    with stage("filter"):
+        if args.top_k is not None:
+            ranked = filter_manager.apply_top_k(candidates, args.top_k, setup_scorer())
+        elif early_exit:
+            if args.workers:
+                filtered_candidates = filter_manager.apply_parallel(
+                    candidates,
+                    workers=args.workers,
+                    limit=args.limit,
+                    time_budget=args.time_budget
+                )
+            else:
+                filtered_candidates = filter_manager.apply_all(
+                    candidates,
+                    limit=args.limit,
+                    time_budget=args.time_budget
+                )
+        else:
+            # Screen in chunks, saving progress so an interrupted run can --resume
+            checkpoint_settings = settings.checkpoint
+            checkpoint = Checkpoint(
+                checkpoint_settings.path,
+                make_run_key(run_key_parts(args, filter_manager, screening_stats is not None)),
+                interval_seconds=checkpoint_settings.interval_seconds
+            )
+            checkpoint_state = checkpoint.load() if args.resume else None
+            if checkpoint_state is None:
+                if args.resume:
+                    print("No checkpoint for this input and settings; starting from the beginning.")
+                checkpoint_state = CheckpointState(checkpoint.run_key)
+            else:
+                print(
+                    f"Resuming from checkpoint: {checkpoint_state.screened}/{len(candidates)} "
+                    f"screened, reports done: {checkpoint_state.exported or 'none'}"
+                )
+                if checkpoint_state.stats is not None:
+                    screening_stats = ScreeningStats.from_state(checkpoint_state.stats)
+                    filter_manager.set_stats(screening_stats)
+            filtered_candidates = screen_with_checkpoints(
+                filter_manager,
+                candidates,
+                checkpoint,
+                checkpoint_state,
+                chunk_size=checkpoint_settings.chunk_size,
+                workers=args.workers
+            )
+
+    if ranked is not None:
+        filtered_candidates = [candidate for candidate, _ in ranked]
+
+    if early_exit:
+        total_candidates = candidates.count
+        print(f"Candidates read: {total_candidates}")
+        if deduplicator:
+            dedup_stats = deduplicator.stats
+            print(
+                f"Duplicates removed: {dedup_stats.exact_duplicates} exact, "
+                f"{dedup_stats.fuzzy_duplicates} fuzzy"
+            )
+    else:
+        total_candidates = len(candidates)
 
+    if args.verbose:
         print("\n--- Filter Details ---")
         for filter_name in filter_manager.list_filters():
-            failed_key = f"failed_{filter_name}"
-            failed_count = len(results.get(failed_key, []))
-            print(f"  {filter_name}: {failed_count} failed")
+            rejected_count = screening_stats.rejections.get(filter_name, 0)
+            print(f"  {filter_name}: {rejected_count} rejected first")
         print()
-    else:
-        filtered_candidates = filter_manager.apply_all(candidates)
-        results = None
 
     print(f"Candidates after filtering: {len(filtered_candidates)}")
+    if result_cache:
+        cache_stats = result_cache.stats
+        print(f"Result cache: {cache_stats.hits} hits, {cache_stats.misses} misses")
+        result_cache.close()
     print()
 
     # Display filtered candidates
@@ -141,7 +1177,12 @@ def main():
     print("       FILTERED CANDIDATES")
     print("=" * 60)
 
-    if filtered_candidates:
+    if ranked:
+        for rank, (candidate, score) in enumerate(ranked, 1):
+            print(f"#{rank}  score: {score:.3f}")
+            display_candidate(candidate)
+            print()
+    elif filtered_candidates:
         for candidate in filtered_candidates:
             display_candidate(candidate)
             print()
@@ -151,42 +1192,87 @@ def main():
 
     # Export to Excel
     print("Exporting to Excel...")
-    exporter = ExcelExporter(output_directory=settings.export.output_directory)
+    with stage("export"):
+        exporter = ExcelExporter(output_directory=settings.export.output_directory)
 
-    # Export basic report
-    basic_path = exporter.export(
-        filtered_candidates,
-        filename=settings.export.excel_filename
-    )
-    print(f"  Basic report: {basic_path}")
+        def export_report(label, write):
+            # Reports written before an interruption are not written again
+            if checkpoint is not None and label in checkpoint_state.exported:
+                print(f"  {label}: already written (from checkpoint)")
+                return
+            print(f"  {label}: {write()}")
+            if checkpoint is not None:
+                checkpoint_state.exported.append(label)
+                checkpoint.save(checkpoint_state)
 
-    # Export detailed report if requested
-    if args.detailed:
-        detailed_path = exporter.export_detailed(
+        # Export basic report
+        export_report("Basic report", lambda: exporter.export(
             filtered_candidates,
-            filename="candidates_detailed.xlsx"
-        )
-        print(f"  Detailed report: {detailed_path}")
+            filename=settings.export.excel_filename
+        ))
 
-    # Export summary if verbose
-    if args.verbose and results:
-        summary_path = exporter.export_summary(
-            total_candidates=len(candidates),
-            filtered_candidates=len(filtered_candidates),
-            filter_details=results,
-            filename="filter_summary.xlsx"
+        # Indexed shortlist for scripts/display_candidates.sh
+        export_report("Results file", lambda: write_results(
+            results_path(),
+            filtered_candidates,
+            results_meta(total_candidates, len(filtered_candidates), filter_manager.list_filters())
+        ))
+
+        # Export ranked report if ranking was requested
+        if ranked is not None:
+            export_report("Ranked report", lambda: exporter.export_ranked(
+                ranked,
+                filename="candidates_ranked.xlsx"
+            ))
+
+        # Export detailed report if requested
+        if args.detailed:
+            export_report("Detailed report", lambda: exporter.export_detailed(
+                filtered_candidates,
+                filename="candidates_detailed.xlsx"
+            ))
+
+        # Suppress exported candidates so later runs never shortlist them again
+        if args.suppress_exported:
+            export_report("Suppression list", lambda: "{} new entries".format(
+                open_suppression_list(filter_manager).add_candidates(filtered_candidates)
+            ))
+
+    # Export summary if verbose or profiling; written after the export
+    # stage has closed so its Performance sheet includes the export time
+    if args.verbose or args.profile:
+        with stage("summary"):
+            export_report("Summary report", lambda: exporter.export_summary(
+                total_candidates=total_candidates,
+                filtered_candidates=len(filtered_candidates),
+                filename="filter_summary.xlsx",
+                performance=profiler.to_dict() if profiler else None,
+                stats=screening_stats
+            ))
+
+    if profiler:
+        print()
+        print("=" * 60)
+        print("       PROFILE")
+        print("=" * 60)
+        print(profiler.format_table())
+        profile_path = profiler.write_json(
+            os.path.join(settings.export.output_directory, "profile.json")
         )
-        print(f"  Summary report: {summary_path}")
+        print(f"  Profile data: {profile_path}")
 
     print()
     print("=" * 60)
     print("       SUMMARY")
     print("=" * 60)
-    print(f"  Total candidates: {len(candidates)}")
+    print(f"  Total candidates: {total_candidates}")
     print(f"  Passed filters: {len(filtered_candidates)}")
-    print(f"  Pass rate: {len(filtered_candidates)/len(candidates)*100:.1f}%")
+    print(f"  Pass rate: {len(filtered_candidates)/max(total_candidates, 1)*100:.1f}%")
     print("=" * 60)
 
+    if checkpoint is not None:
+        checkpoint.remove()
+
 
 if __name__ == "__main__":
     main()
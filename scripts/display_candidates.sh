@@ -2,6 +2,18 @@
 
 # Candidate Display Script
 # Displays filtered candidate information in a formatted view
+#
+# Reads the indexed results file written by main.py (no re-filtering).
+#
+# Usage:
+#   ./scripts/display_candidates.sh [--page N] [--page-size N]
+#                                   [--fields FIELD,...] [--file PATH]
+#
+#   --page       Page to show, starting at 1 (default 1)
+#   --page-size  Candidates per page (default 20)
+#   --fields     Show only these fields as a table, e.g. name,age,location
+#   --file       Results file, relative to the current directory
+#                (default output/candidates.jsonl in the project)
 
 # Colors for terminal output
 RED='\033[0;31m'
@@ -15,16 +27,46 @@ BOLD='\033[1m'
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_DIR="$(dirname "$SCRIPT_DIR")"
 
+PAGE=1
+PAGE_SIZE=20
+FIELDS=""
+RESULTS_FILE="$PROJECT_DIR/output/candidates.jsonl"
+
+# Parse arguments
+while [ $# -gt 0 ]; do
+    case "$1" in
+        --page) PAGE="$2"; shift 2 ;;
+        --page-size) PAGE_SIZE="$2"; shift 2 ;;
+        --fields) FIELDS="$2"; shift 2 ;;
+        --file) RESULTS_FILE="$2"; shift 2 ;;
+        -h|--help) sed -n '3,16p' "${BASH_SOURCE[0]}" | sed 's/^# \{0,1\}//'; exit 0 ;;
+        *) echo -e "${RED}Unknown option: $1${NC}"; exit 1 ;;
+    esac
+done
+
+if ! [[ "$PAGE" =~ ^[1-9][0-9]*$ && "$PAGE_SIZE" =~ ^[1-9][0-9]*$ ]]; then
+    echo -e "${RED}Error: --page and --page-size must be positive integers${NC}"
+    exit 1
+fi
+
 # Check if Python is available
 if ! command -v python3 &> /dev/null; then
     echo -e "${RED}Error: Python3 is not installed${NC}"
     exit 1
 fi
 
-# Check if openpyxl is installed
-if ! python3 -c "import openpyxl" 2>/dev/null; then
-    echo -e "${YELLOW}Installing required dependencies...${NC}"
-    pip3 install openpyxl
+# Resolve --file against the caller's directory before changing directory
+case "$RESULTS_FILE" in
+    /*) ;;
+    *) RESULTS_FILE="$PWD/$RESULTS_FILE" ;;
+esac
+
+# Change to project directory
+cd "$PROJECT_DIR"
+
+if [ ! -f "$RESULTS_FILE" ] || [ ! -f "$RESULTS_FILE.idx" ]; then
+    echo -e "${YELLOW}No results file at $RESULTS_FILE; run python3 main.py first.${NC}"
+    exit 1
 fi
 
 echo -e "${BLUE}=========================================${NC}"
@@ -32,41 +74,73 @@ echo -e "${BOLD}    Applicant Filter - Candidate View${NC}"
 echo -e "${BLUE}=========================================${NC}"
 echo ""
 
-# Change to project directory and run Python
-cd "$PROJECT_DIR"
-
-python3 << 'PYTHON_SCRIPT'
+# Load only the results reader (standard library), not the whole src package
+python3 - "$RESULTS_FILE" "$PAGE" "$PAGE_SIZE" "$FIELDS" << 'PYTHON_SCRIPT'
+import importlib.util
 import sys
-import os
 
-from config.settings import settings
-from src.filter_manager import FilterManager
-from src.filters import AgeFilter, ExperienceFilter, LocationFilter, BackgroundFilter
-from src.mock_data import get_mock_candidates
+spec = importlib.util.spec_from_file_location("results_file", "src/results_file.py")
+results_file = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(results_file)
+ResultsFile = results_file.ResultsFile
+
+path, page, page_size, fields = sys.argv[1], int(sys.argv[2]), int(sys.argv[3]), sys.argv[4]
+
+try:
+    results = ResultsFile(path)
+except ValueError as e:
+    print(f"Error: {e}; run python3 main.py again.")
+    sys.exit(1)
 
-# Setup filters
-filter_manager = FilterManager()
-filter_settings = settings.filter
+with results:
+    start = (page - 1) * page_size
+    rows = results.page(start, page_size)
+    pages = max(1, -(-len(results) // page_size))
+    meta = results.meta
 
-filter_manager.add_filter(AgeFilter(filter_settings.min_age, filter_settings.max_age))
-filter_manager.add_filter(ExperienceFilter(filter_settings.min_experience_years, filter_settings.max_experience_years))
-filter_manager.add_filter(LocationFilter(filter_settings.excluded_locations))
-filter_manager.add_filter(BackgroundFilter(filter_settings.preferred_backgrounds, filter_settings.excluded_backgrounds))
+    if fields:
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in names if rows and name not in rows[0]]
+        if unknown:
+            print(f"Unknown fields: {', '.join(unknown)}")
+            print(f"Available: {', '.join(rows[0])}")
+            sys.exit(1)
 
-# Get and filter candidates
-candidates = get_mock_candidates()
-filtered = filter_manager.apply_all(candidates)
+        def text(value):
+            return ", ".join(map(str, value)) if isinstance(value, list) else str(value if value is not None else "")
 
-# Display each candidate
-for candidate in filtered:
-    print(candidate)
-    print()
+        table = [[text(row[name]) for name in names] for row in rows]
+        widths = [min(40, max([len(name)] + [len(cells[i]) for cells in table])) for i, name in enumerate(names)]
+        print("  ".join(name.ljust(width) for name, width in zip(names, widths)))
+        print("  ".join("-" * width for width in widths))
+        for cells in table:
+            print("  ".join(cell[:width].ljust(width) for cell, width in zip(cells, widths)))
+    else:
+        # Same layout as Candidate.__str__
+        for row in rows:
+            print("=========================================")
+            print(f"姓名: {row['name']}")
+            print(f"职位: {row['current_position']}")
+            print(f"经验: {row['experience_years']}年")
+            print(f"地点: {row['location']}")
+            print(f"LinkedIn: {row['linkedin_url']}")
+            print("=========================================")
+            print()
 
-# Summary
-print(f"Total filtered candidates: {len(filtered)}/{len(candidates)}")
+    if rows:
+        print(f"Page {page}/{pages}: candidates {start + 1}-{start + len(rows)} of {len(results)}")
+    else:
+        print(f"No candidates on page {page} (pages: {pages}, candidates: {len(results)})")
+    if meta:
+        print(
+            f"Total filtered candidates: {meta.get('passed', len(results))}/{meta.get('total', '?')}"
+            f" (generated {meta.get('generated', '?')})"
+        )
 PYTHON_SCRIPT
+STATUS=$?
 
 echo ""
 echo -e "${BLUE}=========================================${NC}"
-echo -e "${GREEN}Export Location: output/candidates.xlsx${NC}"
+echo -e "${GREEN}Results file: $RESULTS_FILE${NC}"
 echo -e "${BLUE}=========================================${NC}"
+exit $STATUS
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Sourcing Load Test
+
+Drives LinkedInClient.search_candidates() and get_profile() against a
+local MockLinkedInServer and reports throughput, latency percentiles and
+retry counts.
+
+Usage:
+    python scripts/load_test.py [--profiles N] [--workers N] [--requests N]
+                                [--latency S] [--error-rate P] [--rate-limit RPS]
+                                [--json PATH]
+"""
+
+import sys
+import os
+import json
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from src.filter_factory import create_filter_manager
+from src.linkedin_client import LinkedInClient
+from src.mock_linkedin_server import MockLinkedInServer, synthetic_profiles
+from src.query_planner import QueryPlanner
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of values.
+
+    Args:
+        values: Sample values
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The percentile value (0.0 for an empty list)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def run_load_test(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run the load test and collect results.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Dictionary of results per operation
+    """
+    profiles = synthetic_profiles(args.profiles, seed=args.seed)
+    urls = [p["publicProfileUrl"] for p in profiles]
+    rng = random.Random(args.seed)
+
+    with MockLinkedInServer(
+        profiles,
+        latency=args.latency,
+        latency_jitter=args.latency,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed
+    ) as server:
+        client = LinkedInClient(base_url=server.base_url, max_retries=args.max_retries)
+        # Search the way a screening run would: narrowed by the configured filters
+        filter_manager = create_filter_manager(settings.filter)
+        search_params = QueryPlanner().plan(filter_manager).search_params()
+
+        def search(_):
+            client.search_candidates(**search_params, limit=args.search_limit)
+
+        def profile(_):
+            client.get_profile(rng.choice(urls))
+
+        results = {}
+        for name, operation in (("search_candidates", search), ("get_profile", profile)):
+            latencies = []
+            retries_before = client.retries
+            requests_before = server.request_count
+
+            def timed(i):
+                start = time.perf_counter()
+                operation(i)
+                latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                list(pool.map(timed, range(args.requests)))
+            elapsed = time.perf_counter() - start
+
+            results[name] = {
+                "operations": args.requests,
+                "http_requests": server.request_count - requests_before,
+                "elapsed_s": elapsed,
+                "throughput_ops": args.requests / elapsed if elapsed else 0.0,
+                "p50_ms": percentile(latencies, 50) * 1000,
+                "p99_ms": percentile(latencies, 99) * 1000,
+                "retries": client.retries - retries_before,
+            }
+
+        results["server"] = {
+            "throttled": server.throttled_count,
+            "errors": server.error_count,
+        }
+    return results
+
+
+def main():
+    """Main entry point for the load test."""
+    parser = argparse.ArgumentParser(description="Load-test the LinkedIn sourcing path")
+    parser.add_argument("--profiles", type=int, default=1000, help="Synthetic profiles to serve")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent client threads")
+    parser.add_argument("--requests", type=int, default=200, help="Operations per endpoint")
+    parser.add_argument("--search-limit", type=int, default=100, help="Hits per search")
+    parser.add_argument("--latency", type=float, default=0.005, help="Server latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Server 503 probability")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Server requests/second")
+    parser.add_argument("--max-retries", type=int, default=3, help="Client retries")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = run_load_test(args)
+
+    print(f"{'Operation':<20}{'Ops':>7}{'HTTP':>8}{'Ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'Retries':>9}")
+    for name in ("search_candidates", "get_profile"):
+        r = results[name]
+        print(
+            f"{name:<20}{r['operations']:>7}{r['http_requests']:>8}"
+            f"{r['throughput_ops']:>10.1f}{r['p50_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['retries']:>9}"
+        )
+    print(f"Server: {results['server']['throttled']} throttled, {results['server']['errors']} errors")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
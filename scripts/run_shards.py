@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Local Sharded Run
+
+Runs a partitioned screen on this machine: starts K `main.py --shard i/K`
+processes in parallel, then `main.py merge` to build the usual reports.
+The same commands can be spread over K machines sharing the output
+directory.
+
+Usage:
+    python scripts/run_shards.py --shards K [--dir DIR] [main.py options ...]
+
+Example:
+    python scripts/run_shards.py --shards 4 --input pool.jsonl --no-dedup --verbose
+"""
+
+import sys
+import os
+import argparse
+import glob
+import subprocess
+import time
+
+# Add project root to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config.settings import settings
+
+MAIN = os.path.join(ROOT, "main.py")
+
+# main.py options that only affect reports, so they are given to the merge step
+MERGE_OPTIONS = {"--verbose", "-v", "--detailed", "-d"}
+
+
+def main() -> int:
+    """Run all shards, then merge them."""
+    parser = argparse.ArgumentParser(
+        description="Screen K hash partitions in parallel processes and merge the results"
+    )
+    parser.add_argument("--shards", type=int, required=True, metavar="K", help="Number of shards")
+    parser.add_argument("--dir", default=settings.shard.directory, help="Shard output directory")
+    args, main_options = parser.parse_known_args()
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+
+    shard_options = [option for option in main_options if option not in MERGE_OPTIONS]
+    merge_options = [option for option in main_options if option in MERGE_OPTIONS]
+    if "--no-dedup" not in main_options:
+        parser.error("shard runs require --no-dedup (deduplication is not shard-safe)")
+
+    # Outputs of earlier runs must not be merged into this one
+    for path in glob.glob(os.path.join(args.dir, "shard-*-of-*.json*")):
+        os.remove(path)
+
+    start = time.perf_counter()
+    processes = [
+        subprocess.Popen(
+            [sys.executable, MAIN, "--shard", f"{index}/{args.shards}", "--dir", args.dir] + shard_options
+        )
+        for index in range(args.shards)
+    ]
+    failed = [index for index, process in enumerate(processes) if process.wait() != 0]
+    if failed:
+        print(f"Shards {failed} failed; not merging", file=sys.stderr)
+        return 1
+    print(f"All {args.shards} shards done in {time.perf_counter() - start:.1f}s")
+
+    return subprocess.call([sys.executable, MAIN, "merge", "--dir", args.dir] + merge_options)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
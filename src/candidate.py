@@ -1,7 +1,20 @@
 """Candidate data model."""
 
+import hashlib
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Callable, List, Optional
+
+
+# Fields that are only available from a full profile fetch.
+# Everything else is returned by a LinkedIn search and is cheap to screen on.
+DETAIL_FIELDS = (
+    "education_background",
+    "work_background",
+    "skills",
+    "languages",
+    "email",
+    "phone",
+)
 
 
 @dataclass
@@ -50,6 +63,33 @@ class Candidate:
         all_backgrounds = self.education_background + self.work_background
         return any(bg.lower() in countries_lower for bg in all_backgrounds)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Candidate":
+        """
+        Create a candidate from its dictionary representation.
+
+        Args:
+            data: Dictionary as produced by to_dict()
+
+        Returns:
+            Candidate instance
+        """
+        return cls(
+            name=data["name"],
+            age=data["age"],
+            experience_years=data["experience_years"],
+            location=data["location"],
+            nationality=data["nationality"],
+            education_background=list(data.get("education_background", [])),
+            work_background=list(data.get("work_background", [])),
+            linkedin_url=data["linkedin_url"],
+            current_position=data["current_position"],
+            skills=list(data.get("skills", [])),
+            languages=list(data.get("languages", [])),
+            email=data.get("email"),
+            phone=data.get("phone")
+        )
+
     def to_dict(self) -> dict:
         """Convert candidate to dictionary representation."""
         return {
@@ -68,6 +108,16 @@ class Candidate:
             "phone": self.phone
         }
 
+    def fingerprint(self) -> str:
+        """
+        Compute a stable content fingerprint of the candidate.
+
+        Returns:
+            Hex digest that changes whenever any field changes
+        """
+        payload = repr(tuple(self.to_dict().values()))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
     def __str__(self) -> str:
         """String representation for display."""
         return (
@@ -79,3 +129,70 @@ class Candidate:
             f"LinkedIn: {self.linkedin_url}\n"
             f"========================================="
         )
+
+
+class LazyCandidate(Candidate):
+    """
+    A candidate built from a search result whose detail fields are lazy.
+
+    Summary fields (name, age, experience, location, nationality, URL,
+    position) are set up front. The fields in DETAIL_FIELDS are fetched
+    through the loader the first time any of them is accessed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        age: int,
+        experience_years: float,
+        location: str,
+        nationality: str,
+        linkedin_url: str,
+        current_position: str,
+        loader: Callable[[str], Optional[Candidate]]
+    ):
+        """
+        Initialize a lightweight candidate.
+
+        Args:
+            name: Full name of the candidate
+            age: Age in years
+            experience_years: Years of relevant work experience
+            location: Current location (city)
+            nationality: Nationality of the candidate
+            linkedin_url: LinkedIn profile URL
+            current_position: Current or most recent job title
+            loader: Callable returning the full profile for a LinkedIn URL
+        """
+        self.name = name
+        self.age = age
+        self.experience_years = experience_years
+        self.location = location
+        self.nationality = nationality
+        self.linkedin_url = linkedin_url
+        self.current_position = current_position
+        self._loader = loader
+
+    @property
+    def is_hydrated(self) -> bool:
+        """Whether the detail fields have been fetched."""
+        return "skills" in self.__dict__
+
+    def __getattr__(self, name: str):
+        """Fetch the full profile on first access to a detail field."""
+        if name not in DETAIL_FIELDS or "_loader" not in self.__dict__:
+            raise AttributeError(name)
+        self._hydrate()
+        return self.__dict__[name]
+
+    def _hydrate(self) -> None:
+        """Copy detail fields from the full profile onto this candidate."""
+        profile = self._loader(self.linkedin_url)
+        for detail in DETAIL_FIELDS:
+            if profile is not None:
+                value = getattr(profile, detail)
+            elif detail in ("email", "phone"):
+                value = None
+            else:
+                value = []
+            self.__dict__[detail] = value
@@ -0,0 +1,221 @@
+"""Columnar bitmap index that answers filter queries over a fixed candidate pool."""
+
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, Hashable, Iterable, List, Sequence
+
+from .candidate import Candidate
+from .filters import (
+    BaseFilter,
+    AgeFilter,
+    ExperienceFilter,
+    LocationFilter,
+    BackgroundFilter,
+    SkillFilter,
+    LanguageFilter,
+    PositionFilter,
+    AndFilter,
+    OrFilter,
+    NotFilter
+)
+from .filters.position_filter import normalize_title
+from .location_normalizer import LocationNormalizer, default_normalizer
+from .skill_index import SkillIndex, bitmap_positions, parse_skill_query, positions_to_bitmap
+
+
+def _value_bitmaps(values: Iterable[Hashable], size: int) -> Dict[Hashable, int]:
+    """Build value -> bitmap of the positions holding that value."""
+    postings: Dict[Hashable, List[int]] = {}
+    for position, value in enumerate(values):
+        postings.setdefault(value, []).append(position)
+    return {value: positions_to_bitmap(positions, size) for value, positions in postings.items()}
+
+
+def _union(bitmaps: Iterable[int]) -> int:
+    """OR together a collection of bitmaps."""
+    bits = 0
+    for bitmap in bitmaps:
+        bits |= bitmap
+    return bits
+
+
+class CandidateIndex:
+    """
+    Bitmap index over a candidate pool, built once and queried many times.
+
+    Every filterable field is stored as value -> bitmap of candidate
+    positions (ages, experience, canonical location, background countries,
+    titles, skills and languages). A filter is answered by combining bitmaps with
+    &, | and ~ instead of calling apply() on every candidate, so a query
+    costs O(distinct values x pool size / 64) word operations.
+
+    Leaf filter results are kept in a small LRU cache keyed by the filter's
+    cache_key, so queries that share criteria reuse each other's work.
+    Only the built-in filter classes are answered from bitmaps; subclasses
+    and custom filters fall back to a full scan with apply().
+
+    The index is read-only after construction and safe to query from
+    multiple threads.
+    """
+
+    def __init__(
+        self,
+        candidates: Sequence[Candidate],
+        normalizer: LocationNormalizer = None,
+        cache_size: int = 256
+    ):
+        """
+        Build the index.
+
+        Args:
+            candidates: Candidate pool; positions are their indices
+            normalizer: Location normalizer (defaults to the shared one)
+            cache_size: Number of leaf filter bitmaps to memoize
+        """
+        if normalizer is None:
+            normalizer = default_normalizer
+        size = len(candidates)
+        self.candidates = candidates
+        self.normalizer = normalizer
+        self.all_bits = (1 << size) - 1
+        self.cache_size = cache_size
+
+        self._ages = _value_bitmaps((c.age for c in candidates), size)
+        self._age_values = sorted(self._ages)
+        self._experience = _value_bitmaps((c.experience_years for c in candidates), size)
+        self._experience_values = sorted(self._experience)
+        self._locations = _value_bitmaps(
+            (normalizer.normalize(c.location) for c in candidates), size
+        )
+        self._titles = _value_bitmaps(
+            (normalize_title(c.current_position) for c in candidates), size
+        )
+
+        backgrounds: Dict[str, List[int]] = {}
+        for position, candidate in enumerate(candidates):
+            for country in {bg.lower() for bg in candidate.education_background + candidate.work_background}:
+                backgrounds.setdefault(country, []).append(position)
+        self._backgrounds = {
+            country: positions_to_bitmap(positions, size)
+            for country, positions in backgrounds.items()
+        }
+
+        self._skill_indexes = {
+            "skills": SkillIndex(candidates, field="skills"),
+            "languages": SkillIndex(candidates, field="languages"),
+        }
+
+        self._cache: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of indexed candidates."""
+        return len(self.candidates)
+
+    def query(self, filters: Iterable[BaseFilter]) -> int:
+        """
+        Answer the conjunction of some filters.
+
+        Example:
+            bits = index.query(filter_manager.as_filter().children)
+
+        Args:
+            filters: Filters every result must pass
+
+        Returns:
+            Bitmap of matching candidate positions
+        """
+        bits = self.all_bits
+        for filter_instance in filters:
+            bits &= self.bits_for(filter_instance)
+            if not bits:
+                break
+        return bits
+
+    def bits_for(self, filter_instance: BaseFilter) -> int:
+        """
+        Get the bitmap of candidates passing a single filter or expression.
+
+        Args:
+            filter_instance: Filter, or And/Or/Not expression
+
+        Returns:
+            Bitmap of matching candidate positions
+        """
+        if isinstance(filter_instance, AndFilter):
+            return self.query(filter_instance.children)
+        if isinstance(filter_instance, OrFilter):
+            return _union(self.bits_for(child) for child in filter_instance.children)
+        if isinstance(filter_instance, NotFilter):
+            return self.all_bits & ~self.bits_for(filter_instance.children[0])
+
+        key = filter_instance.cache_key
+        with self._lock:
+            bits = self._cache.get(key)
+            if bits is not None:
+                self._cache.move_to_end(key)
+                return bits
+
+        bits = self._compute_leaf(filter_instance)
+        with self._lock:
+            self._cache[key] = bits
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return bits
+
+    def candidates_for(self, bits: int, offset: int = 0, limit: int = None) -> List[Candidate]:
+        """
+        Get matching candidates in pool order.
+
+        Args:
+            bits: Bitmap returned by query() or bits_for()
+            offset: Number of matches to skip
+            limit: Maximum number of candidates to return (None = all)
+
+        Returns:
+            List of candidates
+        """
+        stop = None if limit is None else offset + limit
+        return [self.candidates[p] for p in islice(bitmap_positions(bits), offset, stop)]
+
+    def _compute_leaf(self, filter_instance: BaseFilter) -> int:
+        """Answer a leaf filter from the column bitmaps (or by scanning)."""
+        if type(filter_instance) is AgeFilter:
+            return self._range(
+                self._ages, self._age_values,
+                filter_instance.min_age, filter_instance.max_age
+            )
+        if type(filter_instance) is ExperienceFilter:
+            return self._range(
+                self._experience, self._experience_values,
+                filter_instance.min_years, filter_instance.max_years
+            )
+        if type(filter_instance) is LocationFilter and filter_instance.normalizer is self.normalizer:
+            excluded = {self.normalizer.normalize(loc) for loc in filter_instance.excluded_locations}
+            return self.all_bits & ~_union(self._locations.get(loc, 0) for loc in excluded)
+        if type(filter_instance) is BackgroundFilter:
+            excluded = _union(self._backgrounds.get(bg, 0) for bg in set(filter_instance.excluded_backgrounds))
+            preferred = _union(self._backgrounds.get(bg, 0) for bg in set(filter_instance.preferred_backgrounds))
+            return preferred & ~excluded
+        if type(filter_instance) is PositionFilter:
+            return _union(
+                bits for title, bits in self._titles.items()
+                if any(position in title for position in filter_instance.positions)
+            )
+        if type(filter_instance) in (SkillFilter, LanguageFilter):
+            return self._skill_indexes[filter_instance.field].query(parse_skill_query(filter_instance.query))
+
+        return positions_to_bitmap(
+            [p for p, c in enumerate(self.candidates) if filter_instance.apply(c)],
+            len(self.candidates)
+        )
+
+    @staticmethod
+    def _range(bitmaps: Dict[Hashable, int], values: List, low, high) -> int:
+        """OR the bitmaps of every value within [low, high]."""
+        return _union(
+            bitmaps[value]
+            for value in values[bisect_left(values, low):bisect_right(values, high)]
+        )
@@ -0,0 +1,213 @@
+"""SQLite-backed persistent candidate store."""
+
+import json
+import os
+import sqlite3
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional
+
+from .candidate import Candidate
+from .location_normalizer import default_normalizer
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    linkedin_url TEXT NOT NULL UNIQUE,
+    age INTEGER NOT NULL,
+    experience_years REAL NOT NULL,
+    location TEXT NOT NULL,
+    location_id TEXT NOT NULL,
+    nationality TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS candidates_age ON candidates (age);
+CREATE INDEX IF NOT EXISTS candidates_experience ON candidates (experience_years);
+CREATE INDEX IF NOT EXISTS candidates_location ON candidates (location_id);
+CREATE INDEX IF NOT EXISTS candidates_nationality ON candidates (nationality);
+
+CREATE TABLE IF NOT EXISTS backgrounds (
+    country TEXT NOT NULL,
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id),
+    kind TEXT NOT NULL,
+    PRIMARY KEY (country, candidate_id, kind)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS backgrounds_candidate ON backgrounds (candidate_id);
+"""
+
+
+def _store_key(candidate: Candidate) -> str:
+    """
+    Key a candidate is stored under.
+
+    Candidates without a LinkedIn URL are keyed by their content, so they
+    don't all collapse into one row and re-adding the same record is
+    still a no-op.
+    """
+    if candidate.linkedin_url:
+        return candidate.linkedin_url
+    return "fingerprint:" + candidate.fingerprint()
+
+
+class CandidateStore:
+    """
+    Persistent candidate pool in SQLite.
+
+    Candidates are keyed by LinkedIn URL; adding a candidate that is already
+    stored replaces it. Candidates without a URL are keyed by their content
+    fingerprint (identical records are stored once). The screened columns (age, experience_years,
+    canonical location id, nationality) are indexed, and education/work
+    countries are normalized into a separate backgrounds table, so
+    FilterManager.to_sql() predicates run as index lookups. The full record
+    is kept as JSON.
+
+    Usage:
+        with CandidateStore("output/candidates.sqlite") as store:
+            store.add_many(load_candidates("pool.jsonl"))
+            passed = filter_manager.apply_store(store)
+    """
+
+    def __init__(self, path: str, batch_size: int = 5000):
+        """
+        Open (or create) the store.
+
+        Args:
+            path: SQLite database file
+            batch_size: Candidates written per transaction by add_many()
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.batch_size = batch_size
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def add_many(self, candidates: Iterable[Candidate]) -> int:
+        """
+        Insert or replace candidates, one transaction per batch.
+
+        Args:
+            candidates: Candidates to store (any iterable)
+
+        Returns:
+            Number of candidates written
+        """
+        count = 0
+        iterator = iter(candidates)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                break
+            with self._conn:
+                self._write_batch(batch)
+            count += len(batch)
+        return count
+
+    def add(self, candidate: Candidate) -> None:
+        """Insert or replace a single candidate."""
+        self.add_many([candidate])
+
+    def query(self, where: str = "1", params: Optional[List[Any]] = None) -> Iterator[Candidate]:
+        """
+        Stream the candidates matching a SQL predicate.
+
+        Args:
+            where: SQL boolean expression over the candidates table
+                (e.g. from FilterManager.to_sql())
+            params: Parameters bound to the expression
+
+        Yields:
+            Matching candidates in insertion order
+        """
+        cursor = self._conn.execute(
+            f"SELECT data FROM candidates WHERE {where} ORDER BY id", params or []
+        )
+        for (data,) in cursor:
+            yield Candidate.from_dict(json.loads(data))
+
+    def count(self, where: str = "1", params: Optional[List[Any]] = None) -> int:
+        """
+        Count the candidates matching a SQL predicate.
+
+        Args:
+            where: SQL boolean expression over the candidates table
+            params: Parameters bound to the expression
+
+        Returns:
+            Number of matching candidates
+        """
+        return self._conn.execute(
+            f"SELECT COUNT(*) FROM candidates WHERE {where}", params or []
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored candidates."""
+        return self.count()
+
+    def __iter__(self) -> Iterator[Candidate]:
+        """Stream every stored candidate."""
+        return self.query()
+
+    def __enter__(self) -> "CandidateStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write_batch(self, batch: List[Candidate]) -> None:
+        """Upsert one batch of candidates and their backgrounds."""
+        self._conn.executemany(
+            "INSERT INTO candidates"
+            " (linkedin_url, age, experience_years, location, location_id, nationality, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (linkedin_url) DO UPDATE SET"
+            " age = excluded.age, experience_years = excluded.experience_years,"
+            " location = excluded.location, location_id = excluded.location_id,"
+            " nationality = excluded.nationality, data = excluded.data",
+            [
+                (
+                    _store_key(candidate),
+                    candidate.age,
+                    candidate.experience_years,
+                    candidate.location,
+                    default_normalizer.normalize(candidate.location),
+                    candidate.nationality,
+                    json.dumps(candidate.to_dict(), ensure_ascii=False),
+                )
+                for candidate in batch
+            ]
+        )
+
+        keys = [_store_key(candidate) for candidate in batch]
+        ids = {}
+        for start in range(0, len(keys), 900):
+            chunk = keys[start:start + 900]
+            ids.update(self._conn.execute(
+                f"SELECT linkedin_url, id FROM candidates"
+                f" WHERE linkedin_url IN ({','.join('?' * len(chunk))})",
+                chunk
+            ))
+
+        self._conn.executemany(
+            "DELETE FROM backgrounds WHERE candidate_id = ?",
+            [(candidate_id,) for candidate_id in ids.values()]
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO backgrounds (country, candidate_id, kind) VALUES (?, ?, ?)",
+            [
+                (country.lower(), ids[key], kind)
+                for candidate, key in zip(batch, keys)
+                for kind, countries in (
+                    ("education", candidate.education_background),
+                    ("work", candidate.work_background),
+                )
+                for country in countries
+            ]
+        )
@@ -0,0 +1,209 @@
+"""Checkpoints for resuming long screening runs."""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from .candidate import Candidate
+from .filter_manager import FilterManager
+from .screening_stats import ScreeningStats
+
+
+def make_run_key(parts: Iterable[str]) -> str:
+    """
+    Hash everything that determines a run's results into a key.
+
+    A checkpoint is only resumed by a run with the same key.
+
+    Args:
+        parts: Strings describing the inputs and configuration
+
+    Returns:
+        Hex digest identifying the run
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@dataclass
+class CheckpointState:
+    """
+    Progress of a screening run.
+
+    Attributes:
+        run_key: Key of the run this progress belongs to
+        screened: Number of candidates screened, in input order
+        passed: Bitmap of passing positions (bit i of byte i // 8)
+        stats: ScreeningStats.state() of the screened candidates, if collected
+        exported: Reports already written
+    """
+    run_key: str
+    screened: int = 0
+    passed: bytearray = field(default_factory=bytearray)
+    stats: Optional[dict] = None
+    exported: List[str] = field(default_factory=list)
+
+    def mark_passed(self, position: int) -> None:
+        """Set the bit for a passing candidate."""
+        index = position >> 3
+        if index >= len(self.passed):
+            self.passed.extend(bytes(index + 1 - len(self.passed)))
+        self.passed[index] |= 1 << (position & 7)
+
+    def passed_positions(self) -> Iterator[int]:
+        """Yield the positions of passing candidates in order."""
+        for index, byte in enumerate(self.passed):
+            while byte:
+                low = byte & -byte
+                yield index * 8 + low.bit_length() - 1
+                byte ^= low
+
+
+class Checkpoint:
+    """
+    CheckpointState persisted in a JSON file.
+
+    Writes are atomic, so a crash mid-write leaves the previous
+    checkpoint intact.
+    """
+
+    def __init__(self, path: str, run_key: str, interval_seconds: float = 30.0):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path: JSON file to write
+            run_key: Key of the current run (see make_run_key())
+            interval_seconds: Minimum time between periodic saves
+        """
+        self.path = path
+        self.run_key = run_key
+        self.interval_seconds = interval_seconds
+        self._last_save = time.monotonic()
+
+    def load(self) -> Optional[CheckpointState]:
+        """
+        Load the saved progress of this run.
+
+        Returns:
+            The saved state, or None if there is none or it belongs to a
+            run with different inputs or settings
+        """
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("run_key") != self.run_key:
+            return None
+        return CheckpointState(
+            run_key=data["run_key"],
+            screened=data["screened"],
+            passed=bytearray.fromhex(data["passed"]),
+            stats=data.get("stats"),
+            exported=list(data.get("exported", [])),
+        )
+
+    def due(self) -> bool:
+        """Return True if the save interval has elapsed since the last save."""
+        return time.monotonic() - self._last_save >= self.interval_seconds
+
+    def save(self, state: CheckpointState) -> None:
+        """
+        Write the state.
+
+        Args:
+            state: Progress to persist
+        """
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "run_key": state.run_key,
+                    "screened": state.screened,
+                    "passed": state.passed.hex(),
+                    "stats": state.stats,
+                    "exported": state.exported,
+                },
+                f
+            )
+        os.replace(temp_path, self.path)
+        self._last_save = time.monotonic()
+
+    def remove(self) -> None:
+        """Delete the checkpoint once the run has completed."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def screen_with_checkpoints(
+    filter_manager: FilterManager,
+    candidates: Sequence[Candidate],
+    checkpoint: Checkpoint,
+    state: CheckpointState,
+    chunk_size: int = 10000,
+    workers: Optional[int] = None
+) -> List[Candidate]:
+    """
+    Screen candidates in chunks, saving progress between chunks.
+
+    Screening starts after the state's last screened position, so a
+    resumed run gives the same result as an uninterrupted one. The
+    manager's stats collector, if any, is saved with each checkpoint.
+
+    Args:
+        filter_manager: Filters to apply (with any stats/cache attached)
+        candidates: All candidates of the run, in input order
+        checkpoint: Where to save progress
+        state: Progress so far (a fresh state for a new run)
+        chunk_size: Candidates screened between checkpoint saves
+        workers: Screen chunks in this many worker processes (one pool
+            for the whole run)
+
+    Returns:
+        All passing candidates, in input order
+    """
+    stats: Optional[ScreeningStats] = filter_manager.stats
+    iterator = islice(candidates, state.screened, None)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers else None
+    try:
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            if pool is not None:
+                passed = filter_manager.apply_parallel(chunk, workers=workers, executor=pool)
+            else:
+                passed = filter_manager.apply_all(chunk)
+
+            # Results keep input order, so positions are found in one walk
+            passed_iter = iter(passed)
+            next_passed = next(passed_iter, None)
+            for offset, candidate in enumerate(chunk):
+                if candidate is next_passed:
+                    state.mark_passed(state.screened + offset)
+                    next_passed = next(passed_iter, None)
+
+            state.screened += len(chunk)
+            if checkpoint.due():
+                if stats is not None:
+                    state.stats = stats.state()
+                checkpoint.save(state)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if stats is not None:
+        state.stats = stats.state()
+    checkpoint.save(state)
+    return [candidates[position] for position in state.passed_positions()]
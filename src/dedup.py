@@ -0,0 +1,208 @@
+"""Streaming candidate deduplication."""
+
+import hashlib
+import re
+import unicodedata
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+
+from .candidate import Candidate
+from .linkedin_client import normalize_linkedin_url
+from .location_normalizer import default_normalizer
+
+
+@dataclass
+class DedupStats:
+    """
+    Counters collected while deduplicating.
+
+    Attributes:
+        seen: Candidates read
+        exact_duplicates: Dropped on a matching URL, email or phone
+        fuzzy_duplicates: Dropped on a similar name within the same block
+    """
+    seen: int = 0
+    exact_duplicates: int = 0
+    fuzzy_duplicates: int = 0
+
+    @property
+    def unique(self) -> int:
+        """Candidates kept."""
+        return self.seen - self.exact_duplicates - self.fuzzy_duplicates
+
+
+def normalize_email(email: Optional[str]) -> str:
+    """Lowercase and strip an email address ("" if missing)."""
+    return (email or "").strip().lower()
+
+
+def normalize_phone(phone: Optional[str]) -> str:
+    """
+    Reduce a phone number to its last 9 digits ("" if too short).
+
+    This ignores formatting, country codes and trunk prefixes, e.g.
+    "+61 412 345 678" and "0412-345-678" normalize to the same value.
+    """
+    digits = re.sub(r"\D", "", phone or "")
+    return digits[-9:] if len(digits) >= 8 else ""
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for fuzzy comparison.
+
+    Accents and punctuation are removed and tokens are sorted. When a
+    name contains Latin tokens (e.g. "张伟 (Wei Zhang)"), only those are
+    kept, so it compares equal to the romanized spelling alone.
+    """
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    tokens = re.findall(r"\w+", text)
+    latin = [t for t in tokens if t.isascii()]
+    return " ".join(sorted(latin or tokens))
+
+
+class Deduplicator:
+    """
+    Streaming deduplicator for candidates from overlapping sources.
+
+    Two passes are applied to each candidate, keeping the first occurrence:
+
+    1. Exact: 64-bit hashes of the normalized LinkedIn URL, email and phone
+       are looked up in a hash set. A hit on any of them is a duplicate.
+    2. Fuzzy: candidates are blocked by nationality and name initials, and
+       compared only against recent names in the same block. A duplicate
+       needs a name similarity >= fuzzy_threshold, the same location and
+       an age within 1 year. Two records that both carry a URL, email or
+       phone (and matched none in pass 1) are different people, so fuzzy
+       evidence only merges when at least one side has no identifier.
+
+    Memory is bounded by max_keys (exact hashes) and max_blocks x
+    block_size (fuzzy entries); the oldest entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        fuzzy_threshold: float = 0.9,
+        block_size: int = 64,
+        max_blocks: int = 100_000,
+        max_keys: Optional[int] = 5_000_000
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            fuzzy_threshold: Minimum name similarity (0-1) for a fuzzy match
+            block_size: Recent names remembered per block
+            max_blocks: Maximum number of blocks kept
+            max_keys: Maximum number of exact hashes kept (None = unbounded)
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.max_keys = max_keys
+        self.stats = DedupStats()
+        self._keys: "OrderedDict[int, None]" = OrderedDict()
+        self._blocks: "OrderedDict[Tuple[str, str], Deque[Tuple[str, str, int, bool]]]" = OrderedDict()
+
+    def dedupe(self, candidates: Iterable[Candidate]) -> Iterator[Candidate]:
+        """
+        Lazily drop duplicates from a stream of candidates.
+
+        Args:
+            candidates: Candidates in arrival order
+
+        Yields:
+            The first occurrence of each distinct candidate
+        """
+        for candidate in candidates:
+            if not self.is_duplicate(candidate):
+                yield candidate
+
+    def is_duplicate(self, candidate: Candidate) -> bool:
+        """
+        Check a candidate against everything seen so far and remember it.
+
+        Args:
+            candidate: The candidate to check
+
+        Returns:
+            True if the candidate duplicates an earlier one
+        """
+        self.stats.seen += 1
+        keys = self._exact_keys(candidate)
+
+        if any(key in self._keys for key in keys):
+            self.stats.exact_duplicates += 1
+            self._remember_keys(keys)
+            return True
+
+        name = normalize_name(candidate.name)
+        location = default_normalizer.normalize(candidate.location)
+        block = self._block(candidate, name)
+        has_ids = bool(keys)
+        for other_name, other_location, other_age, other_has_ids in block:
+            if (
+                not (has_ids and other_has_ids)
+                and other_location == location
+                and abs(other_age - candidate.age) <= 1
+                and self._similar(name, other_name)
+            ):
+                self.stats.fuzzy_duplicates += 1
+                self._remember_keys(keys)
+                return True
+
+        block.append((name, location, candidate.age, has_ids))
+        self._remember_keys(keys)
+        return False
+
+    def _exact_keys(self, candidate: Candidate) -> List[int]:
+        """Hash the normalized identifiers of a candidate."""
+        values = []
+        if candidate.linkedin_url:
+            values.append("url:" + normalize_linkedin_url(candidate.linkedin_url))
+        email = normalize_email(candidate.email)
+        if email:
+            values.append("email:" + email)
+        phone = normalize_phone(candidate.phone)
+        if phone:
+            values.append("phone:" + phone)
+        return [
+            int.from_bytes(hashlib.blake2b(v.encode("utf-8"), digest_size=8).digest(), "big")
+            for v in values
+        ]
+
+    def _remember_keys(self, keys: List[int]) -> None:
+        """Add exact hashes, evicting the oldest beyond max_keys."""
+        for key in keys:
+            self._keys[key] = None
+            self._keys.move_to_end(key)
+        if self.max_keys is not None:
+            while len(self._keys) > self.max_keys:
+                self._keys.popitem(last=False)
+
+    def _block(self, candidate: Candidate, name: str) -> Deque[Tuple[str, str, int, bool]]:
+        """Get (or create) the fuzzy-matching block for a candidate."""
+        initials = "".join(token[0] for token in name.split())
+        block_key = (candidate.nationality.strip().lower(), initials)
+        block = self._blocks.get(block_key)
+        if block is None:
+            block = self._blocks[block_key] = deque(maxlen=self.block_size)
+            if len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+        else:
+            self._blocks.move_to_end(block_key)
+        return block
+
+    def _similar(self, name: str, other: str) -> bool:
+        """Check whether two normalized names are similar enough."""
+        if name == other:
+            return True
+        matcher = SequenceMatcher(None, name, other)
+        return (
+            matcher.real_quick_ratio() >= self.fuzzy_threshold
+            and matcher.quick_ratio() >= self.fuzzy_threshold
+            and matcher.ratio() >= self.fuzzy_threshold
+        )
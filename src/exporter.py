@@ -1,14 +1,16 @@
 """Excel exporter for candidate data."""
 
 import os
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from openpyxl.utils import get_column_letter
 
 from .candidate import Candidate
+from .screening_stats import ScreeningStats
 
 
 class ExcelExporter:
@@ -102,6 +104,217 @@ class ExcelExporter:
 
         return filepath
 
+    def append(
+        self,
+        candidates: List[Candidate],
+        filename: str = "candidates.xlsx"
+    ) -> str:
+        """
+        Append candidates to a file written by export(), creating it if needed.
+
+        Args:
+            candidates: List of candidates to append
+            filename: Output filename
+
+        Returns:
+            Full path to the exported file
+        """
+        filepath = os.path.join(self.output_directory, filename)
+        if not os.path.exists(filepath):
+            return self.export(candidates, filename=filename)
+
+        workbook = load_workbook(filepath)
+        sheet = workbook["Filtered Candidates"]
+
+        thin_border = Border(
+            left=Side(style="thin"),
+            right=Side(style="thin"),
+            top=Side(style="thin"),
+            bottom=Side(style="thin")
+        )
+
+        # Data rows
+        for row, candidate in enumerate(candidates, sheet.max_row + 1):
+            data = [
+                candidate.name,
+                candidate.current_position,
+                candidate.experience_years,
+                candidate.location,
+                candidate.linkedin_url
+            ]
+            for col, value in enumerate(data, 1):
+                cell = sheet.cell(row=row, column=col, value=value)
+                cell.border = thin_border
+                if col == 5:  # LinkedIn URL column
+                    cell.alignment = Alignment(horizontal="left")
+
+        workbook.save(filepath)
+
+        return filepath
+
+    def exported_urls(self, filename: str = "candidates.xlsx") -> Set[str]:
+        """
+        Read the LinkedIn URLs already in a file written by export() or append().
+
+        Args:
+            filename: Output filename
+
+        Returns:
+            LinkedIn URLs of the exported rows (empty if the file is missing)
+        """
+        filepath = os.path.join(self.output_directory, filename)
+        if not os.path.exists(filepath):
+            return set()
+
+        workbook = load_workbook(filepath, read_only=True)
+        try:
+            sheet = workbook["Filtered Candidates"]
+            return {
+                url for (url,) in sheet.iter_rows(min_row=2, min_col=5, max_col=5, values_only=True)
+                if url
+            }
+        finally:
+            workbook.close()
+
+    def open_stream(self, filename: str = "candidates.xlsx", detailed: bool = False) -> "StreamingReport":
+        """
+        Open a report that is written incrementally, batch by batch.
+
+        The file has the same layout as export() (or export_detailed()),
+        but rows go straight to disk, so memory does not grow with the
+        number of candidates.
+
+        Args:
+            filename: Output filename
+            detailed: Write the export_detailed() columns
+
+        Returns:
+            StreamingReport; call write() for each batch, then close()
+        """
+        return StreamingReport(os.path.join(self.output_directory, filename), detailed)
+
+    def export_profiles(
+        self,
+        results: Dict[str, List[Candidate]],
+        filename: str = "candidates_by_profile.xlsx"
+    ) -> str:
+        """
+        Export the results of several filter profiles, one sheet per profile.
+
+        Args:
+            results: Profile name -> candidates that passed that profile
+            filename: Output filename
+
+        Returns:
+            Full path to the exported file
+        """
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+
+        # Define styles
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+
+        headers = ["Name", "Position", "Experience (Years)", "Location", "LinkedIn URL"]
+        column_widths = [25, 30, 18, 15, 45]
+
+        for profile, candidates in results.items():
+            # Excel sheet titles: max 31 characters, no []:*?/\
+            title = "".join(ch for ch in profile if ch not in "[]:*?/\\")[:31]
+            sheet = workbook.create_sheet(title=title or "Profile")
+
+            # Headers
+            for col, header in enumerate(headers, 1):
+                cell = sheet.cell(row=1, column=col, value=header)
+                cell.font = header_font
+                cell.fill = header_fill
+
+            # Data rows
+            for row, candidate in enumerate(candidates, 2):
+                data = [
+                    candidate.name,
+                    candidate.current_position,
+                    candidate.experience_years,
+                    candidate.location,
+                    candidate.linkedin_url
+                ]
+                for col, value in enumerate(data, 1):
+                    sheet.cell(row=row, column=col, value=value)
+
+            # Adjust column widths
+            for col, width in enumerate(column_widths, 1):
+                sheet.column_dimensions[get_column_letter(col)].width = width
+
+            # Freeze header row
+            sheet.freeze_panes = "A2"
+
+        # Save file
+        filepath = os.path.join(self.output_directory, filename)
+        workbook.save(filepath)
+
+        return filepath
+
+    def export_ranked(
+        self,
+        ranked: List[Tuple[Candidate, float]],
+        filename: str = "candidates_ranked.xlsx"
+    ) -> str:
+        """
+        Export ranked candidates with their scores.
+
+        Args:
+            ranked: (candidate, score) pairs, best first
+            filename: Output filename
+
+        Returns:
+            Full path to the exported file
+        """
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Ranked Candidates"
+
+        # Define styles
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+
+        # Headers
+        headers = [
+            "Rank", "Score", "Name", "Position",
+            "Experience (Years)", "Location", "LinkedIn URL"
+        ]
+        for col, header in enumerate(headers, 1):
+            cell = sheet.cell(row=1, column=col, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+
+        # Data rows
+        for rank, (candidate, score) in enumerate(ranked, 1):
+            data = [
+                rank,
+                round(score, 4),
+                candidate.name,
+                candidate.current_position,
+                candidate.experience_years,
+                candidate.location,
+                candidate.linkedin_url
+            ]
+            for col, value in enumerate(data, 1):
+                sheet.cell(row=rank + 1, column=col, value=value)
+
+        # Adjust column widths
+        column_widths = [8, 10, 25, 30, 18, 15, 45]
+        for col, width in enumerate(column_widths, 1):
+            sheet.column_dimensions[get_column_letter(col)].width = width
+
+        # Freeze header row
+        sheet.freeze_panes = "A2"
+
+        # Save file
+        filepath = os.path.join(self.output_directory, filename)
+        workbook.save(filepath)
+
+        return filepath
+
     def export_detailed(
         self,
         candidates: List[Candidate],
@@ -177,8 +390,10 @@ class ExcelExporter:
         self,
         total_candidates: int,
         filtered_candidates: int,
-        filter_details: dict,
-        filename: str = "filter_summary.xlsx"
+        filter_details: Optional[dict] = None,
+        filename: str = "filter_summary.xlsx",
+        performance: Optional[dict] = None,
+        stats: Optional[ScreeningStats] = None
     ) -> str:
         """
         Export filtering summary report.
@@ -186,8 +401,13 @@ class ExcelExporter:
         Args:
             total_candidates: Total number of candidates before filtering
             filtered_candidates: Number of candidates after filtering
-            filter_details: Detailed filter results
+            filter_details: Detailed filter results (apply_all_with_details()
+                output, or filter name -> count)
             filename: Output filename
+            performance: FilterProfiler.to_dict() output; adds a
+                "Performance" sheet when given
+            stats: Streaming statistics; used for the filter breakdown
+                instead of filter_details, and adds a "Breakdown" sheet
 
         Returns:
             Full path to the exported file
@@ -219,7 +439,15 @@ class ExcelExporter:
         sheet.cell(row=8, column=1).font = Font(bold=True)
 
         row = 9
-        for filter_name, failed_count in filter_details.items():
+        if stats is not None:
+            # Each rejected candidate counts once, for the first filter it failed.
+            # Most rejecting filter first; also independent of merge order
+            rejections = sorted(stats.rejections.items(), key=lambda item: (-item[1], item[0]))
+            for filter_name, rejected_count in rejections:
+                sheet.cell(row=row, column=1, value=f"Rejected first by {filter_name}:")
+                sheet.cell(row=row, column=2, value=rejected_count)
+                row += 1
+        for filter_name, failed_count in (filter_details or {}).items():
             if filter_name.startswith("failed_"):
                 display_name = filter_name.replace("failed_", "").replace("_", " ").title()
                 sheet.cell(row=row, column=1, value=f"Failed {display_name}:")
@@ -230,8 +458,193 @@ class ExcelExporter:
         sheet.column_dimensions["A"].width = 20
         sheet.column_dimensions["B"].width = 25
 
+        if stats is not None:
+            self._write_breakdown_sheet(workbook, stats)
+
+        if performance:
+            self._write_performance_sheet(workbook, performance)
+
         # Save file
         filepath = os.path.join(self.output_directory, filename)
         workbook.save(filepath)
 
         return filepath
+
+    def _write_breakdown_sheet(self, workbook: Workbook, stats: ScreeningStats) -> None:
+        """
+        Add a "Breakdown" sheet with passed-vs-rejected tables.
+
+        Args:
+            workbook: Workbook to add the sheet to
+            stats: Streaming statistics collected while filtering
+        """
+        sheet = workbook.create_sheet("Breakdown")
+        header_font = Font(bold=True)
+
+        row = 1
+        for title, rows in stats.breakdowns().items():
+            for col, header in enumerate((title, "Passed", "Rejected"), 1):
+                sheet.cell(row=row, column=col, value=header).font = header_font
+            row += 1
+            for data in rows:
+                for col, value in enumerate(data, 1):
+                    sheet.cell(row=row, column=col, value=value)
+                row += 1
+            row += 1
+
+        sheet.column_dimensions["A"].width = 32
+        sheet.column_dimensions["B"].width = 12
+        sheet.column_dimensions["C"].width = 12
+
+    def _write_performance_sheet(self, workbook: Workbook, performance: dict) -> None:
+        """
+        Add a "Performance" sheet with stage and per-filter timings.
+
+        Args:
+            workbook: Workbook to add the sheet to
+            performance: FilterProfiler.to_dict() output
+        """
+        sheet = workbook.create_sheet("Performance")
+        header_font = Font(bold=True)
+
+        sheet.cell(row=1, column=1, value="Stage").font = header_font
+        sheet.cell(row=1, column=2, value="Seconds").font = header_font
+        row = 2
+        for stage_name, elapsed in performance.get("stages", {}).items():
+            sheet.cell(row=row, column=1, value=stage_name)
+            sheet.cell(row=row, column=2, value=round(elapsed, 6))
+            row += 1
+
+        row += 1
+        headers = [
+            "Filter", "Calls", "Total (s)", "Mean (us)",
+            "Passed", "Rejected", "Skipped", "Saved (s)"
+        ]
+        for col, header in enumerate(headers, 1):
+            sheet.cell(row=row, column=col, value=header).font = header_font
+        row += 1
+        for filter_name, stats in performance.get("filters", {}).items():
+            data = [
+                filter_name,
+                stats["calls"],
+                round(stats["total_time"], 6),
+                round(stats["mean_time"] * 1e6, 3),
+                stats["passed"],
+                stats["rejected"],
+                stats["skipped"],
+                round(stats["saved_time"], 6)
+            ]
+            for col, value in enumerate(data, 1):
+                sheet.cell(row=row, column=col, value=value)
+            row += 1
+
+        for col in range(1, len(headers) + 1):
+            sheet.column_dimensions[get_column_letter(col)].width = 14
+
+
+class StreamingReport:
+    """
+    Candidate report written row by row with openpyxl's write-only mode.
+
+    Created by ExcelExporter.open_stream().
+    """
+
+    def __init__(self, filepath: str, detailed: bool = False):
+        """
+        Start the report.
+
+        Args:
+            filepath: Output file path
+            detailed: Write the export_detailed() columns
+        """
+        self.filepath = filepath
+        self.detailed = detailed
+        self.rows = 0
+        self._workbook = Workbook(write_only=True)
+
+        if detailed:
+            self._sheet = self._workbook.create_sheet("Detailed Candidates")
+            headers = [
+                "Name", "Age", "Position", "Experience (Years)",
+                "Location", "Nationality", "Education Background",
+                "Work Background", "Skills", "Languages", "LinkedIn URL"
+            ]
+            column_widths = [20] * (len(headers) - 1) + [40]
+        else:
+            self._sheet = self._workbook.create_sheet("Filtered Candidates")
+            headers = ["Name", "Position", "Experience (Years)", "Location", "LinkedIn URL"]
+            column_widths = [25, 30, 18, 15, 45]
+
+        # Layout must be set before the first row in write-only mode
+        for col, width in enumerate(column_widths, 1):
+            self._sheet.column_dimensions[get_column_letter(col)].width = width
+        self._sheet.freeze_panes = "A2"
+
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        self._border = Border(
+            left=Side(style="thin"),
+            right=Side(style="thin"),
+            top=Side(style="thin"),
+            bottom=Side(style="thin")
+        )
+        self._url_alignment = Alignment(horizontal="left")
+
+        header_row = []
+        for header in headers:
+            cell = WriteOnlyCell(self._sheet, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            if not detailed:
+                cell.alignment = Alignment(horizontal="center", vertical="center")
+                cell.border = self._border
+            header_row.append(cell)
+        self._sheet.append(header_row)
+
+    def write(self, candidates: List[Candidate]) -> None:
+        """
+        Append a batch of candidates.
+
+        Args:
+            candidates: Candidates to add, in report order
+        """
+        for candidate in candidates:
+            if self.detailed:
+                self._sheet.append([
+                    candidate.name,
+                    candidate.age,
+                    candidate.current_position,
+                    candidate.experience_years,
+                    candidate.location,
+                    candidate.nationality,
+                    ", ".join(candidate.education_background),
+                    ", ".join(candidate.work_background),
+                    ", ".join(candidate.skills),
+                    ", ".join(candidate.languages),
+                    candidate.linkedin_url
+                ])
+            else:
+                row = []
+                for value in (
+                    candidate.name,
+                    candidate.current_position,
+                    candidate.experience_years,
+                    candidate.location,
+                    candidate.linkedin_url
+                ):
+                    cell = WriteOnlyCell(self._sheet, value=value)
+                    cell.border = self._border
+                    row.append(cell)
+                row[-1].alignment = self._url_alignment
+                self._sheet.append(row)
+        self.rows += len(candidates)
+
+    def close(self) -> str:
+        """
+        Finish the report.
+
+        Returns:
+            Full path to the exported file
+        """
+        self._workbook.save(self.filepath)
+        return self.filepath
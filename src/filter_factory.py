@@ -0,0 +1,138 @@
+"""Build filter managers from FilterSettings."""
+
+from dataclasses import fields, replace
+from typing import Any, Dict, Optional
+
+from .filter_manager import FilterManager
+from .filters import (
+    AgeFilter,
+    ExperienceFilter,
+    LocationFilter,
+    BackgroundFilter,
+    SkillFilter,
+    LanguageFilter,
+    PositionFilter,
+    SuppressionFilter
+)
+from .suppression_list import SuppressionList
+
+
+# File paths are server configuration, not query parameters
+LOCKED_SETTINGS = frozenset({"suppression_list"})
+
+
+def add_default_filters(
+    filter_manager: FilterManager,
+    filter_settings,
+    suppression_list: Optional[SuppressionList] = None
+) -> None:
+    """
+    Add the standard filters configured by a FilterSettings.
+
+    Args:
+        filter_manager: The filter manager to add filters to
+        filter_settings: FilterSettings with the filter criteria
+        suppression_list: Open list for filter_settings.suppression_list,
+            shared by every manager built with it (opened with default
+            sizing if None)
+    """
+    # Add age filter
+    filter_manager.add_filter(
+        AgeFilter(
+            min_age=filter_settings.min_age,
+            max_age=filter_settings.max_age
+        )
+    )
+
+    # Add experience filter
+    filter_manager.add_filter(
+        ExperienceFilter(
+            min_years=filter_settings.min_experience_years,
+            max_years=filter_settings.max_experience_years
+        )
+    )
+
+    # Add location filter
+    filter_manager.add_filter(
+        LocationFilter(
+            excluded_locations=filter_settings.excluded_locations
+        )
+    )
+
+    # Add background filter
+    filter_manager.add_filter(
+        BackgroundFilter(
+            preferred_backgrounds=filter_settings.preferred_backgrounds,
+            excluded_backgrounds=filter_settings.excluded_backgrounds
+        )
+    )
+
+    # Add skill / language filters if queries are configured
+    if filter_settings.skill_query:
+        filter_manager.add_filter(SkillFilter(filter_settings.skill_query))
+    if filter_settings.language_query:
+        filter_manager.add_filter(LanguageFilter(filter_settings.language_query))
+
+    # Add position filter if target titles are configured
+    if filter_settings.positions:
+        filter_manager.add_filter(PositionFilter(filter_settings.positions))
+
+    # Add suppression filter if a suppression list is configured
+    if filter_settings.suppression_list:
+        if suppression_list is None:
+            suppression_list = SuppressionList(filter_settings.suppression_list)
+        filter_manager.add_filter(SuppressionFilter(suppression_list))
+
+
+def create_filter_manager(
+    filter_settings,
+    suppression_list: Optional[SuppressionList] = None
+) -> FilterManager:
+    """
+    Create a filter manager with the standard filters.
+
+    Args:
+        filter_settings: FilterSettings with the filter criteria
+        suppression_list: Open suppression list to reuse (see add_default_filters)
+
+    Returns:
+        FilterManager with the configured filters
+    """
+    filter_manager = FilterManager()
+    add_default_filters(filter_manager, filter_settings, suppression_list)
+    return filter_manager
+
+
+def apply_filter_overrides(filter_settings, overrides: Dict[str, Any]):
+    """
+    Return a copy of the filter settings with some fields replaced.
+
+    Example:
+        apply_filter_overrides(settings.filter, {"max_age": 35, "skill_query": "AML"})
+
+    Args:
+        filter_settings: Base filter criteria (left unchanged)
+        overrides: FilterSettings field name -> new value
+
+    Returns:
+        New FilterSettings instance
+
+    Raises:
+        ValueError: If a field is unknown or locked, or a value has the wrong type
+    """
+    defaults = {f.name: getattr(filter_settings, f.name) for f in fields(filter_settings)}
+    for name, value in overrides.items():
+        if name not in defaults:
+            raise ValueError(f"Unknown filter setting: {name!r}")
+        if name in LOCKED_SETTINGS:
+            raise ValueError(f"{name} cannot be overridden")
+        default = defaults[name]
+        if isinstance(default, list):
+            if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                raise ValueError(f"{name} must be a list of strings")
+        elif isinstance(default, str):
+            if not isinstance(value, str):
+                raise ValueError(f"{name} must be a string")
+        elif isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{name} must be a number")
+    return replace(filter_settings, **overrides)
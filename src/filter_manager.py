@@ -1,9 +1,22 @@
 """Filter manager for orchestrating multiple filters."""
 
-from typing import List, Dict, Optional
+import heapq
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeout
+from itertools import islice
+from typing import Hashable, Iterable, Iterator, List, Dict, Optional, Sequence, Tuple
 
 from .candidate import Candidate
+from .candidate_store import CandidateStore
 from .filters.base_filter import BaseFilter
+from .filters.expression import FilterExpression
+from .scorers.base_scorer import BaseScorer
+from .profiling import FilterProfiler
+from .screening_stats import ScreeningStats
+from .result_cache import ResultCache, candidate_key, filter_config_key
+from .sql_filters import compile_filter
 
 
 class FilterManager:
@@ -12,20 +25,43 @@ class FilterManager:
 
     Supports dynamic addition/removal of filters and provides
     detailed filtering results.
+
+    Filters that only read summary fields run before filters that need a
+    full profile, so lazily hydrated candidates are only fetched once they
+    have passed every cheap filter.
     """
 
     def __init__(self):
         """Initialize the filter manager with an empty filter list."""
         self._filters: Dict[str, BaseFilter] = {}
+        self._evaluation_order: List[BaseFilter] = []
+        self._evaluation_names: List[str] = []
+        self.profiler: Optional[FilterProfiler] = None
+        self.result_cache: Optional[ResultCache] = None
+        self.stats: Optional[ScreeningStats] = None
 
-    def add_filter(self, filter_instance: BaseFilter) -> None:
+    def add_filter(self, filter_instance: BaseFilter, name: Optional[str] = None) -> str:
         """
         Add a filter to the manager.
 
         Args:
-            filter_instance: The filter to add
+            filter_instance: The filter to add (may be an And/Or/Not expression)
+            name: Name to register under. An explicit name replaces any filter
+                with that name; by default the filter's own name is used, with
+                a numeric suffix if taken ("Location", "Location_2").
+
+        Returns:
+            The name the filter was registered under
         """
-        self._filters[filter_instance.name] = filter_instance
+        if name is None:
+            name = filter_instance.name
+            suffix = 2
+            while name in self._filters:
+                name = f"{filter_instance.name}_{suffix}"
+                suffix += 1
+        self._filters[name] = filter_instance
+        self._update_evaluation_order()
+        return name
 
     def remove_filter(self, filter_name: str) -> Optional[BaseFilter]:
         """
@@ -37,7 +73,9 @@ class FilterManager:
         Returns:
             The removed filter, or None if not found
         """
-        return self._filters.pop(filter_name, None)
+        removed = self._filters.pop(filter_name, None)
+        self._update_evaluation_order()
+        return removed
 
     def get_filter(self, filter_name: str) -> Optional[BaseFilter]:
         """
@@ -60,33 +98,398 @@ class FilterManager:
         """
         return list(self._filters.keys())
 
-    def apply_all(self, candidates: List[Candidate]) -> List[Candidate]:
+    def as_filter(self) -> BaseFilter:
+        """
+        Snapshot the registered filters as a single AND expression.
+
+        This is how a manager is nested inside And/Or/Not expressions.
+
+        Returns:
+            AndFilter over the registered filters
+        """
+        from .filters.expression import AndFilter
+        return AndFilter(*self._filters.values())
+
+    def set_profiler(self, profiler: Optional[FilterProfiler]) -> None:
+        """
+        Attach a profiler to record per-filter timings and counts.
+
+        Args:
+            profiler: The profiler to attach, or None to disable profiling
+        """
+        self.profiler = profiler
+
+    def set_result_cache(self, result_cache: Optional[ResultCache]) -> None:
+        """
+        Attach a persistent verdict cache used by apply_all().
+
+        Args:
+            result_cache: The cache to attach, or None to disable caching
+        """
+        self.result_cache = result_cache
+
+    def set_stats(self, stats: Optional[ScreeningStats]) -> None:
+        """
+        Attach a statistics collector fed with every screened candidate.
+
+        Args:
+            stats: The collector to attach, or None to disable it
+        """
+        self.stats = stats
+
+    def required_fields(self) -> Dict[str, Optional[Tuple[str, ...]]]:
+        """
+        Get the candidate fields each filter reads.
+
+        Returns:
+            Mapping of filter name to its required fields (None = unknown)
+        """
+        return {
+            name: filter_instance.required_fields
+            for name, filter_instance in self._filters.items()
+        }
+
+    def split_by_cost(self) -> Tuple[List[BaseFilter], List[BaseFilter]]:
+        """
+        Split filters into cheap (summary fields) and detail stages.
+
+        Returns:
+            Tuple of (cheap filters, filters needing a full profile)
+        """
+        cheap = [f for f in self._filters.values() if not f.needs_detail]
+        detail = [f for f in self._filters.values() if f.needs_detail]
+        return cheap, detail
+
+    def apply_all(
+        self,
+        candidates: Iterable[Candidate],
+        limit: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> List[Candidate]:
         """
         Apply all filters to a list of candidates.
 
         A candidate must pass ALL filters to be included in the result.
 
+        With a limit or time budget, candidates are pulled from the input
+        one at a time and evaluation stops as soon as it is reached, so a
+        streaming input (file loader, LinkedIn search) is not read further.
+
         Args:
-            candidates: List of candidates to filter
+            candidates: Candidates to filter (a list, or any iterable)
+            limit: Stop once this many candidates have passed
+            time_budget: Stop taking new candidates after this many seconds
+                (the candidate being evaluated is finished)
 
         Returns:
-            List of candidates that pass all filters
+            List of candidates that pass all filters, in input order
         """
+        early_exit = limit is not None or time_budget is not None
+        if limit is not None and limit <= 0:
+            return []
+        if time_budget is not None:
+            candidates = _until(candidates, time.monotonic() + time_budget)
+
         if not self._filters:
-            return candidates
+            return list(islice(candidates, limit)) if early_exit else candidates
+
+        if not early_exit:
+            # Collection-wide indexes would cost a full pass over the input
+            self._prepare(candidates)
+        if self.result_cache is not None:
+            return self._apply_all_cached(candidates, limit)
+
+        passes = self._select_passes()
+        if early_exit:
+            return list(islice(filter(passes, candidates), limit))
 
         result = []
         for candidate in candidates:
-            if self._passes_all_filters(candidate):
+            if passes(candidate):
                 result.append(candidate)
         return result
 
+    def apply_top_k(
+        self,
+        candidates: Iterable[Candidate],
+        k: int,
+        scorer: BaseScorer
+    ) -> List[Tuple[Candidate, float]]:
+        """
+        Return the K highest-scoring candidates that pass all filters.
+
+        Candidates are streamed through a bounded min-heap of size K, so
+        the full pass list is never materialized or sorted.
+
+        Args:
+            candidates: Candidates to filter and rank (any iterable)
+            k: Number of candidates to return
+            scorer: Scorer used to rank passing candidates
+
+        Returns:
+            List of (candidate, score) pairs, best first; ties keep input order
+        """
+        if k <= 0:
+            return []
+
+        self._prepare(candidates)
+        passes = self._select_passes()
+
+        heap: List[Tuple[float, int, Candidate]] = []
+        for index, candidate in enumerate(candidates):
+            if not passes(candidate):
+                continue
+            entry = (scorer.score(candidate), -index, candidate)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+        heap.sort(key=lambda entry: entry[:2], reverse=True)
+        return [(candidate, score) for score, _, candidate in heap]
+
+    def apply_parallel(
+        self,
+        candidates: Iterable[Candidate],
+        workers: Optional[int] = None,
+        chunk_size: int = 5000,
+        limit: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        executor: Optional[ProcessPoolExecutor] = None
+    ) -> List[Candidate]:
+        """
+        apply_all() spread over worker processes.
+
+        Candidates are sent to the workers in chunks, with at most two
+        chunks per worker in flight, so a stream is never fully loaded.
+        With a limit, chunks are no larger than the number of candidates
+        still needed, and new chunks are only read as results come back.
+        Each worker screens its chunk with its own ScreeningStats, which
+        are merged into the attached collector. The profiler and result
+        cache are not used by workers.
+
+        Starting worker processes is not free; callers that screen many
+        batches should create one executor and pass it to every call.
+
+        Worth it when filters are expensive (skill queries, custom
+        filters); for cheap field filters, sending candidates to the
+        workers costs more than screening them.
+
+        Args:
+            candidates: Candidates to filter (any iterable)
+            workers: Worker processes (defaults to the CPU count)
+            chunk_size: Candidates per task
+            limit: Stop reading input once this many candidates have passed
+            time_budget: Return what has passed after this many seconds;
+                chunks still being screened are abandoned
+            executor: Pool to submit chunks to, left running afterwards
+                (one with `workers` processes is created and shut down
+                if None)
+
+        Returns:
+            List of candidates that pass all filters, in input order
+        """
+        if limit is not None and limit <= 0:
+            return []
+        workers = workers or os.cpu_count() or 1
+        filters = list(self._filters.items())
+        collect_stats = self.stats is not None
+        deadline = None if time_budget is None else time.monotonic() + time_budget
+
+        result: List[Candidate] = []
+        iterator = iter(candidates)
+        in_flight: deque = deque()
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            while limit is None or len(result) < limit:
+                while len(in_flight) < workers * 2:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                    # Never read further ahead per chunk than the candidates still needed
+                    size = chunk_size if limit is None else min(chunk_size, limit - len(result))
+                    chunk = list(islice(iterator, size))
+                    if not chunk:
+                        break
+                    in_flight.append((chunk, pool.submit(_screen_chunk, filters, chunk, collect_stats)))
+                if not in_flight:
+                    break
+                chunk, future = in_flight.popleft()
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    positions, chunk_stats = future.result(timeout=timeout)
+                except FuturesTimeout:
+                    # Still running: keep it so shutdown does not wait for it
+                    in_flight.appendleft((chunk, future))
+                    break
+                result.extend(chunk[position] for position in positions)
+                if chunk_stats is not None:
+                    self.stats.merge(chunk_stats)
+        finally:
+            # Drop chunks not yet started when stopping early
+            # (shutdown(cancel_futures=True) needs Python 3.9)
+            for _, future in in_flight:
+                future.cancel()
+            if executor is None:
+                # Don't wait for abandoned chunks that are already running
+                pool.shutdown(wait=not in_flight)
+        return result[:limit]
+
+    @staticmethod
+    def apply_profiles(
+        candidates: Iterable[Candidate],
+        profiles: Dict[str, "FilterManager"]
+    ) -> Dict[str, List[Candidate]]:
+        """
+        Screen candidates against several filter profiles in a single pass.
+
+        Filters are deduplicated across profiles by cache_key, and each
+        distinct filter is evaluated at most once per candidate; a verdict
+        computed for one profile is reused by every other profile that has
+        the same filter. Cheap filters common to every profile run first as
+        a single gate; within a profile, the remaining filters run cheapest
+        (then most shared) first.
+
+        Example:
+            results = FilterManager.apply_profiles(candidates, {
+                "Compliance": compliance_manager,
+                "Sales": sales_manager,
+            })
+
+        Args:
+            candidates: Candidates to filter (any iterable, read once)
+            profiles: Profile name -> FilterManager with that profile's filters
+
+        Returns:
+            Profile name -> candidates passing all of its filters, in input order
+        """
+        keys: Dict[Hashable, int] = {}
+        unique: List[BaseFilter] = []
+        profile_ids: Dict[str, List[int]] = {}
+        for name, manager in profiles.items():
+            ids = []
+            for filter_instance in manager._evaluation_order:
+                key = filter_instance.cache_key
+                if key not in keys:
+                    keys[key] = len(unique)
+                    unique.append(filter_instance)
+                ids.append(keys[key])
+            profile_ids[name] = ids
+
+        usage = [0] * len(unique)
+        for ids in profile_ids.values():
+            for index in ids:
+                usage[index] += 1
+
+        # Cheap filters every profile has form a common gate, run once
+        gate = sorted(
+            (index for index, filter_instance in enumerate(unique)
+             if usage[index] == len(profiles) and not filter_instance.needs_detail),
+            key=lambda index: unique[index].cost
+        )
+        gate_filters = [unique[index] for index in gate]
+
+        # Per profile: remaining filters with a memo slot if shared, else None
+        results: Dict[str, List[Candidate]] = {}
+        plans: List[Tuple[List[Candidate], List[Tuple[BaseFilter, Optional[int]]]]] = []
+        for name, ids in profile_ids.items():
+            results[name] = []
+            residual = sorted(
+                (index for index in ids if index not in gate),
+                key=lambda index: (unique[index].cost, -usage[index])
+            )
+            plans.append((results[name], [
+                (unique[index], index if usage[index] > 1 else None)
+                for index in residual
+            ]))
+
+        if isinstance(candidates, Sequence):
+            for filter_instance in unique:
+                filter_instance.prepare(candidates)
+
+        for candidate in candidates:
+            for filter_instance in gate_filters:
+                if not filter_instance.apply(candidate):
+                    break
+            else:
+                verdicts: Dict[int, bool] = {}
+                for passed, steps in plans:
+                    for filter_instance, slot in steps:
+                        if slot is None:
+                            verdict = filter_instance.apply(candidate)
+                        else:
+                            verdict = verdicts.get(slot)
+                            if verdict is None:
+                                verdict = verdicts[slot] = filter_instance.apply(candidate)
+                        if not verdict:
+                            break
+                    else:
+                        passed.append(candidate)
+
+        return results
+
+    def to_sql(self) -> Tuple[str, List, List[str]]:
+        """
+        Compile the registered filters into one SQL WHERE clause.
+
+        Filters without a SQL translation (see sql_filters.compile_filter)
+        are left for Python.
+
+        Returns:
+            Tuple of (WHERE expression, parameters, names of filters that
+            were not compiled)
+        """
+        clauses = []
+        params: List = []
+        residual = []
+        for name, filter_instance in self._filters.items():
+            compiled = compile_filter(filter_instance)
+            if compiled is None:
+                residual.append(name)
+            else:
+                clauses.append(f"({compiled[0]})")
+                params.extend(compiled[1])
+        return " AND ".join(clauses) or "1", params, residual
+
+    def apply_store(self, store: CandidateStore, limit: Optional[int] = None) -> List[Candidate]:
+        """
+        Apply all filters to the candidates in a CandidateStore.
+
+        Compilable filters are pushed down into one indexed SQL query, so
+        rejected candidates are never loaded; the remaining filters run in
+        Python over the rows it returns. The profiler, result cache and
+        stats collector only see the Python stage.
+
+        Args:
+            store: The candidate store to screen
+            limit: Stop reading rows once this many candidates have passed
+
+        Returns:
+            List of candidates that pass all filters, in insertion order
+        """
+        where, params, residual = self.to_sql()
+        candidates = store.query(where, params)
+        if not residual:
+            return list(islice(candidates, limit))
+
+        python_stage = FilterManager()
+        for name in residual:
+            python_stage.add_filter(self._filters[name], name)
+        python_stage.profiler = self.profiler
+        python_stage.result_cache = self.result_cache
+        python_stage.stats = self.stats
+        if limit is not None:
+            return python_stage.apply_all(candidates, limit=limit)
+        return python_stage.apply_all(list(candidates))
+
     def apply_all_with_details(
         self, candidates: List[Candidate]
     ) -> Dict[str, List[Candidate]]:
         """
         Apply all filters and return detailed results.
 
+        Every filter is evaluated for every candidate, so lazily hydrated
+        candidates are fully fetched. Use apply_all() for screening.
+
         Args:
             candidates: List of candidates to filter
 
@@ -94,24 +497,161 @@ class FilterManager:
             Dictionary with:
                 - 'passed': Candidates that passed all filters
                 - 'failed_<filter_name>': Candidates that failed each specific filter
+                - 'failed_<filter_name>.<leaf_name>': For And/Or/Not expressions,
+                  candidates rejected by the expression that each leaf rejected
         """
-        result = {
-            'passed': [],
-            **{f'failed_{name}': [] for name in self._filters.keys()}
-        }
-
+        result = {'passed': []}
+        leaf_keys: Dict[str, List[str]] = {}
+        for name, filter_instance in self._filters.items():
+            result[f'failed_{name}'] = []
+            if isinstance(filter_instance, FilterExpression):
+                leaf_keys[name] = [
+                    f'failed_{name}.{leaf}' for leaf in filter_instance.leaf_names()
+                ]
+                for key in leaf_keys[name]:
+                    result[key] = []
+
+        self._prepare(candidates)
+        profiler = self.profiler
         for candidate in candidates:
-            passed_all = True
+            rejected_by = []
             for name, filter_instance in self._filters.items():
-                if not filter_instance.apply(candidate):
+                if profiler is None:
+                    passed = filter_instance.apply(candidate)
+                else:
+                    passed = self._apply_profiled(name, filter_instance, candidate)
+                if not passed:
                     result[f'failed_{name}'].append(candidate)
-                    passed_all = False
+                    rejected_by.append(name)
+                    if name in leaf_keys:
+                        for key, leaf in zip(leaf_keys[name], filter_instance.leaves()):
+                            if not leaf.apply(candidate):
+                                result[key].append(candidate)
 
-            if passed_all:
+            if not rejected_by:
                 result['passed'].append(candidate)
+            if self.stats is not None:
+                self.stats.record(candidate, rejected_by)
 
         return result
 
+    def _prepare(self, candidates: Iterable[Candidate]) -> None:
+        """
+        Let filters build per-collection indexes before evaluation.
+
+        Args:
+            candidates: The candidates about to be filtered
+        """
+        if isinstance(candidates, Sequence):
+            for filter_instance in self._filters.values():
+                filter_instance.prepare(candidates)
+
+    def _apply_all_cached(
+        self,
+        candidates: Iterable[Candidate],
+        limit: Optional[int] = None
+    ) -> List[Candidate]:
+        """
+        apply_all() variant that reuses verdicts from the result cache.
+
+        Only filters that need a full profile (needs_detail) are cached:
+        a cheap field check is faster than the SQLite lookup that would
+        replace it. Cheap filters are evaluated inline, and only candidates
+        that get past the leading cheap filters are fingerprinted. Stored
+        verdicts for those are fetched with one lookup per batch, missing
+        verdicts are computed and written back in batches.
+
+        Args:
+            candidates: Candidates to filter
+            limit: Stop once this many candidates have passed
+
+        Returns:
+            List of candidates that pass all filters
+        """
+        order = [
+            (name, filter_instance, filter_config_key(filter_instance) if filter_instance.needs_detail else None)
+            for name, filter_instance in zip(self._evaluation_names, self._evaluation_order)
+        ]
+        filter_keys = [filter_key for _, _, filter_key in order if filter_key is not None]
+        if not filter_keys:
+            # Nothing worth caching: plain uncached evaluation
+            passes = self._select_passes()
+            return list(islice(filter(passes, candidates), limit))
+
+        # Leading cheap filters run before fingerprinting; the rest keep their order
+        split = next(index for index, (_, _, filter_key) in enumerate(order) if filter_key is not None)
+        head, tail = order[:split], order[split:]
+
+        cache = self.result_cache
+        result = []
+        iterator = iter(candidates)
+        while limit is None or len(result) < limit:
+            # Never read further ahead than the candidates still needed
+            size = cache.batch_size if limit is None else min(cache.batch_size, limit - len(result))
+            batch = list(islice(iterator, size))
+            if not batch:
+                break
+            batch = [candidate for candidate in batch if self._passes_uncached(head, candidate)]
+            keys = [candidate_key(candidate.fingerprint()) for candidate in batch]
+            known = cache.lookup(keys, filter_keys) if batch else {}
+
+            for candidate, key in zip(batch, keys):
+                for name, filter_instance, filter_key in tail:
+                    verdict = None if filter_key is None else known.get((key, filter_key))
+                    if verdict is None:
+                        if self.profiler is not None:
+                            verdict = self._apply_profiled(name, filter_instance, candidate)
+                        else:
+                            verdict = filter_instance.apply(candidate)
+                        if filter_key is not None:
+                            cache.stats.misses += 1
+                            cache.put(key, filter_key, verdict)
+                    else:
+                        cache.stats.hits += 1
+                    if not verdict:
+                        if self.stats is not None:
+                            self.stats.record(candidate, (name,))
+                        break
+                else:
+                    result.append(candidate)
+                    if self.stats is not None:
+                        self.stats.record(candidate)
+
+        cache.commit()
+        return result
+
+    def _passes_uncached(
+        self, order: List[Tuple[str, BaseFilter, Optional[int]]], candidate: Candidate
+    ) -> bool:
+        """
+        Apply uncached filters for _apply_all_cached(), recording rejections.
+
+        Args:
+            order: (name, filter, cache key) entries to apply, in order
+            candidate: The candidate to check
+
+        Returns:
+            True if the candidate passes every filter in order
+        """
+        for name, filter_instance, _ in order:
+            if self.profiler is not None:
+                passed = self._apply_profiled(name, filter_instance, candidate)
+            else:
+                passed = filter_instance.apply(candidate)
+            if not passed:
+                if self.stats is not None:
+                    self.stats.record(candidate, (name,))
+                return False
+        return True
+
+    def _select_passes(self):
+        """Pick the per-candidate check matching the attached instrumentation."""
+        if self.stats is not None:
+            return self._passes_all_filters_recorded
+        if self.profiler is not None:
+            return self._passes_all_filters_profiled
+        return self._passes_all_filters
+
     def _passes_all_filters(self, candidate: Candidate) -> bool:
         """
         Check if a candidate passes all filters.
@@ -122,14 +662,115 @@ class FilterManager:
         Returns:
             True if candidate passes all filters
         """
-        for filter_instance in self._filters.values():
+        for filter_instance in self._evaluation_order:
             if not filter_instance.apply(candidate):
                 return False
         return True
 
+    def _passes_all_filters_profiled(self, candidate: Candidate) -> bool:
+        """
+        Profiled variant of _passes_all_filters().
+
+        Args:
+            candidate: The candidate to check
+
+        Returns:
+            True if candidate passes all filters
+        """
+        names = self._evaluation_names
+        for index, filter_instance in enumerate(self._evaluation_order):
+            if not self._apply_profiled(names[index], filter_instance, candidate):
+                self.profiler.record_skipped(names[index + 1:])
+                return False
+        return True
+
+    def _passes_all_filters_recorded(self, candidate: Candidate) -> bool:
+        """
+        Variant of _passes_all_filters() that feeds the statistics collector
+        (and the profiler, if attached).
+
+        Args:
+            candidate: The candidate to check
+
+        Returns:
+            True if candidate passes all filters
+        """
+        names = self._evaluation_names
+        profiler = self.profiler
+        for index, filter_instance in enumerate(self._evaluation_order):
+            if profiler is None:
+                passed = filter_instance.apply(candidate)
+            else:
+                passed = self._apply_profiled(names[index], filter_instance, candidate)
+            if not passed:
+                if profiler is not None:
+                    profiler.record_skipped(names[index + 1:])
+                self.stats.record(candidate, (names[index],))
+                return False
+        self.stats.record(candidate)
+        return True
+
+    def _apply_profiled(
+        self, name: str, filter_instance: BaseFilter, candidate: Candidate
+    ) -> bool:
+        """
+        Apply a single filter and record it with the profiler.
+
+        Args:
+            name: Name the filter is registered under
+            filter_instance: The filter to apply
+            candidate: The candidate to check
+
+        Returns:
+            True if the candidate passes the filter
+        """
+        start = time.perf_counter()
+        passed = filter_instance.apply(candidate)
+        self.profiler.record(name, time.perf_counter() - start, passed)
+        return passed
+
+    def _update_evaluation_order(self) -> None:
+        """Order filters by cost so that cheap filters are evaluated first."""
+        ordered = sorted(self._filters.items(), key=lambda item: item[1].cost)
+        self._evaluation_names = [name for name, _ in ordered]
+        self._evaluation_order = [filter_instance for _, filter_instance in ordered]
+
     def __len__(self) -> int:
         """Return the number of registered filters."""
         return len(self._filters)
 
     def __repr__(self) -> str:
         return f"<FilterManager: {len(self._filters)} filters>"
+
+
+def _screen_chunk(
+    filters: List[Tuple[str, BaseFilter]],
+    chunk: List[Candidate],
+    collect_stats: bool
+) -> Tuple[List[int], Optional[ScreeningStats]]:
+    """
+    Worker task for FilterManager.apply_parallel().
+
+    Args:
+        filters: (name, filter) pairs of the parent manager
+        chunk: Candidates to screen
+        collect_stats: Whether to collect ScreeningStats
+
+    Returns:
+        Tuple of (positions in chunk that passed, statistics or None)
+    """
+    manager = FilterManager()
+    for name, filter_instance in filters:
+        manager.add_filter(filter_instance, name=name)
+    stats = ScreeningStats() if collect_stats else None
+    manager.set_stats(stats)
+    passed = {id(candidate) for candidate in manager.apply_all(chunk)}
+    return [position for position, candidate in enumerate(chunk) if id(candidate) in passed], stats
+
+
+def _until(candidates: Iterable[Candidate], deadline: float) -> Iterator[Candidate]:
+    """Yield candidates until a time.monotonic() deadline has passed."""
+    for candidate in candidates:
+        if time.monotonic() >= deadline:
+            return
+        yield candidate
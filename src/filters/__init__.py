@@ -3,3 +3,8 @@ from .age_filter import AgeFilter
 from .experience_filter import ExperienceFilter
 from .location_filter import LocationFilter
 from .background_filter import BackgroundFilter
+from .skill_filter import SkillFilter
+from .language_filter import LanguageFilter
+from .position_filter import PositionFilter
+from .suppression_filter import SuppressionFilter
+from .expression import FilterExpression, AndFilter, OrFilter, NotFilter
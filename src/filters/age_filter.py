@@ -12,6 +12,8 @@ class AgeFilter(BaseFilter):
     Default range: 20-40 years old.
     """
 
+    required_fields = ("age",)
+
     def __init__(self, min_age: int = 20, max_age: int = 40):
         """
         Initialize the age filter.
@@ -14,6 +14,8 @@ class BackgroundFilter(BaseFilter):
     and must NOT have background in excluded regions (India/Middle East).
     """
 
+    required_fields = ("education_background", "work_background")
+
     def __init__(
         self,
         preferred_backgrounds: List[str] = None,
@@ -1,7 +1,9 @@
 """Base filter class for the extensible filter system."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Hashable, List, Optional, Sequence, Tuple
+
+from ..candidate import DETAIL_FIELDS
 
 if TYPE_CHECKING:
     from ..candidate import Candidate
@@ -15,13 +17,19 @@ class BaseFilter(ABC):
     1. Inherit from BaseFilter
     2. Implement the apply() method
     3. Optionally override the name property
+    4. Optionally set required_fields to the candidate fields it reads
 
     Example:
         class MyCustomFilter(BaseFilter):
+            required_fields = ("some_field",)
+
             def apply(self, candidate: Candidate) -> bool:
                 return candidate.some_field == some_value
     """
 
+    # Candidate fields read by apply(); None means unknown (assume all)
+    required_fields: Optional[Tuple[str, ...]] = None
+
     @property
     def name(self) -> str:
         """
@@ -33,6 +41,56 @@ class BaseFilter(ABC):
             return class_name[:-6]
         return class_name
 
+    @property
+    def needs_detail(self) -> bool:
+        """
+        Whether the filter reads fields that require a full profile fetch.
+        """
+        if self.required_fields is None:
+            return True
+        return any(f in DETAIL_FIELDS for f in self.required_fields)
+
+    @property
+    def cost(self) -> float:
+        """
+        Relative evaluation cost, used to order filters cheapest first.
+        Filters needing a full profile fetch are considered expensive.
+        """
+        return 10.0 if self.needs_detail else 1.0
+
+    @property
+    def cache_key(self) -> Hashable:
+        """
+        Structural identity of the filter: its class and public parameters.
+
+        Two filters with equal keys give the same verdict for any candidate,
+        which lets shared subexpressions be evaluated once.
+        """
+        params = tuple(sorted(
+            (key, _freeze(value))
+            for key, value in vars(self).items()
+            if not key.startswith("_")
+        ))
+        return (self.__class__.__qualname__, params)
+
+    def leaves(self) -> List["BaseFilter"]:
+        """
+        Return the leaf filters of this filter (itself for plain filters).
+        """
+        return [self]
+
+    def prepare(self, candidates: Sequence["Candidate"]) -> None:
+        """
+        Optional hook called once with the whole collection before filtering.
+
+        Filters can override this to build per-collection indexes. It is
+        only called when the candidates are a sequence, not a stream.
+
+        Args:
+            candidates: The candidate collection about to be filtered
+        """
+        pass
+
     @abstractmethod
     def apply(self, candidate: "Candidate") -> bool:
         """
@@ -48,3 +106,20 @@ class BaseFilter(ABC):
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}>"
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a filter parameter to a hashable value for cache_key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, BaseFilter):
+        return value.cache_key
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
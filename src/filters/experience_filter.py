@@ -12,6 +12,8 @@ class ExperienceFilter(BaseFilter):
     Default range: 1-3 years.
     """
 
+    required_fields = ("experience_years",)
+
     def __init__(self, min_years: float = 1.0, max_years: float = 3.0):
         """
         Initialize the experience filter.
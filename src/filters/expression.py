@@ -0,0 +1,251 @@
+"""Composable boolean filter expressions (And / Or / Not)."""
+
+from abc import abstractmethod
+from collections import Counter
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .base_filter import BaseFilter
+from ..candidate import Candidate
+
+
+def _as_filter(node) -> BaseFilter:
+    """Accept filters as-is and convert nested FilterManagers to filters."""
+    if isinstance(node, BaseFilter):
+        return node
+    if hasattr(node, "as_filter"):
+        return node.as_filter()
+    raise TypeError(f"Expected a BaseFilter or FilterManager, got {node!r}")
+
+
+class FilterExpression(BaseFilter):
+    """
+    Base class for composite filters built from other filters.
+
+    When an expression is applied, any subexpression that occurs more than
+    once in the tree (by cache_key) is evaluated at most once per candidate.
+    Children of And/Or nodes are evaluated cheapest first.
+    """
+
+    def __init__(self, *children):
+        """
+        Initialize the expression.
+
+        Args:
+            children: Child filters, expressions or FilterManagers
+        """
+        self.children: Tuple[BaseFilter, ...] = tuple(_as_filter(c) for c in children)
+        self._order = sorted(self.children, key=lambda child: child.cost)
+        self._shared = self._find_shared()
+
+    @property
+    def required_fields(self) -> Optional[Tuple[str, ...]]:
+        """Union of the fields read by all children (None if any unknown)."""
+        fields: List[str] = []
+        for child in self.children:
+            if child.required_fields is None:
+                return None
+            fields.extend(f for f in child.required_fields if f not in fields)
+        return tuple(fields)
+
+    @property
+    def cost(self) -> float:
+        """Worst-case cost: the sum of all children's costs."""
+        return sum(child.cost for child in self.children)
+
+    @property
+    def cache_key(self) -> Hashable:
+        return (self.__class__.__qualname__, tuple(child.cache_key for child in self.children))
+
+    def leaves(self) -> List[BaseFilter]:
+        """Return all leaf filters, depth first."""
+        return [leaf for child in self.children for leaf in child.leaves()]
+
+    def leaf_names(self) -> List[str]:
+        """
+        Return a unique name for each leaf, in leaves() order.
+
+        Repeated names get a numeric suffix ("Location", "Location_2").
+        """
+        names: List[str] = []
+        for leaf in self.leaves():
+            name = leaf.name
+            suffix = 2
+            while name in names:
+                name = f"{leaf.name}_{suffix}"
+                suffix += 1
+            names.append(name)
+        return names
+
+    def explain(self, candidate: Candidate) -> List[str]:
+        """
+        List the leaves that decided a candidate's rejection.
+
+        The tree is walked from the root, following only children whose
+        verdict produced their parent's verdict: the rejecting children
+        of an And, every child of a rejecting Or, the child of a Not.
+        For Or(A, B), A is not reported when the candidate passes B.
+        Shared subexpressions are evaluated once, as in apply().
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            leaf_names() entries of the deciding leaves (empty if the
+            expression passes)
+        """
+        memo: Optional[Dict[Hashable, bool]] = {} if self._shared else None
+        verdicts: Dict[int, bool] = {}
+
+        def verdict(node: BaseFilter) -> bool:
+            if id(node) not in verdicts:
+                verdicts[id(node)] = evaluate_node(node, candidate, memo, self._shared)
+            return verdicts[id(node)]
+
+        if verdict(self):
+            return []
+
+        names = iter(self.leaf_names())
+        deciding: List[str] = []
+
+        def walk(node: BaseFilter, decides: bool) -> None:
+            if not isinstance(node, FilterExpression):
+                name = next(names)
+                if decides:
+                    deciding.append(name)
+                return
+            for child in node.children:
+                # A Not's child decides with the opposite verdict
+                walk(child, decides and (
+                    isinstance(node, NotFilter) or verdict(child) == verdict(node)
+                ))
+
+        walk(self, True)
+        return deciding
+
+    def prepare(self, candidates: Sequence[Candidate]) -> None:
+        """Forward the prepare hook to every child."""
+        for child in self.children:
+            child.prepare(candidates)
+
+    def apply(self, candidate: Candidate) -> bool:
+        """
+        Evaluate the expression for a candidate.
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            True if the candidate satisfies the expression
+        """
+        return self.evaluate(candidate, {} if self._shared else None, self._shared)
+
+    @abstractmethod
+    def evaluate(
+        self,
+        candidate: Candidate,
+        memo: Optional[Dict[Hashable, bool]],
+        shared: Dict[int, Hashable]
+    ) -> bool:
+        """
+        Evaluate with a per-candidate memo of shared subexpressions.
+
+        Args:
+            candidate: The candidate to evaluate
+            memo: Verdicts of shared subexpressions for this candidate
+            shared: id() -> cache_key of nodes whose key occurs more than
+                once in the root tree
+
+        Returns:
+            True if the candidate satisfies the expression
+        """
+        pass
+
+    def _find_shared(self) -> Dict[int, Hashable]:
+        """Map id() -> cache_key for nodes whose key occurs more than once."""
+        keys: Dict[int, Hashable] = {}
+        nodes: List[BaseFilter] = []
+        stack: List[BaseFilter] = list(self.children)
+        while stack:
+            node = stack.pop()
+            keys[id(node)] = node.cache_key
+            nodes.append(node)
+            if isinstance(node, FilterExpression):
+                stack.extend(node.children)
+        counts = Counter(keys[id(node)] for node in nodes)
+        return {
+            id(node): keys[id(node)]
+            for node in nodes
+            if counts[keys[id(node)]] > 1
+        }
+
+    def __repr__(self) -> str:
+        inner = ", ".join(repr(child) for child in self.children)
+        return f"<{self.__class__.__name__}: {inner}>"
+
+
+def evaluate_node(
+    node: BaseFilter,
+    candidate: Candidate,
+    memo: Optional[Dict[Hashable, bool]],
+    shared: Dict[int, Hashable]
+) -> bool:
+    """
+    Evaluate any filter node, reusing memoized verdicts where shared.
+
+    Args:
+        node: Filter or expression to evaluate
+        candidate: The candidate to evaluate
+        memo: Verdicts of shared subexpressions for this candidate
+        shared: id() -> cache_key of shared nodes in the root tree
+
+    Returns:
+        The node's verdict for the candidate
+    """
+    key = shared.get(id(node)) if memo is not None else None
+    if key is not None:
+        verdict = memo.get(key)
+        if verdict is not None:
+            return verdict
+    if isinstance(node, FilterExpression):
+        verdict = node.evaluate(candidate, memo, shared)
+    else:
+        verdict = node.apply(candidate)
+    if key is not None:
+        memo[key] = verdict
+    return verdict
+
+
+class AndFilter(FilterExpression):
+    """Passes if every child passes (stops at the first rejection)."""
+
+    def evaluate(self, candidate, memo, shared) -> bool:
+        for child in self._order:
+            if not evaluate_node(child, candidate, memo, shared):
+                return False
+        return True
+
+
+class OrFilter(FilterExpression):
+    """Passes if any child passes (stops at the first acceptance)."""
+
+    def evaluate(self, candidate, memo, shared) -> bool:
+        for child in self._order:
+            if evaluate_node(child, candidate, memo, shared):
+                return True
+        return False
+
+
+class NotFilter(FilterExpression):
+    """Passes if its single child rejects."""
+
+    def __init__(self, child):
+        """
+        Initialize the negation.
+
+        Args:
+            child: Filter, expression or FilterManager to negate
+        """
+        super().__init__(child)
+
+    def evaluate(self, candidate, memo, shared) -> bool:
+        return not evaluate_node(self.children[0], candidate, memo, shared)
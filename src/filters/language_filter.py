@@ -0,0 +1,13 @@
+"""Language filter implementation."""
+
+from .skill_filter import SkillFilter
+
+
+class LanguageFilter(SkillFilter):
+    """
+    Filter candidates by a boolean query over spoken languages.
+
+    Example query: "English AND (Mandarin OR Cantonese)"
+    """
+
+    field = "languages"
@@ -4,6 +4,7 @@ from typing import List
 
 from .base_filter import BaseFilter
 from ..candidate import Candidate
+from ..location_normalizer import LocationNormalizer, default_normalizer
 
 
 class LocationFilter(BaseFilter):
@@ -12,18 +13,34 @@ class LocationFilter(BaseFilter):
 
     Excludes candidates from specified locations.
     Default excluded location: Sydney.
+
+    Locations are compared by canonical id, so "Sydney NSW",
+    "Greater Sydney Area" and "sydney, australia" all match "Sydney".
     """
 
-    def __init__(self, excluded_locations: List[str] = None):
+    required_fields = ("location",)
+
+    def __init__(
+        self,
+        excluded_locations: List[str] = None,
+        normalizer: LocationNormalizer = None
+    ):
         """
         Initialize the location filter.
 
         Args:
             excluded_locations: List of locations to exclude (case-insensitive)
+            normalizer: Location normalizer (defaults to the shared one)
         """
         if excluded_locations is None:
             excluded_locations = ["Sydney"]
+        if normalizer is None:
+            normalizer = default_normalizer
         self.excluded_locations = [loc.lower() for loc in excluded_locations]
+        self.normalizer = normalizer
+        self._excluded_ids = frozenset(
+            normalizer.normalize(loc) for loc in excluded_locations
+        )
 
     def apply(self, candidate: Candidate) -> bool:
         """
@@ -33,9 +50,9 @@ class LocationFilter(BaseFilter):
             candidate: The candidate to evaluate
 
         Returns:
-            True if candidate's location is NOT in the excluded list
+            True if candidate's canonical location is NOT in the excluded set
         """
-        return candidate.location.lower() not in self.excluded_locations
+        return self.normalizer.normalize(candidate.location) not in self._excluded_ids
 
     def __repr__(self) -> str:
         return f"<LocationFilter: excludes {self.excluded_locations}>"
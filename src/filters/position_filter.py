@@ -0,0 +1,48 @@
+"""Position filter implementation."""
+
+from typing import List
+
+from .base_filter import BaseFilter
+from ..candidate import Candidate
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a job title (case and whitespace)."""
+    return " ".join(title.lower().split())
+
+
+class PositionFilter(BaseFilter):
+    """
+    Filter candidates by current position.
+
+    A candidate passes if their current title contains any of the target
+    titles (case-insensitive), e.g. "Senior Compliance Advisor" matches
+    "Compliance Advisor".
+    """
+
+    required_fields = ("current_position",)
+
+    def __init__(self, positions: List[str]):
+        """
+        Initialize the position filter.
+
+        Args:
+            positions: Target position titles
+        """
+        self.positions = [normalize_title(p) for p in positions]
+
+    def apply(self, candidate: Candidate) -> bool:
+        """
+        Check if candidate's current position matches a target title.
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            True if the current position contains one of the target titles
+        """
+        title = normalize_title(candidate.current_position)
+        return any(position in title for position in self.positions)
+
+    def __repr__(self) -> str:
+        return f"<PositionFilter: {self.positions}>"
@@ -0,0 +1,88 @@
+"""Skill filter implementation."""
+
+from typing import Optional, Sequence
+
+from .base_filter import BaseFilter
+from ..candidate import Candidate
+from ..skill_index import (
+    SkillIndex,
+    bitmap_positions,
+    evaluate_on_set,
+    normalize_skill,
+    parse_skill_query
+)
+
+
+class SkillFilter(BaseFilter):
+    """
+    Filter candidates by a boolean skill query.
+
+    Example query: "Compliance AND (Mandarin OR Cantonese)"
+
+    When the filter is prepared with a candidate collection, the query is
+    answered once for the whole collection from an inverted SkillIndex;
+    apply() then only looks up the candidate's position. Candidates that
+    were not indexed fall back to evaluating the query on their own list.
+    """
+
+    field = "skills"
+
+    def __init__(self, query: str):
+        """
+        Initialize the skill filter.
+
+        Args:
+            query: Boolean query over skill names (AND / OR / NOT / parentheses)
+        """
+        self.query = query
+        self.required_fields = (self.field,)
+        self._node = parse_skill_query(query)
+        self._index: Optional[SkillIndex] = None
+        self._indexed_size = 0
+        self._matched = bytearray()
+
+    def prepare(self, candidates: Sequence[Candidate]) -> None:
+        """
+        Build the inverted index for a collection and answer the query.
+
+        The index is rebuilt only when a different collection is passed.
+
+        Args:
+            candidates: The candidate collection about to be filtered
+        """
+        index = self._index
+        if index is not None and index.candidates is candidates and self._indexed_size == len(candidates):
+            return
+        self._index = SkillIndex(candidates, field=self.field)
+        self._indexed_size = len(candidates)
+        self._matched = bytearray(len(candidates))
+        for position in bitmap_positions(self._index.query(self._node)):
+            self._matched[position] = 1
+
+    def __getstate__(self) -> dict:
+        """Pickle without the per-collection index (rebuilt by prepare())."""
+        state = self.__dict__.copy()
+        state["_index"] = None
+        state["_indexed_size"] = 0
+        state["_matched"] = bytearray()
+        return state
+
+    def apply(self, candidate: Candidate) -> bool:
+        """
+        Check if candidate matches the query.
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            True if the candidate's values satisfy the query
+        """
+        if self._index is not None:
+            position = self._index.position_of(candidate)
+            if position >= 0:
+                return bool(self._matched[position])
+        values = {normalize_skill(v) for v in getattr(candidate, self.field)}
+        return evaluate_on_set(self._node, values)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.query}>"
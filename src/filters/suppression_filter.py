@@ -0,0 +1,51 @@
+"""Suppression filter implementation."""
+
+from typing import Hashable
+
+from .base_filter import BaseFilter
+from ..candidate import Candidate
+from ..suppression_list import SuppressionList
+
+
+class SuppressionFilter(BaseFilter):
+    """
+    Exclude candidates on a suppression list (already contacted or rejected).
+
+    Candidates are matched by normalized LinkedIn URL or email. Email is a
+    detail field, so this filter runs after the summary-field filters.
+    """
+
+    required_fields = ("linkedin_url", "email")
+
+    def __init__(self, suppression_list: SuppressionList):
+        """
+        Initialize the suppression filter.
+
+        Args:
+            suppression_list: The list of suppressed URLs and emails
+        """
+        self.suppression_list = suppression_list
+
+    @property
+    def cache_key(self) -> Hashable:
+        # The list grows between runs; cached verdicts from a smaller list are stale
+        return (
+            self.__class__.__qualname__,
+            self.suppression_list.path,
+            len(self.suppression_list)
+        )
+
+    def apply(self, candidate: Candidate) -> bool:
+        """
+        Check if candidate is NOT on the suppression list.
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            True if neither the candidate's URL nor email is suppressed
+        """
+        return not self.suppression_list.is_suppressed(candidate)
+
+    def __repr__(self) -> str:
+        return f"<SuppressionFilter: {self.suppression_list.path} ({len(self.suppression_list)} entries)>"
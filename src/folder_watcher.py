@@ -0,0 +1,192 @@
+"""Incremental ingestion of candidate files dropped into a directory."""
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Tuple
+
+from .candidate import Candidate
+from .loader import load_candidates, load_candidates_from_offset
+
+
+# Extensions picked up from the watched directory
+WATCHED_EXTENSIONS = (".jsonl", ".ndjson", ".json")
+
+# Bytes before the processed offset used to detect a rewritten file
+_TAIL_BYTES = 4096
+
+
+@dataclass
+class FileState:
+    """
+    What has been ingested from one file.
+
+    Attributes:
+        size: File size when last processed
+        mtime_ns: Modification time when last processed
+        offset: Bytes consumed (complete JSON Lines records)
+        tail_digest: Hash of the bytes just before offset
+        records: Records read from the file so far
+        passed: Records that passed all filters so far
+    """
+    size: int = 0
+    mtime_ns: int = 0
+    offset: int = 0
+    tail_digest: str = ""
+    records: int = 0
+    passed: int = 0
+
+
+def _tail_digest(filepath: str, offset: int) -> str:
+    """Hash up to _TAIL_BYTES bytes ending at offset."""
+    start = max(0, offset - _TAIL_BYTES)
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        data = f.read(offset - start)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class FolderWatcher:
+    """
+    Tracks which candidate files in a directory still need processing.
+
+    A file is pending when it is new or its size/mtime changed since it
+    was last processed, and it has not been modified for settle_seconds
+    (so files still being copied in are left alone). For JSON Lines files
+    that only grew, just the records after the processed offset are read;
+    a file that was rewritten (the bytes before the offset changed) or a
+    .json file is read again in full.
+
+    Progress is kept in a JSON state file, saved after every file, so a
+    restarted watcher skips files that were already completed.
+    """
+
+    def __init__(self, directory: str, state_path: str, settle_seconds: float = 2.0):
+        """
+        Initialize the watcher.
+
+        Args:
+            directory: Directory to watch
+            state_path: JSON file storing per-file progress
+            settle_seconds: Minimum age of the last modification before a
+                file is processed
+        """
+        self.directory = directory
+        self.state_path = state_path
+        self.settle_seconds = settle_seconds
+        self.files: Dict[str, FileState] = self._load_state()
+
+    def pending(self) -> List[str]:
+        """
+        List files that are new or changed since they were last processed.
+
+        Returns:
+            File names (relative to the directory), oldest first
+        """
+        if not os.path.isdir(self.directory):
+            return []
+
+        now = time.time()
+        pending: List[Tuple[int, str]] = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or not entry.name.endswith(WATCHED_EXTENSIONS):
+                continue
+            stat = entry.stat()
+            if now - stat.st_mtime < self.settle_seconds:
+                continue
+            state = self.files.get(entry.name)
+            if state is None or (state.size, state.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                pending.append((stat.st_mtime_ns, entry.name))
+        return [name for _, name in sorted(pending)]
+
+    def read(self, name: str) -> Tuple[List[Candidate], FileState]:
+        """
+        Read the unprocessed records of a pending file.
+
+        The returned state is not saved until mark_done() is called.
+
+        Args:
+            name: File name returned by pending()
+
+        Returns:
+            Tuple of (new candidates, updated file state)
+        """
+        filepath = os.path.join(self.directory, name)
+        stat = os.stat(filepath)
+        previous = self.files.get(name)
+
+        if name.endswith(".json"):
+            candidates = list(load_candidates(filepath))
+            state = FileState(offset=stat.st_size)
+        else:
+            offset = 0
+            state = FileState()
+            if (
+                previous is not None
+                and previous.offset <= stat.st_size
+                and _tail_digest(filepath, previous.offset) == previous.tail_digest
+            ):
+                offset = previous.offset
+                state.records = previous.records
+                state.passed = previous.passed
+            candidates, state.offset = load_candidates_from_offset(filepath, offset)
+            state.tail_digest = _tail_digest(filepath, state.offset)
+
+        state.size = stat.st_size
+        state.mtime_ns = stat.st_mtime_ns
+        state.records += len(candidates)
+        return candidates, state
+
+    def mark_done(self, name: str, state: FileState, passed: int) -> None:
+        """
+        Record a file as processed and persist the state.
+
+        Args:
+            name: File name
+            state: State returned by read()
+            passed: Number of the new records that passed the filters
+        """
+        state.passed += passed
+        self.files[name] = state
+        self._save_state()
+
+    def mark_failed(self, name: str) -> None:
+        """
+        Record a file that could not be read, so it is retried only after it changes.
+
+        Args:
+            name: File name
+        """
+        stat = os.stat(os.path.join(self.directory, name))
+        state = self.files.get(name) or FileState()
+        state.size = stat.st_size
+        state.mtime_ns = stat.st_mtime_ns
+        self.files[name] = state
+        self._save_state()
+
+    def _load_state(self) -> Dict[str, FileState]:
+        """Read the state file (empty if missing)."""
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, encoding="utf-8") as f:
+            data = json.load(f)
+        return {name: FileState(**state) for name, state in data.get("files", {}).items()}
+
+    def _save_state(self) -> None:
+        """Write the state file atomically."""
+        directory = os.path.dirname(self.state_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        temp_path = self.state_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "directory": os.path.abspath(self.directory),
+                    "files": {name: asdict(state) for name, state in self.files.items()},
+                },
+                f,
+                indent=2
+            )
+        os.replace(temp_path, self.state_path)
@@ -1,9 +1,106 @@
 """LinkedIn API client (placeholder for future integration)."""
 
-from typing import List, Optional, Dict, Any
+import json
+import threading
+import time
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Dict, Any
 from abc import ABC, abstractmethod
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode, urlsplit
+from urllib.request import Request, urlopen
 
-from .candidate import Candidate
+from .candidate import Candidate, LazyCandidate
+
+
+# Maximum number of profiles per bulk "GET /people?ids=List(...)" request
+PROFILE_BATCH_SIZE = 50
+
+# Hits requested per page of "GET /search/people"
+SEARCH_PAGE_SIZE = 25
+
+# Base delay and cap (seconds) for retrying throttled or failed requests
+RETRY_BACKOFF = 0.1
+MAX_RETRY_DELAY = 5.0
+
+
+@dataclass
+class ProfileRequestStats:
+    """
+    Counters for profile lookups made through get_profiles().
+
+    Attributes:
+        requested: URLs passed in by callers (including duplicates)
+        unique: Distinct URLs after normalization
+        coalesced: URLs served by another caller's in-flight request
+        network_calls: HTTP requests actually made
+    """
+    requested: int = 0
+    unique: int = 0
+    coalesced: int = 0
+    network_calls: int = 0
+
+    @property
+    def saved(self) -> int:
+        """Number of requests avoided compared to one call per URL."""
+        return self.requested - self.network_calls
+
+
+@dataclass
+class ProfileValidator:
+    """
+    Cache validators remembered for a fetched profile.
+
+    Attributes:
+        etag: ETag header of the last full response
+        last_modified: Last-Modified header of the last full response
+        fingerprint: Content fingerprint of the parsed Candidate
+    """
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fingerprint: str = ""
+
+
+@dataclass
+class ProfileRefresh:
+    """
+    Result of refreshing a set of tracked profiles.
+
+    Attributes:
+        changed: Candidates that are new or whose content changed
+        unchanged: URLs whose profiles are unchanged since the last fetch
+        missing: URLs that could not be fetched (removed or failed)
+    """
+    changed: List[Candidate] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ApiResponse:
+    """
+    Raw HTTP response from the LinkedIn API.
+
+    Attributes:
+        status: HTTP status code
+        body: Raw response body
+        headers: Response headers
+    """
+    status: int
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is 2xx."""
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        """Decode the response body as JSON."""
+        return json.loads(self.body) if self.body else None
 
 
 class LinkedInClientBase(ABC):
@@ -30,7 +127,8 @@ class LinkedInClientBase(ABC):
         keywords: List[str],
         locations: Optional[List[str]] = None,
         industries: Optional[List[str]] = None,
-        limit: int = 100
+        limit: int = 100,
+        excluded_locations: Optional[List[str]] = None
     ) -> List[Candidate]:
         """
         Search for candidates on LinkedIn.
@@ -40,6 +138,7 @@ class LinkedInClientBase(ABC):
             locations: Filter by locations
             industries: Filter by industries
             limit: Maximum number of results
+            excluded_locations: Locations to exclude from the results
 
         Returns:
             List of Candidate objects
@@ -64,21 +163,24 @@ class LinkedInClient(LinkedInClientBase):
     """
     LinkedIn API client implementation.
 
-    NOTE: This is a placeholder implementation.
-    Replace with actual LinkedIn Business API integration when ready.
+    NOTE: OAuth is not implemented yet; requests are sent with the
+    configured access token. Point base_url at a MockLinkedInServer
+    (src/mock_linkedin_server.py) to exercise the client locally.
 
     To integrate with LinkedIn:
     1. Register your app at https://www.linkedin.com/developers/
     2. Obtain API credentials (client_id, client_secret)
     3. Implement OAuth 2.0 authentication
-    4. Replace placeholder methods with actual API calls
     """
 
     def __init__(
         self,
         api_key: str = "",
         api_secret: str = "",
-        access_token: str = ""
+        access_token: str = "",
+        base_url: str = "https://api.linkedin.com/v2",
+        max_retries: int = 3,
+        timeout: float = 10.0
     ):
         """
         Initialize the LinkedIn client.
@@ -87,12 +189,23 @@ class LinkedInClient(LinkedInClientBase):
             api_key: LinkedIn API key (client_id)
             api_secret: LinkedIn API secret (client_secret)
             access_token: OAuth access token
+            base_url: API base URL
+            max_retries: Retries for throttled (429) or failed (5xx) requests
+            timeout: Per-request timeout in seconds
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.access_token = access_token
-        self.base_url = "https://api.linkedin.com/v2"
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.retries = 0
         self._authenticated = False
+        self.batch_size = PROFILE_BATCH_SIZE
+        self.stats = ProfileRequestStats()
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._validators: Dict[str, ProfileValidator] = {}
 
     def authenticate(self) -> bool:
         """
@@ -120,38 +233,269 @@ class LinkedInClient(LinkedInClientBase):
         keywords: List[str],
         locations: Optional[List[str]] = None,
         industries: Optional[List[str]] = None,
-        limit: int = 100
+        limit: int = 100,
+        excluded_locations: Optional[List[str]] = None
     ) -> List[Candidate]:
         """
         Search for candidates on LinkedIn.
 
-        TODO: Implement using LinkedIn Recruiter API or People Search API
+        Results are paged through until `limit` hits have been collected.
+        Hits are returned as LazyCandidate objects, so detail fields are
+        only fetched for candidates that pass the cheap filters.
 
-        Example API endpoint:
+        API endpoint:
             GET /search/people
             ?keywords={keywords}
             &location={location}
+            &excludedLocation={excluded_location}
             &industry={industry}
+            &start={start}&count={count}
+        """
+        return list(self.iter_search_candidates(
+            keywords,
+            locations=locations,
+            industries=industries,
+            limit=limit,
+            excluded_locations=excluded_locations
+        ))
+
+    def iter_search_candidates(
+        self,
+        keywords: List[str],
+        locations: Optional[List[str]] = None,
+        industries: Optional[List[str]] = None,
+        limit: int = 100,
+        excluded_locations: Optional[List[str]] = None
+    ) -> Iterator[Candidate]:
         """
-        print(f"LinkedIn search not implemented - keywords: {keywords}")
-        print("Using mock data instead")
+        Stream search results, requesting each page only when it is reached.
 
-        # Return empty list - use mock_data module for testing
-        return []
+        Stop iterating (e.g. FilterManager.apply_all(..., limit=N)) and no
+        further pages are requested.
+
+        Args:
+            keywords: Keywords to search for (job titles, skills)
+            locations: Filter by locations
+            industries: Filter by industries
+            limit: Maximum number of results
+            excluded_locations: Locations to exclude from the results
+
+        Yields:
+            LazyCandidate objects in search order
+        """
+        params: Dict[str, Any] = {"keywords": ",".join(keywords)}
+        if locations:
+            params["location"] = ",".join(locations)
+        if excluded_locations:
+            params["excludedLocation"] = ",".join(excluded_locations)
+        if industries:
+            params["industry"] = ",".join(industries)
+
+        returned = 0
+        start = 0
+        while returned < limit:
+            count = min(SEARCH_PAGE_SIZE, limit - returned)
+            page = self._make_api_request(
+                "search/people", params={**params, "start": start, "count": count}
+            )
+            if not page:
+                break
+            elements = page.get("elements", [])
+            for hit in elements[:limit - returned]:
+                yield self._candidate_from_search_hit(hit)
+                returned += 1
+            start += len(elements)
+            if not elements or start >= page.get("paging", {}).get("total", 0):
+                break
 
     def get_profile(self, linkedin_url: str) -> Optional[Candidate]:
         """
         Get detailed profile information.
 
-        TODO: Implement using LinkedIn Profile API
+        Goes through get_profiles(), so concurrent lookups of the same
+        profile share one request.
+        """
+        return self.get_profiles([linkedin_url])[linkedin_url]
+
+    def get_profiles(self, linkedin_urls: List[str]) -> Dict[str, Optional[Candidate]]:
+        """
+        Get detailed profile information for many candidates at once.
+
+        URLs are normalized and deduplicated, fetched in bulk requests of
+        up to batch_size profiles, and any URL already being fetched by
+        another thread is waited on instead of requested again.
+
+        Args:
+            linkedin_urls: LinkedIn profile URLs (duplicates allowed)
+
+        Returns:
+            Mapping of each input URL to its Candidate (None if not found)
+        """
+        keys = {url: normalize_linkedin_url(url) for url in linkedin_urls}
+        unique_keys = list(dict.fromkeys(keys.values()))
+
+        owned: Dict[str, Future] = {}
+        waiting: Dict[str, Future] = {}
+        with self._inflight_lock:
+            self.stats.requested += len(linkedin_urls)
+            self.stats.unique += len(unique_keys)
+            for key in unique_keys:
+                future = self._inflight.get(key)
+                if future is not None:
+                    waiting[key] = future
+                    self.stats.coalesced += 1
+                else:
+                    future = Future()
+                    self._inflight[key] = future
+                    owned[key] = future
+
+        try:
+            pending = list(owned)
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start:start + self.batch_size]
+                profiles = self._fetch_profiles_batch(batch)
+                for key in batch:
+                    owned[key].set_result(profiles.get(key))
+        except BaseException as error:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(error)
+            raise
+        finally:
+            with self._inflight_lock:
+                for key in owned:
+                    self._inflight.pop(key, None)
+
+        results = {key: future.result() for key, future in owned.items()}
+        for key, future in waiting.items():
+            results[key] = future.result()
+        return {url: results[key] for url, key in keys.items()}
+
+    def _fetch_profiles_batch(self, keys: List[str]) -> Dict[str, Optional[Candidate]]:
+        """
+        Fetch a batch of profiles with a single API request.
+
+        Args:
+            keys: Normalized LinkedIn URLs
+
+        Returns:
+            Mapping of normalized URL to Candidate (missing if not found)
 
-        Example API endpoint:
+        Example API endpoints:
             GET /people/(id:{person_id})
-            or
-            GET /people/~  (for authenticated user)
+            GET /people?ids=List((id:{id1}),(id:{id2}))
         """
-        print(f"LinkedIn profile fetch not implemented - URL: {linkedin_url}")
-        return None
+        ids = {_profile_id(key): key for key in keys}
+        with self._inflight_lock:
+            self.stats.network_calls += 1
+
+        etags: Dict[str, str] = {}
+        last_modified: Dict[str, str] = {}
+        if len(keys) == 1:
+            profile_id = next(iter(ids))
+            response = self._send_request(f"people/(id:{profile_id})")
+            ok = response is not None and response.ok
+            elements = {profile_id: response.json()} if ok else {}
+            if ok:
+                etags = {profile_id: response.headers.get("ETag")}
+                last_modified = {profile_id: response.headers.get("Last-Modified")}
+        else:
+            id_list = ",".join(f"(id:{profile_id})" for profile_id in ids)
+            data = self._make_api_request("people", params={"ids": f"List({id_list})"})
+            elements = data.get("results", {}) if data else {}
+            # Bulk responses carry validators per element, not in the headers
+            etags = data.get("etags", {}) if data else {}
+            last_modified = data.get("lastModified", {}) if data else {}
+
+        profiles = {}
+        for profile_id, profile in elements.items():
+            if profile_id not in ids:
+                continue
+            candidate = _candidate_from_profile(profile)
+            self._validators[ids[profile_id]] = ProfileValidator(
+                etag=etags.get(profile_id),
+                last_modified=last_modified.get(profile_id),
+                fingerprint=candidate.fingerprint()
+            )
+            profiles[ids[profile_id]] = candidate
+        return profiles
+
+    def _candidate_from_search_hit(self, hit: Dict[str, Any]) -> LazyCandidate:
+        """
+        Build a lazily hydrated candidate from a search result.
+
+        Args:
+            hit: A single element of a people search response
+
+        Returns:
+            LazyCandidate whose detail fields are fetched via get_profile()
+        """
+        return LazyCandidate(loader=self.get_profile, **_summary_fields(hit))
+
+    def refresh_profiles(self, linkedin_urls: List[str]) -> ProfileRefresh:
+        """
+        Re-fetch tracked profiles and report which ones changed.
+
+        Each request carries the stored ETag/Last-Modified validators, so
+        unchanged profiles come back as 304 and are neither downloaded nor
+        parsed. Profiles returned in full are only reported as changed if
+        their content fingerprint differs from the stored one.
+
+        Args:
+            linkedin_urls: LinkedIn profile URLs to refresh
+
+        Returns:
+            ProfileRefresh with changed candidates and unchanged/missing URLs
+        """
+        refresh = ProfileRefresh()
+        for url in dict.fromkeys(normalize_linkedin_url(u) for u in linkedin_urls):
+            validator = self._validators.get(url)
+            headers = {}
+            if validator is not None and validator.etag:
+                headers["If-None-Match"] = validator.etag
+            if validator is not None and validator.last_modified:
+                headers["If-Modified-Since"] = validator.last_modified
+
+            response = self._send_request(
+                f"people/(id:{_profile_id(url)})", headers=headers
+            )
+            if response is not None and response.status == 304:
+                refresh.unchanged.append(url)
+                continue
+            if response is None or not response.ok:
+                self._validators.pop(url, None)
+                refresh.missing.append(url)
+                continue
+
+            candidate = _candidate_from_profile(response.json())
+            fingerprint = candidate.fingerprint()
+            if validator is not None and validator.fingerprint == fingerprint:
+                refresh.unchanged.append(url)
+            else:
+                refresh.changed.append(candidate)
+            self._remember(url, fingerprint, response)
+
+        return refresh
+
+    def _remember(
+        self,
+        key: str,
+        fingerprint: str,
+        response: Optional[ApiResponse] = None
+    ) -> None:
+        """
+        Store the validators and content fingerprint for a profile.
+
+        Args:
+            key: Normalized LinkedIn URL
+            fingerprint: Candidate.fingerprint() of the parsed profile
+            response: The HTTP response the profile came from, if any
+        """
+        self._validators[key] = ProfileValidator(
+            etag=response.headers.get("ETag") if response else None,
+            last_modified=response.headers.get("Last-Modified") if response else None,
+            fingerprint=fingerprint
+        )
 
     def _make_api_request(
         self,
@@ -162,30 +506,180 @@ class LinkedInClient(LinkedInClientBase):
         """
         Make an authenticated API request to LinkedIn.
 
-        TODO: Implement actual HTTP requests with proper headers:
-            Authorization: Bearer {access_token}
-            X-Restli-Protocol-Version: 2.0.0
-        """
-        # Placeholder for API request implementation
-        # import requests
-        # headers = {
-        #     "Authorization": f"Bearer {self.access_token}",
-        #     "X-Restli-Protocol-Version": "2.0.0"
-        # }
-        # response = requests.request(
-        #     method,
-        #     f"{self.base_url}/{endpoint}",
-        #     headers=headers,
-        #     params=params
-        # )
-        # return response.json() if response.ok else None
+        Returns:
+            Decoded JSON body, or None if the request failed
+        """
+        response = self._send_request(endpoint, method=method, params=params)
+        return response.json() if response is not None and response.ok else None
+
+    def _send_request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[ApiResponse]:
+        """
+        Send an authenticated HTTP request to LinkedIn.
+
+        Throttled (429) and server error (5xx) responses, as well as
+        connection errors, are retried up to max_retries times with
+        exponential backoff, honouring any Retry-After header.
+
+        Args:
+            endpoint: Path relative to base_url
+            method: HTTP method
+            params: Query string parameters
+            headers: Extra request headers
+
+        Returns:
+            ApiResponse, or None if the server could not be reached
+        """
+        url = f"{self.base_url}/{endpoint}"
+        if params:
+            url += "?" + urlencode(params)
+        request_headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Restli-Protocol-Version": "2.0.0",
+            **(headers or {})
+        }
+
+        for attempt in range(self.max_retries + 1):
+            request = Request(url, method=method, headers=request_headers)
+            retry_after = None
+            try:
+                with urlopen(request, timeout=self.timeout) as raw:
+                    return ApiResponse(raw.status, raw.read(), dict(raw.headers))
+            except HTTPError as error:
+                response = ApiResponse(error.code, error.read(), dict(error.headers))
+                if error.code != 429 and error.code < 500:
+                    return response
+                retry_after = error.headers.get("Retry-After")
+            except (URLError, OSError):
+                response = None
+
+            if attempt == self.max_retries:
+                return response
+            with self._inflight_lock:
+                self.retries += 1
+            delay = RETRY_BACKOFF * (2 ** attempt)
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                delay = max(delay, server_delay)
+            time.sleep(min(delay, MAX_RETRY_DELAY))
+
         return None
 
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    Both forms allowed by RFC 9110 are accepted: a number of seconds
+    ("120") and an HTTP date ("Wed, 21 Oct 2026 07:28:00 GMT").
+
+    Args:
+        value: Header value, or None if the header was absent
+
+    Returns:
+        Seconds to wait (0 for a date in the past), or None if the value
+        is missing or unparsable
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        # RFC 9110 dates are always GMT
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def normalize_linkedin_url(url: str) -> str:
+    """
+    Normalize a LinkedIn profile URL to a canonical form.
+
+    Scheme, "www."/country subdomains, query strings, fragments, letter case
+    and trailing slashes are ignored, so all variants of one profile map to
+    "https://linkedin.com/in/<id>".
+
+    Args:
+        url: LinkedIn profile URL in any common form
+
+    Returns:
+        Canonical profile URL
+    """
+    url = url.strip()
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        host = "linkedin.com"
+    path = parts.path.rstrip("/").lower()
+    return f"https://{host}{path}"
+
+
+def _profile_id(normalized_url: str) -> str:
+    """Extract the public profile id from a normalized LinkedIn URL."""
+    return normalized_url.rsplit("/", 1)[-1]
+
+
+def _summary_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the summary fields present in both search hits and profiles.
+
+    Args:
+        data: LinkedIn search hit or profile response
+
+    Returns:
+        Keyword arguments for the summary fields of a Candidate
+    """
+    return {
+        "name": data.get("formattedName", ""),
+        "age": data.get("age", 0),
+        "experience_years": data.get("experienceYears", 0.0),
+        "location": data.get("location", {}).get("name", ""),
+        "nationality": data.get("nationality", ""),
+        "linkedin_url": data.get("publicProfileUrl", ""),
+        "current_position": data.get("headline", ""),
+    }
+
+
+def _candidate_from_profile(data: Dict[str, Any]) -> Candidate:
+    """
+    Parse a full LinkedIn profile response into a Candidate.
+
+    Args:
+        data: LinkedIn profile response
+
+    Returns:
+        Fully populated Candidate
+    """
+    return Candidate(
+        education_background=[e["country"] for e in data.get("educations", [])],
+        work_background=[p["country"] for p in data.get("positions", [])],
+        skills=[s["name"] for s in data.get("skills", [])],
+        languages=[l["name"] for l in data.get("languages", [])],
+        email=data.get("emailAddress"),
+        phone=data.get("phoneNumber"),
+        **_summary_fields(data)
+    )
+
+
 def create_linkedin_client(
     api_key: str = "",
     api_secret: str = "",
-    access_token: str = ""
+    access_token: str = "",
+    base_url: str = "https://api.linkedin.com/v2"
 ) -> LinkedInClient:
     """
     Factory function to create a LinkedIn client.
@@ -194,6 +688,7 @@ def create_linkedin_client(
         api_key: LinkedIn API key
         api_secret: LinkedIn API secret
         access_token: OAuth access token
+        base_url: API base URL
 
     Returns:
         Configured LinkedInClient instance
@@ -201,5 +696,6 @@ def create_linkedin_client(
     return LinkedInClient(
         api_key=api_key,
         api_secret=api_secret,
-        access_token=access_token
+        access_token=access_token,
+        base_url=base_url
     )
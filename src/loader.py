@@ -0,0 +1,80 @@
+"""Candidate file loading and writing (JSON / JSON Lines)."""
+
+import json
+from typing import Iterable, Iterator, List, Tuple
+
+from .candidate import Candidate
+
+
+def load_candidates(filepath: str) -> Iterator[Candidate]:
+    """
+    Stream candidates from a file.
+
+    Supported formats:
+        .jsonl / .ndjson: one Candidate.to_dict() object per line
+        .json: a list of Candidate.to_dict() objects
+
+    Args:
+        filepath: Path to the candidate file
+
+    Yields:
+        Candidate objects in file order
+    """
+    if filepath.endswith(".json"):
+        with open(filepath, encoding="utf-8") as f:
+            for data in json.load(f):
+                yield Candidate.from_dict(data)
+        return
+
+    with open(filepath, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield Candidate.from_dict(json.loads(line))
+
+
+def load_candidates_from_offset(filepath: str, offset: int = 0) -> Tuple[List[Candidate], int]:
+    """
+    Read the complete JSON Lines records after a byte offset.
+
+    A trailing line without a newline (still being written) is left for
+    the next call.
+
+    Args:
+        filepath: Path to a .jsonl / .ndjson file
+        offset: Byte offset to start reading at (must be a line start)
+
+    Returns:
+        Tuple of (candidates read, offset just past the last complete line)
+    """
+    with open(filepath, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+
+    end = data.rfind(b"\n") + 1
+    candidates = [
+        Candidate.from_dict(json.loads(line))
+        for line in data[:end].decode("utf-8").splitlines()
+        if line.strip()
+    ]
+    return candidates, offset + end
+
+
+def write_candidates(filepath: str, candidates: Iterable[Candidate]) -> int:
+    """
+    Write candidates as JSON Lines.
+
+    Args:
+        filepath: Output file path
+        candidates: Candidates to write
+
+    Returns:
+        Number of candidates written
+    """
+    count = 0
+    with open(filepath, "w", encoding="utf-8") as f:
+        for candidate in candidates:
+            f.write(json.dumps(candidate.to_dict(), ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
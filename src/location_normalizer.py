@@ -0,0 +1,137 @@
+"""Location string normalization with a precompiled alias table."""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+
+# Canonical location id -> known aliases (matched after tokenization)
+LOCATION_ALIASES: Dict[str, List[str]] = {
+    "sydney": ["sydney", "syd", "north sydney", "sydney city", "parramatta"],
+    "melbourne": ["melbourne", "melb", "mel"],
+    "brisbane": ["brisbane", "bris", "bne"],
+    "perth": ["perth"],
+    "adelaide": ["adelaide"],
+    "canberra": ["canberra", "cbr"],
+    "hobart": ["hobart"],
+    "darwin": ["darwin"],
+    "gold coast": ["gold coast"],
+}
+
+# Words and phrases that qualify a city rather than identify it
+NOISE_PHRASES = [
+    "new south wales", "victoria", "queensland", "western australia",
+    "south australia", "australian capital territory", "tasmania",
+    "northern territory", "australia",
+]
+NOISE_TOKENS = {
+    "greater", "area", "metro", "metropolitan", "region", "cbd", "city",
+    "nsw", "vic", "qld", "wa", "sa", "act", "tas", "nt", "au", "aus",
+}
+
+_NOISE_PHRASE_PATTERN = re.compile(
+    r"\b(" + "|".join(re.escape(p) for p in NOISE_PHRASES) + r")\b"
+)
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class LocationNormalizer:
+    """
+    Canonicalize raw location strings such as "Sydney NSW",
+    "Greater Sydney Area" or "sydney, australia" to a location id.
+
+    Raw strings are tokenized, qualifier words (states, "greater", "area",
+    ...) are dropped, and the remainder is looked up in a precompiled alias
+    table. Results are memoized in a bounded LRU cache, since there are far
+    fewer distinct location strings than candidates.
+    """
+
+    def __init__(
+        self,
+        aliases: Optional[Dict[str, List[str]]] = None,
+        cache_size: int = 65536
+    ):
+        """
+        Initialize the normalizer.
+
+        Args:
+            aliases: Canonical id -> aliases (defaults to LOCATION_ALIASES)
+            cache_size: Maximum number of memoized raw strings
+        """
+        if aliases is None:
+            aliases = LOCATION_ALIASES
+        self._aliases = aliases
+        self._cache_size = cache_size
+        self._alias_table: Dict[str, str] = {}
+        for canonical, names in aliases.items():
+            self._alias_table[self._clean(canonical)] = canonical
+            for name in names:
+                self._alias_table[self._clean(name)] = canonical
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+
+    def _clean(self, raw: str) -> str:
+        """Lowercase, strip qualifiers and punctuation, and rejoin tokens."""
+        text = _NOISE_PHRASE_PATTERN.sub(" ", raw.lower())
+        tokens = [t for t in _TOKEN_PATTERN.findall(text) if t not in NOISE_TOKENS]
+        return " ".join(tokens)
+
+    def _normalize(self, raw: str) -> str:
+        """
+        Canonicalize a raw location string (uncached).
+
+        Args:
+            raw: Location as it appears in the source data
+
+        Returns:
+            Canonical location id, or the cleaned string if unknown
+        """
+        cleaned = self._clean(raw)
+        canonical = self._alias_table.get(cleaned)
+        if canonical is not None:
+            return canonical
+
+        # Fall back to the longest known alias contained in the string,
+        # e.g. "sydney olympic park" -> "sydney"
+        tokens = cleaned.split()
+        for size in range(len(tokens), 0, -1):
+            for start in range(len(tokens) - size + 1):
+                canonical = self._alias_table.get(" ".join(tokens[start:start + size]))
+                if canonical is not None:
+                    return canonical
+
+        return cleaned or raw.strip().lower()
+
+    def aliases(self, location: str) -> List[str]:
+        """
+        List the known spellings of a location's canonical id.
+
+        Args:
+            location: Any spelling of the location
+
+        Returns:
+            The canonical id followed by its aliases (just the normalized
+            string if the location is unknown)
+        """
+        canonical = self.normalize(location)
+        return list(dict.fromkeys([canonical] + list(self._aliases.get(canonical, []))))
+
+    def __repr__(self) -> str:
+        """Stable representation (part of LocationFilter's cache_key)."""
+        table = ",".join(f"{alias}={canonical}" for alias, canonical in sorted(self._alias_table.items()))
+        digest = hashlib.sha1(table.encode("utf-8")).hexdigest()[:12]
+        return f"<LocationNormalizer: {len(self._alias_table)} aliases, {digest}>"
+
+    def __reduce__(self):
+        """Pickle support (worker processes): the shared instance stays shared."""
+        if self is default_normalizer:
+            return "default_normalizer"
+        return (LocationNormalizer, (self._aliases, self._cache_size))
+
+    def cache_info(self):
+        """Return the LRU cache statistics of normalize()."""
+        return self.normalize.cache_info()
+
+
+# Shared normalizer used by LocationFilter by default
+default_normalizer = LocationNormalizer()
@@ -0,0 +1,280 @@
+"""Local stand-in for the LinkedIn API, for development and load testing."""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Dict, Any
+from urllib.parse import parse_qs, urlsplit
+
+from .candidate import Candidate
+from .mock_data import get_mock_candidates
+
+
+def profile_from_candidate(candidate: Candidate) -> Dict[str, Any]:
+    """
+    Render a candidate in the LinkedIn profile response shape.
+
+    This is the inverse of linkedin_client._candidate_from_profile().
+
+    Args:
+        candidate: The candidate to render
+
+    Returns:
+        LinkedIn-shaped profile dictionary
+    """
+    return {
+        "id": candidate.linkedin_url.rstrip("/").rsplit("/", 1)[-1].lower(),
+        "publicProfileUrl": candidate.linkedin_url,
+        "formattedName": candidate.name,
+        "headline": candidate.current_position,
+        "age": candidate.age,
+        "experienceYears": candidate.experience_years,
+        "location": {"name": candidate.location},
+        "nationality": candidate.nationality,
+        "educations": [{"country": c} for c in candidate.education_background],
+        "positions": [{"country": c} for c in candidate.work_background],
+        "skills": [{"name": s} for s in candidate.skills],
+        "languages": [{"name": l} for l in candidate.languages],
+        "emailAddress": candidate.email,
+        "phoneNumber": candidate.phone,
+    }
+
+
+def synthetic_profiles(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate LinkedIn-shaped profiles by varying the mock candidates.
+
+    Args:
+        count: Number of profiles to generate
+        seed: Random seed
+
+    Returns:
+        List of profile dictionaries with unique ids
+    """
+    rng = random.Random(seed)
+    templates = get_mock_candidates()
+    profiles = []
+    for index in range(count):
+        profile = profile_from_candidate(templates[index % len(templates)])
+        profile["id"] = f"{profile['id']}-{index}"
+        profile["publicProfileUrl"] = f"https://linkedin.com/in/{profile['id']}"
+        profile["age"] = max(18, profile["age"] + rng.randint(-3, 3))
+        profile["experienceYears"] = max(0.0, profile["experienceYears"] + rng.choice([-0.5, 0.0, 0.5]))
+        profiles.append(profile)
+    return profiles
+
+
+class MockLinkedInServer:
+    """
+    HTTP server that serves synthetic profiles in LinkedIn's response shape.
+
+    Endpoints:
+        GET /search/people?keywords=&location=&excludedLocation=&start=&count=
+        GET /people/(id:{id})                  (supports If-None-Match)
+        GET /people?ids=List((id:{a}),(id:{b}))
+
+    Usage:
+        with MockLinkedInServer(synthetic_profiles(1000), latency=0.01) as server:
+            client = LinkedInClient(base_url=server.base_url)
+    """
+
+    # Fields returned in search hits; everything else needs a profile fetch
+    SEARCH_FIELDS = (
+        "id", "publicProfileUrl", "formattedName", "headline",
+        "age", "experienceYears", "location", "nationality",
+    )
+
+    def __init__(
+        self,
+        profiles: Optional[List[Dict[str, Any]]] = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        max_page_size: int = 25,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0
+    ):
+        """
+        Initialize the mock server.
+
+        Args:
+            profiles: Profiles to serve (defaults to the mock candidates)
+            latency: Base response latency in seconds
+            latency_jitter: Extra random latency in seconds (uniform)
+            error_rate: Probability of answering with a 503
+            rate_limit: Requests per second before answering 429 (None = off)
+            max_page_size: Maximum search hits per page
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+            seed: Random seed for latency jitter and errors
+        """
+        if profiles is None:
+            profiles = [profile_from_candidate(c) for c in get_mock_candidates()]
+        self.profiles = {p["id"]: p for p in profiles}
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.max_page_size = max_page_size
+        self.request_count = 0
+        self.throttled_count = 0
+        self.error_count = 0
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = rate_limit or 0.0
+        self._last_refill = time.monotonic()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to LinkedInClient."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """
+        Start serving in a background thread.
+
+        Returns:
+            The server's base URL
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        """Stop the server and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockLinkedInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _admit(self) -> Optional[int]:
+        """
+        Apply the configured error rate and rate limit to a request.
+
+        Returns:
+            HTTP status to fail the request with, or None to serve it
+        """
+        with self._lock:
+            self.request_count += 1
+            if self.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate_limit,
+                    self._tokens + (now - self._last_refill) * self.rate_limit
+                )
+                self._last_refill = now
+                if self._tokens < 1.0:
+                    self.throttled_count += 1
+                    return 429
+                self._tokens -= 1.0
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.error_count += 1
+                return 503
+            delay = self.latency + self._rng.uniform(0.0, self.latency_jitter)
+        if delay:
+            time.sleep(delay)
+        return None
+
+    def _search(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Answer a people search with one page of hits."""
+        def values(name: str) -> List[str]:
+            raw = query.get(name, [""])[0]
+            return [v.strip().lower() for v in raw.split(",") if v.strip()]
+
+        keywords = values("keywords")
+        locations = values("location")
+        excluded = values("excludedLocation")
+        start = int(query.get("start", ["0"])[0])
+        count = min(int(query.get("count", [str(self.max_page_size)])[0]), self.max_page_size)
+
+        matches = []
+        for profile in self.profiles.values():
+            location = profile["location"]["name"].lower()
+            if keywords and profile["headline"].lower() not in keywords:
+                continue
+            if locations and location not in locations:
+                continue
+            if location in excluded:
+                continue
+            matches.append(profile)
+
+        page = matches[start:start + count]
+        return {
+            "elements": [{k: p[k] for k in self.SEARCH_FIELDS} for p in page],
+            "paging": {"start": start, "count": len(page), "total": len(matches)},
+        }
+
+    def _make_handler(self):
+        """Build the request handler class bound to this server."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                status = server._admit()
+                if status is not None:
+                    self._send(status, {"message": "mock failure"},
+                               {"Retry-After": "1"} if status == 429 else None)
+                    return
+
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                path = parts.path.rstrip("/")
+
+                if path == "/search/people":
+                    self._send(200, server._search(query))
+                elif path == "/people" and "ids" in query:
+                    ids = query["ids"][0][len("List("):-1].split(",")
+                    ids = [i[len("(id:"):-1] for i in ids if i.startswith("(id:")]
+                    results = {i: server.profiles[i] for i in ids if i in server.profiles}
+                    # Per-element validators, as a single-profile GET would return
+                    etags = {i: _etag(profile) for i, profile in results.items()}
+                    self._send(200, {"results": results, "etags": etags})
+                elif path.startswith("/people/(id:"):
+                    profile = server.profiles.get(path[len("/people/(id:"):-1])
+                    if profile is None:
+                        self._send(404, {"message": "not found"})
+                        return
+                    etag = _etag(profile)
+                    if self.headers.get("If-None-Match") == etag:
+                        self._send(304, None, {"ETag": etag})
+                    else:
+                        self._send(200, profile, {"ETag": etag})
+                else:
+                    self._send(404, {"message": "unknown endpoint"})
+
+            def _send(self, status, payload, headers=None):
+                body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def _etag(profile: Dict[str, Any]) -> str:
+    """ETag of a profile: a hash of its JSON body."""
+    return '"' + hashlib.sha1(json.dumps(profile).encode("utf-8")).hexdigest() + '"'
@@ -0,0 +1,294 @@
+"""Concurrent load -> filter -> export pipeline with bounded queues."""
+
+import copy
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .candidate import Candidate
+from .filter_manager import FilterManager
+from .screening_stats import ScreeningStats
+
+
+# Marks the end of a stage's output
+_DONE = object()
+
+
+@dataclass
+class StageStats:
+    """
+    Throughput and queue counters of one pipeline stage.
+
+    Attributes:
+        name: Stage name
+        items: Candidates the stage processed
+        batches: Batches the stage processed
+        busy_seconds: Time spent working (summed over the stage's threads)
+        wait_seconds: Time blocked on an empty input or a full output queue
+        queue_capacity: Size of the stage's input queue (0 for the reader)
+        depth_samples: Number of input queue depth samples
+        depth_total: Sum of the sampled depths
+        max_depth: Largest sampled depth
+    """
+    name: str
+    items: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    queue_capacity: int = 0
+    depth_samples: int = 0
+    depth_total: int = 0
+    max_depth: int = 0
+
+    def sample_depth(self, depth: int) -> None:
+        """Record the input queue depth seen when taking a batch."""
+        self.depth_samples += 1
+        self.depth_total += depth
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    @property
+    def mean_depth(self) -> float:
+        """Mean sampled depth of the input queue."""
+        return self.depth_total / self.depth_samples if self.depth_samples else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Candidates per busy second (what the stage could sustain alone)."""
+        return self.items / self.busy_seconds if self.busy_seconds else 0.0
+
+
+@dataclass
+class PipelineReport:
+    """Outcome of a pipelined run."""
+    total: int
+    passed: int
+    elapsed: float
+    stages: List[StageStats] = field(default_factory=list)
+
+    def format_table(self) -> str:
+        """Render the per-stage counters as a text table."""
+        lines = [
+            f"  {'Stage':<10}{'Items':>10}{'Busy s':>9}{'Wait s':>9}"
+            f"{'Items/s':>11}{'Queue avg':>11}{'Queue max':>11}"
+        ]
+        for stage in self.stages:
+            queue_columns = (
+                f"{stage.mean_depth:>11.1f}{f'{stage.max_depth}/{stage.queue_capacity}':>11}"
+                if stage.queue_capacity else f"{'-':>11}{'-':>11}"
+            )
+            lines.append(
+                f"  {stage.name:<10}{stage.items:>10}{stage.busy_seconds:>9.2f}"
+                f"{stage.wait_seconds:>9.2f}{stage.throughput:>11.0f}{queue_columns}"
+            )
+        lines.append(
+            f"  Wall time {self.elapsed:.2f}s, "
+            f"{self.total / self.elapsed if self.elapsed else 0.0:.0f} candidates/s end to end"
+        )
+        return "\n".join(lines)
+
+
+class _Stopped(Exception):
+    """Raised inside a stage when another stage has failed."""
+
+
+def screen_pipelined(
+    filter_manager: FilterManager,
+    candidates: Iterable[Candidate],
+    sink: Callable[[List[Candidate]], None],
+    chunk_size: int = 1000,
+    queue_size: int = 4,
+    workers: int = 1
+) -> PipelineReport:
+    """
+    Screen a stream with reading, filtering and writing running concurrently.
+
+    A reader thread pulls batches from the input, filter threads screen
+    them and the calling thread hands passing candidates to the sink in
+    input order. Stages are connected by queues of queue_size batches;
+    a full queue blocks the stage feeding it, so a slow exporter holds
+    back the reader instead of letting batches pile up. The reader
+    also waits while 2 * queue_size + workers + 1 batches are in flight
+    (queued, being screened or waiting to be written in order), so peak
+    memory is set by chunk_size and queue_size, not by the input size.
+
+    Each filter thread screens with its own copy of the filters and its
+    own ScreeningStats, merged into the manager's collector at the end.
+    The profiler and result cache are not used. Threads share the GIL:
+    they overlap file and network I/O (including lazy detail fetches)
+    with filtering, not CPU-bound filters with each other.
+
+    Args:
+        filter_manager: Filters to apply
+        candidates: Candidates to screen (any iterable, read once)
+        sink: Called with each batch of passing candidates, in input order
+        chunk_size: Candidates per batch
+        queue_size: Batches each queue holds before blocking its producer
+        workers: Filter threads
+
+    Returns:
+        PipelineReport with per-stage throughput and queue depths
+
+    Raises:
+        Exception: The first error raised by any stage (the others stop)
+    """
+    workers = max(1, workers)
+    to_filter: queue.Queue = queue.Queue(maxsize=queue_size)
+    to_write: queue.Queue = queue.Queue(maxsize=queue_size)
+    in_flight = threading.Semaphore(2 * queue_size + workers + 1)
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    reader = StageStats("read")
+    filter_stats = [StageStats("filter", queue_capacity=queue_size) for _ in range(workers)]
+    writer = StageStats("write", queue_capacity=queue_size)
+    collect_stats = filter_manager.stats is not None
+    worker_stats: List[Optional[ScreeningStats]] = [None] * workers
+
+    def put(target: queue.Queue, item, stage: StageStats) -> None:
+        start = time.perf_counter()
+        while True:
+            if stop.is_set():
+                raise _Stopped()
+            try:
+                target.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        stage.wait_seconds += time.perf_counter() - start
+
+    def get(source: queue.Queue, stage: StageStats):
+        start = time.perf_counter()
+        while True:
+            if stop.is_set():
+                raise _Stopped()
+            try:
+                depth = source.qsize()
+                item = source.get(timeout=0.1)
+                break
+            except queue.Empty:
+                pass
+        stage.wait_seconds += time.perf_counter() - start
+        if item is not _DONE:
+            stage.sample_depth(depth)
+        return item
+
+    def fail(error: BaseException) -> None:
+        if not isinstance(error, _Stopped):
+            errors.append(error)
+        stop.set()
+
+    def read() -> None:
+        try:
+            iterator = iter(candidates)
+            sequence = 0
+            while True:
+                start = time.perf_counter()
+                while not in_flight.acquire(timeout=0.1):
+                    if stop.is_set():
+                        raise _Stopped()
+                reader.wait_seconds += time.perf_counter() - start
+                start = time.perf_counter()
+                chunk = list(islice(iterator, chunk_size))
+                reader.busy_seconds += time.perf_counter() - start
+                if not chunk:
+                    break
+                reader.items += len(chunk)
+                reader.batches += 1
+                put(to_filter, (sequence, chunk), reader)
+                sequence += 1
+            for _ in range(workers):
+                put(to_filter, _DONE, reader)
+        except BaseException as e:
+            fail(e)
+
+    def screen(index: int) -> None:
+        stage = filter_stats[index]
+        try:
+            # Private filter copies: prepare() keeps per-chunk state
+            manager = FilterManager()
+            for name in filter_manager.list_filters():
+                manager.add_filter(copy.deepcopy(filter_manager.get_filter(name)), name=name)
+            if collect_stats:
+                worker_stats[index] = ScreeningStats()
+                manager.set_stats(worker_stats[index])
+            while True:
+                item = get(to_filter, stage)
+                if item is _DONE:
+                    break
+                sequence, chunk = item
+                start = time.perf_counter()
+                passed = manager.apply_all(chunk)
+                stage.busy_seconds += time.perf_counter() - start
+                stage.items += len(chunk)
+                stage.batches += 1
+                put(to_write, (sequence, len(chunk), passed), stage)
+            put(to_write, _DONE, stage)
+        except BaseException as e:
+            fail(e)
+
+    threads = [threading.Thread(target=read, name="pipeline-read", daemon=True)]
+    threads.extend(
+        threading.Thread(target=screen, args=(index,), name=f"pipeline-filter-{index}", daemon=True)
+        for index in range(workers)
+    )
+
+    started = time.perf_counter()
+    total = passed_count = 0
+    for thread in threads:
+        thread.start()
+    try:
+        # Batches can finish out of order with several filter threads
+        pending: Dict[int, Tuple[int, List[Candidate]]] = {}
+        next_sequence = 0
+        finished = 0
+        while finished < workers:
+            item = get(to_write, writer)
+            if item is _DONE:
+                finished += 1
+                continue
+            sequence, size, passed = item
+            pending[sequence] = (size, passed)
+            while next_sequence in pending:
+                size, passed = pending.pop(next_sequence)
+                start = time.perf_counter()
+                sink(passed)
+                writer.busy_seconds += time.perf_counter() - start
+                in_flight.release()
+                writer.items += size
+                writer.batches += 1
+                total += size
+                passed_count += len(passed)
+                next_sequence += 1
+    except BaseException as e:
+        fail(e)
+    finally:
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+    if collect_stats:
+        for stats in worker_stats:
+            if stats is not None:
+                filter_manager.stats.merge(stats)
+
+    filter_stage = StageStats("filter", queue_capacity=queue_size)
+    for stage in filter_stats:
+        filter_stage.items += stage.items
+        filter_stage.batches += stage.batches
+        filter_stage.busy_seconds += stage.busy_seconds
+        filter_stage.wait_seconds += stage.wait_seconds
+        filter_stage.depth_samples += stage.depth_samples
+        filter_stage.depth_total += stage.depth_total
+        filter_stage.max_depth = max(filter_stage.max_depth, stage.max_depth)
+
+    return PipelineReport(
+        total=total,
+        passed=passed_count,
+        elapsed=time.perf_counter() - started,
+        stages=[reader, filter_stage, writer],
+    )
@@ -0,0 +1,142 @@
+"""Per-filter and per-stage profiling for the filter pipeline."""
+
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List
+
+
+@dataclass
+class FilterStats:
+    """
+    Counters collected for a single filter.
+
+    Attributes:
+        calls: Number of times the filter was evaluated
+        total_time: Cumulative evaluation time in seconds
+        passed: Candidates the filter accepted
+        rejected: Candidates the filter rejected
+        skipped: Evaluations avoided because an earlier filter rejected
+    """
+    calls: int = 0
+    total_time: float = 0.0
+    passed: int = 0
+    rejected: int = 0
+    skipped: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        """Mean evaluation time in seconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def saved_time(self) -> float:
+        """Estimated time saved by short-circuiting, in seconds."""
+        return self.skipped * self.mean_time
+
+
+class FilterProfiler:
+    """
+    Collects per-filter timings and pass/reject counts, and stage timings.
+
+    Attach to a FilterManager with set_profiler(); when no profiler is
+    attached the manager uses its uninstrumented code path.
+    """
+
+    def __init__(self):
+        """Initialize an empty profiler."""
+        self.filters: Dict[str, FilterStats] = {}
+        self.stages: Dict[str, float] = {}
+
+    def record(self, filter_name: str, elapsed: float, passed: bool) -> None:
+        """
+        Record one filter evaluation.
+
+        Args:
+            filter_name: Name of the evaluated filter
+            elapsed: Evaluation time in seconds
+            passed: Whether the candidate passed the filter
+        """
+        stats = self.filters.get(filter_name)
+        if stats is None:
+            stats = self.filters[filter_name] = FilterStats()
+        stats.calls += 1
+        stats.total_time += elapsed
+        if passed:
+            stats.passed += 1
+        else:
+            stats.rejected += 1
+
+    def record_skipped(self, filter_names: List[str]) -> None:
+        """
+        Record filters that were not evaluated due to short-circuiting.
+
+        Args:
+            filter_names: Names of the skipped filters
+        """
+        for filter_name in filter_names:
+            stats = self.filters.get(filter_name)
+            if stats is None:
+                stats = self.filters[filter_name] = FilterStats()
+            stats.skipped += 1
+
+    @contextmanager
+    def stage(self, stage_name: str) -> Iterator[None]:
+        """
+        Time a pipeline stage.
+
+        Args:
+            stage_name: Name of the stage (e.g. "load", "filter", "export")
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[stage_name] = self.stages.get(stage_name, 0.0) + time.perf_counter() - start
+
+    def to_dict(self) -> dict:
+        """Convert the collected data to a dictionary."""
+        return {
+            "stages": dict(self.stages),
+            "filters": {
+                name: {
+                    **asdict(stats),
+                    "mean_time": stats.mean_time,
+                    "saved_time": stats.saved_time,
+                }
+                for name, stats in self.filters.items()
+            },
+        }
+
+    def write_json(self, filepath: str) -> str:
+        """
+        Write the collected data as JSON.
+
+        Args:
+            filepath: Output file path
+
+        Returns:
+            The file path written
+        """
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return filepath
+
+    def format_table(self) -> str:
+        """Render the collected data as a text table."""
+        lines = [
+            f"  {'Filter':<16}{'Calls':>9}{'Total ms':>11}{'Mean us':>10}"
+            f"{'Passed':>9}{'Rejected':>10}{'Skipped':>9}{'Saved ms':>10}"
+        ]
+        for name, stats in self.filters.items():
+            lines.append(
+                f"  {name:<16}{stats.calls:>9}{stats.total_time * 1e3:>11.2f}"
+                f"{stats.mean_time * 1e6:>10.2f}{stats.passed:>9}{stats.rejected:>10}"
+                f"{stats.skipped:>9}{stats.saved_time * 1e3:>10.2f}"
+            )
+        lines.append("")
+        lines.append(f"  {'Stage':<16}{'Seconds':>9}")
+        for name, elapsed in self.stages.items():
+            lines.append(f"  {name:<16}{elapsed:>9.4f}")
+        return "\n".join(lines)
@@ -0,0 +1,159 @@
+"""Query planner that narrows LinkedIn searches using the registered filters."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any
+
+from .candidate import Candidate
+from .filter_manager import FilterManager
+from .filters.base_filter import BaseFilter
+from .filters.expression import AndFilter
+from .filters.location_filter import LocationFilter
+from .filters.position_filter import PositionFilter, normalize_title
+
+
+@dataclass
+class SearchPlan:
+    """
+    Result of planning a LinkedIn search from a FilterManager.
+
+    The search API cannot answer any filter exactly, so every filter
+    still runs client-side; the plan only adds search parameters that
+    keep candidates the filters would reject from being returned.
+
+    Attributes:
+        keywords: Search keywords (titles of the PositionFilter; empty = any)
+        locations: Locations to include server-side (None = any)
+        excluded_locations: Locations to exclude server-side
+        industries: Industries to include server-side (None = any)
+        partial_filters: Filters that narrowed the search parameters
+        residual_filters: Filters that run client-side (all of them)
+    """
+    keywords: List[str] = field(default_factory=list)
+    locations: Optional[List[str]] = None
+    excluded_locations: List[str] = field(default_factory=list)
+    industries: Optional[List[str]] = None
+    partial_filters: List[BaseFilter] = field(default_factory=list)
+    residual_filters: List[BaseFilter] = field(default_factory=list)
+
+    def search_params(self) -> Dict[str, Any]:
+        """
+        Build keyword arguments for LinkedInClientBase.search_candidates().
+
+        Example:
+            client.iter_search_candidates(**plan.search_params(), limit=500)
+
+        Returns:
+            Dictionary of search parameters
+        """
+        return {
+            "keywords": self.keywords,
+            "locations": self.locations,
+            "excluded_locations": self.excluded_locations or None,
+            "industries": self.industries,
+        }
+
+    def count_saved_fetches(self, candidates: List[Candidate]) -> int:
+        """
+        Count how many candidates the search parameters would exclude.
+
+        Each of these is a profile the search no longer returns, and so a
+        fetch (and a local filter pass) that no longer happens.
+
+        Args:
+            candidates: A representative candidate pool
+
+        Returns:
+            Number of candidates excluded by the search parameters
+        """
+        # The server matches excluded locations as exact (case-insensitive) strings
+        excluded = {location.lower() for location in self.excluded_locations}
+        keywords = [normalize_title(keyword) for keyword in self.keywords]
+        saved = 0
+        for candidate in candidates:
+            if candidate.location.lower() in excluded:
+                saved += 1
+            elif keywords and not any(
+                keyword in normalize_title(candidate.current_position) for keyword in keywords
+            ):
+                saved += 1
+        return saved
+
+    def __str__(self) -> str:
+        """String representation for display."""
+        partial = [f.name for f in self.partial_filters]
+        residual = [f.name for f in self.residual_filters]
+        return (
+            f"keywords={self.keywords}, "
+            f"excluded_locations={self.excluded_locations}, "
+            f"partial={partial}, residual={residual}"
+        )
+
+
+class QueryPlanner:
+    """
+    Translate registered filters into LinkedIn search parameters.
+
+    Search parameters only narrow the results: what the API matches is
+    never exactly what a filter checks (free-form locations, fuzzy
+    keyword matching), so all filters still run locally after the search.
+    """
+
+    def plan(self, filter_manager: FilterManager) -> SearchPlan:
+        """
+        Build a search plan for the filters registered in a manager.
+
+        Args:
+            filter_manager: The filter manager to inspect
+
+        Returns:
+            SearchPlan with the narrowing search parameters
+        """
+        plan = SearchPlan()
+
+        for name in filter_manager.list_filters():
+            filter_instance = filter_manager.get_filter(name)
+            plan.residual_filters.append(filter_instance)
+            if self._narrow(filter_instance, plan):
+                plan.partial_filters.append(filter_instance)
+
+        return plan
+
+    def _narrow(self, filter_instance: BaseFilter, plan: SearchPlan) -> bool:
+        """
+        Add search parameters that reject part of what a filter rejects.
+
+        LocationFilter compares canonical locations, while the search
+        excludes exact strings only: every known alias of an excluded
+        location is pushed, but free-form variants ("Greater Sydney Area")
+        can still come back, so the filter also runs client-side.
+        A PositionFilter supplies the search keywords.
+
+        Children of an AndFilter are narrowed too, since a candidate must
+        pass all of them. Or/Not expressions are left alone: a candidate
+        rejected by one branch can still pass through another.
+
+        Args:
+            filter_instance: The filter to translate
+            plan: The plan to extend
+
+        Returns:
+            True if any search parameters were added
+        """
+        if isinstance(filter_instance, AndFilter):
+            narrowed = [self._narrow(child, plan) for child in filter_instance.children]
+            return any(narrowed)
+
+        if isinstance(filter_instance, LocationFilter):
+            for excluded in filter_instance.excluded_locations:
+                for location in filter_instance.normalizer.aliases(excluded):
+                    if location not in plan.excluded_locations:
+                        plan.excluded_locations.append(location)
+            return True
+
+        if isinstance(filter_instance, PositionFilter) and not plan.keywords:
+            # Passing candidates match one of these titles; a second
+            # PositionFilter would only narrow further client-side
+            plan.keywords = list(filter_instance.positions)
+            return True
+
+        return False
@@ -0,0 +1,218 @@
+"""Persistent cross-run cache of filter verdicts (SQLite)."""
+
+import hashlib
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+from .filters.base_filter import BaseFilter
+
+
+# Bump to invalidate every stored verdict (e.g. after changing filter logic)
+CACHE_VERSION = 1
+
+# SQLite limits the number of bound parameters per statement
+_MAX_PARAMS = 900
+
+
+def _to_key(hex_digest: str) -> int:
+    """Fold a hex digest into a signed 64-bit SQLite integer key."""
+    return int.from_bytes(bytes.fromhex(hex_digest[:16]), "big", signed=True)
+
+
+def candidate_key(fingerprint: str) -> int:
+    """
+    Convert a Candidate.fingerprint() into a cache key.
+
+    Args:
+        fingerprint: Candidate content fingerprint
+
+    Returns:
+        64-bit integer key
+    """
+    return _to_key(fingerprint)
+
+
+def filter_config_key(filter_instance: BaseFilter) -> int:
+    """
+    Hash a filter's class and parameters into a cache key.
+
+    Any change to a filter's parameters produces a different key, so
+    verdicts stored for the old configuration are simply never looked up.
+
+    Args:
+        filter_instance: The filter to hash
+
+    Returns:
+        64-bit integer key identifying the filter configuration
+    """
+    payload = f"{CACHE_VERSION}:{filter_instance.__class__.__module__}:{filter_instance.cache_key!r}"
+    return _to_key(hashlib.sha1(payload.encode("utf-8")).hexdigest())
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters for result cache usage.
+
+    Attributes:
+        hits: Verdicts served from the cache
+        misses: Verdicts that had to be computed
+        evicted: Entries removed by size-based eviction
+    """
+    hits: int = 0
+    misses: int = 0
+    evicted: int = 0
+
+
+class ResultCache:
+    """
+    Stores filter verdicts keyed by candidate fingerprint x filter config hash.
+
+    A candidate whose content changes gets a new fingerprint, and a filter
+    whose parameters change gets a new config hash, so stale verdicts are
+    never returned; they age out through least-recently-used eviction once
+    the store exceeds max_entries. Recency is tracked per day, so repeat
+    runs on the same day do not rewrite entries they hit.
+
+    Lookups and writes are batched to keep a repeat run I/O-bound.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 5_000_000,
+        batch_size: int = 5000
+    ):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: SQLite database file
+            max_entries: Maximum stored verdicts before eviction
+            batch_size: Candidates per lookup batch and pending writes per flush
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.path = path
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        self.stats = CacheStats()
+        self._pending: List[Tuple[int, int, int, int]] = []
+        self._today = int(time.time()) // 86400
+
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            " candidate_key INTEGER NOT NULL,"
+            " filter_key INTEGER NOT NULL,"
+            " verdict INTEGER NOT NULL,"
+            " last_used INTEGER NOT NULL,"
+            " PRIMARY KEY (candidate_key, filter_key)"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS verdicts_last_used ON verdicts (last_used)"
+        )
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def lookup(
+        self,
+        candidate_keys: Iterable[int],
+        filter_keys: Iterable[int]
+    ) -> Dict[Tuple[int, int], bool]:
+        """
+        Fetch stored verdicts for a batch of candidates.
+
+        Args:
+            candidate_keys: Candidate keys (see candidate_key())
+            filter_keys: Filter config keys of interest
+
+        Returns:
+            Mapping of (candidate key, filter key) to verdict for stored entries
+        """
+        candidate_keys = list(dict.fromkeys(candidate_keys))
+        wanted = set(filter_keys)
+        found: Dict[Tuple[int, int], bool] = {}
+
+        for start in range(0, len(candidate_keys), _MAX_PARAMS):
+            chunk = candidate_keys[start:start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT candidate_key, filter_key, verdict, last_used FROM verdicts"
+                f" WHERE candidate_key IN ({placeholders})",
+                chunk
+            )
+            stale = False
+            for key, filter_key, verdict, last_used in rows:
+                if filter_key in wanted:
+                    found[(key, filter_key)] = bool(verdict)
+                    stale = stale or last_used < self._today
+            if stale:
+                self._conn.execute(
+                    f"UPDATE verdicts SET last_used = ?"
+                    f" WHERE candidate_key IN ({placeholders}) AND last_used < ?",
+                    [self._today, *chunk, self._today]
+                )
+        return found
+
+    def put(self, candidate_key: int, filter_key: int, verdict: bool) -> None:
+        """
+        Queue a verdict for writing; flushed automatically in batches.
+
+        Args:
+            candidate_key: Candidate key (see candidate_key())
+            filter_key: Filter config key
+            verdict: Whether the candidate passed the filter
+        """
+        self._pending.append((candidate_key, filter_key, int(verdict), self._today))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending verdicts and evict least recently used if oversized."""
+        if self._pending:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO verdicts (candidate_key, filter_key, verdict, last_used)"
+                " VALUES (?, ?, ?, ?)",
+                self._pending
+            )
+            self._count += self._conn.total_changes - before
+            self._pending.clear()
+
+        if self._count > self.max_entries:
+            excess = self._count - int(self.max_entries * 0.9)
+            self._conn.execute(
+                "DELETE FROM verdicts WHERE (candidate_key, filter_key) IN ("
+                " SELECT candidate_key, filter_key FROM verdicts ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+            self.stats.evicted += excess
+            self._count -= excess
+
+    def commit(self) -> None:
+        """Flush pending verdicts and commit them to disk."""
+        self.flush()
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        self.commit()
+        self._conn.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored verdicts (including pending)."""
+        return self._count + len(self._pending)
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,214 @@
+"""
+Compact, indexed results file for viewing a shortlist without re-filtering.
+
+Only the standard library is used, so viewers can load this module on its
+own (without the src package and openpyxl).
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .candidate import Candidate
+
+
+class ResultsWriter:
+    """
+    Write passing candidates as JSON Lines plus a byte-offset index.
+
+    Files:
+        <path>      one Candidate.to_dict() per line (also a valid --input file)
+        <path>.idx  header, run metadata (JSON) and the offset of every record
+
+    Both files are written under temporary names and renamed by close(),
+    so readers never see a half-written shortlist.
+    """
+
+    MAGIC = b"CANDRES1"
+    # magic, record count, data file size, metadata length
+    HEADER = struct.Struct("<8sQQQ")
+
+    def __init__(self, path: str, meta: Optional[dict] = None):
+        """
+        Start a results file.
+
+        Args:
+            path: Output path of the JSON Lines file
+            meta: Run metadata stored in the index (e.g. totals, filters)
+        """
+        self.path = path
+        self.meta = dict(meta or {})
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._file = open(path + ".tmp", "wb")
+        self._offsets = array("Q")
+        self._size = 0
+
+    def write(self, candidates: Iterable["Candidate"]) -> None:
+        """
+        Append candidates, in shortlist order.
+
+        Args:
+            candidates: Candidates to add
+        """
+        lines = []
+        for candidate in candidates:
+            line = json.dumps(
+                candidate.to_dict(), ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8") + b"\n"
+            self._offsets.append(self._size)
+            self._size += len(line)
+            lines.append(line)
+        self._file.write(b"".join(lines))
+
+    def close(self, meta: Optional[dict] = None) -> str:
+        """
+        Write the index and publish both files.
+
+        Args:
+            meta: Metadata to add (e.g. totals known only at the end)
+
+        Returns:
+            Path of the JSON Lines file
+        """
+        self.meta.update(meta or {})
+        self._file.close()
+        meta_bytes = json.dumps(self.meta, ensure_ascii=False).encode("utf-8")
+        with open(self.path + ".idx.tmp", "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, len(self._offsets), self._size, len(meta_bytes)))
+            f.write(meta_bytes)
+            offsets = self._offsets
+            if sys.byteorder != "little":
+                offsets = array("Q", offsets)
+                offsets.byteswap()
+            f.write(offsets.tobytes())
+        os.replace(self.path + ".tmp", self.path)
+        os.replace(self.path + ".idx.tmp", self.path + ".idx")
+        return self.path
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+
+
+def write_results(path: str, candidates: Sequence["Candidate"], meta: Optional[dict] = None) -> str:
+    """
+    Write a complete results file in one call.
+
+    Args:
+        path: Output path of the JSON Lines file
+        candidates: Passing candidates, in shortlist order
+        meta: Run metadata stored in the index
+
+    Returns:
+        Path of the JSON Lines file
+    """
+    writer = ResultsWriter(path, meta)
+    writer.write(candidates)
+    return writer.close()
+
+
+class ResultsFile:
+    """
+    Random access to a results file written by ResultsWriter.
+
+    The index is memory-mapped and a page is read with a single seek, so
+    opening and paging through millions of results costs the same as a
+    handful.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a results file.
+
+        Args:
+            path: Path of the JSON Lines file
+
+        Raises:
+            FileNotFoundError: If the file or its index is missing
+            ValueError: If the index is not a results index or does not
+                match the data file
+        """
+        self.path = path
+        with open(path + ".idx", "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = ResultsWriter.HEADER
+        magic, self._count, size, meta_length = header.unpack_from(self._index)
+        if magic != ResultsWriter.MAGIC:
+            self._index.close()
+            raise ValueError(f"{path}.idx is not a results index")
+        if os.path.getsize(path) != size:
+            self._index.close()
+            raise ValueError(f"{path} changed since its index was written")
+        self.meta: dict = json.loads(self._index[header.size:header.size + meta_length])
+        self._offsets_start = header.size + meta_length
+        self._size = size
+        self._file = open(path, "rb")
+
+    def _offset(self, index: int) -> int:
+        if index >= self._count:
+            return self._size
+        return struct.unpack_from("<Q", self._index, self._offsets_start + 8 * index)[0]
+
+    def __len__(self) -> int:
+        """Number of results."""
+        return self._count
+
+    def page(self, start: int, count: int) -> List[dict]:
+        """
+        Read consecutive results as dictionaries.
+
+        Args:
+            start: Index of the first result (0-based)
+            count: Maximum number of results
+
+        Returns:
+            Candidate.to_dict() dictionaries; empty past the end
+        """
+        start = max(0, start)
+        end = min(self._count, start + max(0, count))
+        if start >= end:
+            return []
+        first = self._offset(start)
+        self._file.seek(first)
+        data = self._file.read(self._offset(end) - first)
+        return [json.loads(line) for line in data.splitlines()]
+
+    def candidates(self, start: int = 0, count: Optional[int] = None) -> List["Candidate"]:
+        """
+        Read consecutive results as Candidate objects.
+
+        Args:
+            start: Index of the first result (0-based)
+            count: Maximum number of results (all remaining if None)
+
+        Returns:
+            Candidates in shortlist order
+        """
+        from .candidate import Candidate
+
+        if count is None:
+            count = self._count
+        return [Candidate.from_dict(data) for data in self.page(start, count)]
+
+    def close(self) -> None:
+        """Close the data file and unmap the index."""
+        self._index.close()
+        self._file.close()
+
+    def __enter__(self) -> "ResultsFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
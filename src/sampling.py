@@ -0,0 +1,217 @@
+"""Sampling-based pass rate estimates for quick previews."""
+
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from itertools import islice
+from math import exp, floor, log, sqrt
+from statistics import NormalDist
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .candidate import Candidate
+from .filter_manager import FilterManager
+
+
+def wilson_interval(passed: float, n: float, confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion.
+
+    Unlike the normal approximation it stays within [0, 1] and behaves
+    well for rates near 0 or 1 and small samples.
+
+    Args:
+        passed: Number of successes (may be fractional for weighted samples)
+        n: Sample size (or effective sample size)
+        confidence: Two-sided confidence level
+
+    Returns:
+        (lower, upper) bounds of the pass rate
+    """
+    if n <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = passed / n
+    denominator = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denominator
+    margin = z * sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def reservoir_sample(items: Iterable, k: int, seed: int = 0) -> list:
+    """
+    Uniform random sample of k items from a stream of unknown length.
+
+    Uses Li's Algorithm L, which skips ahead geometrically instead of
+    drawing a random number per item.
+
+    Args:
+        items: Items to sample (any iterable, read once)
+        k: Sample size
+        seed: Random seed
+
+    Returns:
+        Up to k items, in no particular order
+    """
+    if k <= 0:
+        return []
+    rng = random.Random(seed)
+    iterator = iter(items)
+    reservoir = list(islice(iterator, k))
+    if len(reservoir) < k:
+        return reservoir
+
+    w = exp(log(rng.random()) / k)
+    while True:
+        skip = floor(log(rng.random()) / log(1 - w))
+        item = next(islice(iterator, skip, skip + 1), None)
+        if item is None:
+            return reservoir
+        reservoir[rng.randrange(k)] = item
+        w *= exp(log(rng.random()) / k)
+
+
+def _record_at(f, offset: int) -> Tuple[Optional[bytes], int]:
+    """Return the line containing a byte offset and the line's length."""
+    start = offset
+    while start > 0:
+        block_start = max(0, start - 4096)
+        f.seek(block_start)
+        block = f.read(start - block_start)
+        newline = block.rfind(b"\n")
+        if newline >= 0:
+            start = block_start + newline + 1
+            break
+        start = block_start
+    f.seek(start)
+    line = f.readline()
+    return (line if line.strip() else None), len(line)
+
+
+def sample_jsonl(
+    filepaths: Sequence[str],
+    k: int,
+    seed: int = 0
+) -> Tuple[List[Candidate], List[float], float]:
+    """
+    Stratified sample of JSON Lines records by byte offset.
+
+    Each file is split into byte strata (in proportion to its size) and
+    the record containing a random offset in each stratum is read, so only
+    about k records are parsed however large the files are. A record is
+    picked with probability proportional to its length; each one is
+    weighted by 1 / length to correct for that.
+
+    Args:
+        filepaths: .jsonl / .ndjson files
+        k: Number of records to read
+        seed: Random seed
+
+    Returns:
+        Tuple of (candidates, weights, estimated number of records)
+    """
+    rng = random.Random(seed)
+    sizes = [os.path.getsize(path) for path in filepaths]
+    total_size = sum(sizes)
+    candidates: List[Candidate] = []
+    weights: List[float] = []
+    if total_size == 0 or k <= 0:
+        return candidates, weights, 0.0
+
+    for path, size in zip(filepaths, sizes):
+        strata = max(1, round(k * size / total_size)) if size else 0
+        with open(path, "rb") as f:
+            for stratum in range(strata):
+                offset = int((stratum + rng.random()) * size / strata)
+                line, length = _record_at(f, offset)
+                if line is not None:
+                    candidates.append(Candidate.from_dict(json.loads(line)))
+                    weights.append(1.0 / length)
+
+    # Horvitz-Thompson: the mean of 1 / length over draws is records / total_size
+    population = total_size * sum(weights) / len(weights) if weights else 0.0
+    return candidates, weights, population
+
+
+@dataclass
+class PassRate:
+    """Estimated pass rate of one filter (or of all filters together)."""
+    name: str
+    rate: float
+    low: float
+    high: float
+
+    def estimated_count(self, population: float) -> Tuple[int, int, int]:
+        """
+        Scale the rate and its interval to a population size.
+
+        Returns:
+            (estimate, lower bound, upper bound) of passing candidates
+        """
+        return (
+            round(self.rate * population),
+            round(self.low * population),
+            round(self.high * population),
+        )
+
+
+@dataclass
+class PreviewResult:
+    """Outcome of a sampled preview."""
+    sample_size: int
+    population: Optional[float]
+    confidence: float
+    overall: PassRate
+    filters: List[PassRate] = field(default_factory=list)
+
+
+def preview_pass_rates(
+    filter_manager: FilterManager,
+    sample: List[Candidate],
+    weights: Optional[List[float]] = None,
+    population: Optional[float] = None,
+    confidence: float = 0.95
+) -> PreviewResult:
+    """
+    Estimate overall and per-filter pass rates from a sample.
+
+    Every filter is evaluated on every sampled candidate, so per-filter
+    rates are marginal (independent of filter order).
+
+    Args:
+        filter_manager: Filters to estimate
+        sample: Sampled candidates
+        weights: Per-candidate sampling weights (uniform if None)
+        population: Size of the sampled pool, if known
+        confidence: Confidence level of the intervals
+
+    Returns:
+        PreviewResult with Wilson score intervals. For weighted samples the
+        intervals use Kish's effective sample size.
+    """
+    if weights is None:
+        weights = [1.0] * len(sample)
+    total_weight = sum(weights)
+    effective_n = total_weight ** 2 / sum(w * w for w in weights) if weights else 0.0
+
+    def estimate(name: str, verdicts: List[bool]) -> PassRate:
+        passed = sum(w for w, verdict in zip(weights, verdicts) if verdict)
+        rate = passed / total_weight if total_weight else 0.0
+        low, high = wilson_interval(rate * effective_n, effective_n, confidence)
+        return PassRate(name, rate, low, high)
+
+    names = filter_manager.list_filters()
+    columns = {}
+    for name in names:
+        filter_instance = filter_manager.get_filter(name)
+        filter_instance.prepare(sample)
+        columns[name] = [filter_instance.apply(candidate) for candidate in sample]
+    overall = [all(columns[name][i] for name in names) for i in range(len(sample))]
+
+    return PreviewResult(
+        sample_size=len(sample),
+        population=population,
+        confidence=confidence,
+        overall=estimate("All filters", overall),
+        filters=[estimate(name, columns[name]) for name in names],
+    )
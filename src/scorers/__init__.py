@@ -0,0 +1,5 @@
+from .base_scorer import BaseScorer
+from .experience_scorer import ExperienceScorer
+from .background_scorer import BackgroundScorer
+from .skill_scorer import SkillScorer
+from .weighted_scorer import WeightedScorer
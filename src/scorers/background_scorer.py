@@ -0,0 +1,53 @@
+"""Background scorer implementation."""
+
+from typing import List
+
+from .base_scorer import BaseScorer
+from ..candidate import Candidate
+
+
+class BackgroundScorer(BaseScorer):
+    """
+    Score candidates by strength of their preferred background.
+
+    Education and work in preferred regions both count; a candidate with
+    both scores higher than one with either alone.
+    """
+
+    def __init__(
+        self,
+        preferred_backgrounds: List[str],
+        education_share: float = 0.5,
+        weight: float = 1.0
+    ):
+        """
+        Initialize the background scorer.
+
+        Args:
+            preferred_backgrounds: List of preferred countries/regions
+            education_share: Part of the score given for education (rest: work)
+            weight: Relative weight when combined with other scorers
+        """
+        super().__init__(weight)
+        self.preferred_backgrounds = {bg.lower() for bg in preferred_backgrounds}
+        self.education_share = education_share
+
+    def score(self, candidate: Candidate) -> float:
+        """
+        Score candidate's background match.
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            Share of education/work histories that include a preferred region
+        """
+        score = 0.0
+        if any(bg.lower() in self.preferred_backgrounds for bg in candidate.education_background):
+            score += self.education_share
+        if any(bg.lower() in self.preferred_backgrounds for bg in candidate.work_background):
+            score += 1.0 - self.education_share
+        return score
+
+    def __repr__(self) -> str:
+        return f"<BackgroundScorer: {len(self.preferred_backgrounds)} regions, weight {self.weight}>"
@@ -0,0 +1,62 @@
+"""Base scorer class for ranking candidates."""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..candidate import Candidate
+
+
+class BaseScorer(ABC):
+    """
+    Abstract base class for candidate scorers.
+
+    Where a filter answers yes/no, a scorer rates how well a candidate
+    matches a criterion on a 0.0-1.0 scale. Scorers are combined with
+    WeightedScorer and used by FilterManager.apply_top_k().
+
+    To create a new scorer:
+    1. Inherit from BaseScorer
+    2. Implement the score() method
+
+    Example:
+        class MyCustomScorer(BaseScorer):
+            def score(self, candidate: Candidate) -> float:
+                return 1.0 if candidate.some_field == some_value else 0.0
+    """
+
+    def __init__(self, weight: float = 1.0):
+        """
+        Initialize the scorer.
+
+        Args:
+            weight: Relative weight when combined with other scorers
+        """
+        self.weight = weight
+
+    @property
+    def name(self) -> str:
+        """
+        Return the name of the scorer.
+        Defaults to the class name without 'Scorer' suffix.
+        """
+        class_name = self.__class__.__name__
+        if class_name.endswith('Scorer'):
+            return class_name[:-6]
+        return class_name
+
+    @abstractmethod
+    def score(self, candidate: "Candidate") -> float:
+        """
+        Score a candidate.
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            Score between 0.0 (no match) and 1.0 (perfect match)
+        """
+        pass
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: weight {self.weight}>"
@@ -0,0 +1,47 @@
+"""Experience scorer implementation."""
+
+from .base_scorer import BaseScorer
+from ..candidate import Candidate
+
+
+class ExperienceScorer(BaseScorer):
+    """
+    Score candidates by closeness of experience to a target.
+
+    The score is 1.0 at the target and falls linearly to 0.0 at
+    `tolerance` years away from it.
+    """
+
+    def __init__(self, target_years: float = 2.0, tolerance: float = 2.0, weight: float = 1.0):
+        """
+        Initialize the experience scorer.
+
+        Args:
+            target_years: Ideal years of experience
+            tolerance: Distance in years at which the score reaches 0
+            weight: Relative weight when combined with other scorers
+
+        Raises:
+            ValueError: If tolerance is not positive
+        """
+        if tolerance <= 0:
+            raise ValueError(f"tolerance must be positive, got {tolerance}")
+        super().__init__(weight)
+        self.target_years = target_years
+        self.tolerance = tolerance
+
+    def score(self, candidate: Candidate) -> float:
+        """
+        Score candidate's experience against the target.
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            1.0 at the target, decreasing linearly to 0.0
+        """
+        distance = abs(candidate.experience_years - self.target_years)
+        return max(0.0, 1.0 - distance / self.tolerance)
+
+    def __repr__(self) -> str:
+        return f"<ExperienceScorer: {self.target_years}±{self.tolerance} years, weight {self.weight}>"
@@ -0,0 +1,45 @@
+"""Skill scorer implementation."""
+
+from typing import List
+
+from .base_scorer import BaseScorer
+from ..candidate import Candidate
+
+
+class SkillScorer(BaseScorer):
+    """
+    Score candidates by overlap with a list of target skills.
+
+    Languages count as skills, so targets such as "Mandarin" match a
+    candidate's languages as well.
+    """
+
+    def __init__(self, target_skills: List[str], weight: float = 1.0):
+        """
+        Initialize the skill scorer.
+
+        Args:
+            target_skills: Skills or languages to look for (case-insensitive)
+            weight: Relative weight when combined with other scorers
+        """
+        super().__init__(weight)
+        self.target_skills = {skill.lower() for skill in target_skills}
+
+    def score(self, candidate: Candidate) -> float:
+        """
+        Score candidate's skill overlap.
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            Fraction of target skills the candidate has
+        """
+        if not self.target_skills:
+            return 0.0
+        skills = {skill.lower() for skill in candidate.skills}
+        skills.update(language.lower() for language in candidate.languages)
+        return len(skills & self.target_skills) / len(self.target_skills)
+
+    def __repr__(self) -> str:
+        return f"<SkillScorer: {len(self.target_skills)} skills, weight {self.weight}>"
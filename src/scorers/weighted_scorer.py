@@ -0,0 +1,42 @@
+"""Weighted combination of scorers."""
+
+from typing import List
+
+from .base_scorer import BaseScorer
+from ..candidate import Candidate
+
+
+class WeightedScorer(BaseScorer):
+    """
+    Combine several scorers into a weighted average.
+    """
+
+    def __init__(self, scorers: List[BaseScorer], weight: float = 1.0):
+        """
+        Initialize the weighted scorer.
+
+        Args:
+            scorers: Scorers to combine; each contributes by its weight
+            weight: Relative weight when nested in another WeightedScorer
+        """
+        super().__init__(weight)
+        self.scorers = list(scorers)
+        self._total_weight = sum(s.weight for s in self.scorers)
+
+    def score(self, candidate: Candidate) -> float:
+        """
+        Compute the weighted average of all scorers.
+
+        Args:
+            candidate: The candidate to evaluate
+
+        Returns:
+            Weighted average score between 0.0 and 1.0
+        """
+        if not self._total_weight:
+            return 0.0
+        total = sum(s.weight * s.score(candidate) for s in self.scorers)
+        return total / self._total_weight
+
+    def __repr__(self) -> str:
+        return f"<WeightedScorer: {[s.name for s in self.scorers]}>"
@@ -0,0 +1,298 @@
+"""Long-running screening service over a warm in-memory candidate index."""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Any, Dict, Optional, Sequence
+
+from .candidate import Candidate
+from .candidate_index import CandidateIndex
+from .exporter import ExcelExporter
+from .filter_factory import apply_filter_overrides, create_filter_manager
+from .skill_index import bitmap_count
+from .suppression_list import SuppressionList
+
+
+class ScreeningService:
+    """
+    Answers filter queries against a candidate pool loaded once.
+
+    The pool is indexed up front (see CandidateIndex), so each query only
+    builds its filters from the per-request FilterSettings overrides and
+    combines precomputed bitmaps.
+    """
+
+    def __init__(
+        self,
+        candidates: Sequence[Candidate],
+        filter_settings,
+        exporter: ExcelExporter,
+        page_size: int = 50,
+        suppression_list: Optional[SuppressionList] = None
+    ):
+        """
+        Load the pool and build the index.
+
+        Args:
+            candidates: Candidate pool
+            filter_settings: Default FilterSettings; requests override fields
+            exporter: Exporter used by export()
+            page_size: Candidates returned per query by default
+            suppression_list: Open list for filter_settings.suppression_list
+                (opened once here with default sizing if None)
+        """
+        self.filter_settings = filter_settings
+        # Shared by all queries (suppression_list cannot be overridden)
+        if suppression_list is None and filter_settings.suppression_list:
+            suppression_list = SuppressionList(filter_settings.suppression_list)
+        self.suppression_list = suppression_list
+        self.exporter = exporter
+        self.page_size = page_size
+        self.index = CandidateIndex(list(candidates))
+        self.query_count = 0
+        self._lock = threading.Lock()
+
+    def screen(
+        self,
+        overrides: Optional[Dict[str, Any]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Filter the pool.
+
+        Args:
+            overrides: FilterSettings field name -> value for this query
+            offset: Number of passing candidates to skip
+            limit: Passing candidates to return (defaults to page_size)
+
+        Returns:
+            JSON-serializable dict with total, passed, offset and candidates
+
+        Raises:
+            ValueError: If an override or skill query is invalid
+        """
+        start = time.perf_counter()
+        if limit is None:
+            limit = self.page_size
+        if offset < 0 or limit < 0:
+            raise ValueError("offset and limit must not be negative")
+
+        bits = self._query(overrides)
+        page = self.index.candidates_for(bits, offset, limit)
+        return {
+            "total": len(self.index),
+            "passed": bitmap_count(bits),
+            "offset": offset,
+            "candidates": [candidate.to_dict() for candidate in page],
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+
+    def export(
+        self,
+        overrides: Optional[Dict[str, Any]] = None,
+        filename: str = "candidates.xlsx",
+        detailed: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Export every candidate passing a query to Excel.
+
+        Args:
+            overrides: FilterSettings field name -> value for this query
+            filename: Output filename inside the exporter's directory
+            detailed: Use the detailed report layout
+
+        Returns:
+            JSON-serializable dict with the file path and passed count
+
+        Raises:
+            ValueError: If an override is invalid or filename is not a .xlsx name
+        """
+        if os.path.basename(filename) != filename or not filename.endswith(".xlsx"):
+            raise ValueError(f"Invalid export filename: {filename!r}")
+
+        candidates = self.index.candidates_for(self._query(overrides))
+        if detailed:
+            path = self.exporter.export_detailed(candidates, filename=filename)
+        else:
+            path = self.exporter.export(candidates, filename=filename)
+        return {"path": path, "passed": len(candidates)}
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describe the service state.
+
+        Returns:
+            JSON-serializable dict with pool size, query count and defaults
+        """
+        return {
+            "status": "ok",
+            "candidates": len(self.index),
+            "queries": self.query_count,
+            "filter_settings": asdict(self.filter_settings),
+        }
+
+    def _query(self, overrides: Optional[Dict[str, Any]]) -> int:
+        """Build the filters for a request and answer them from the index."""
+        filter_settings = apply_filter_overrides(self.filter_settings, overrides or {})
+        filter_manager = create_filter_manager(filter_settings, self.suppression_list)
+        with self._lock:
+            self.query_count += 1
+        return self.index.query(filter_manager.as_filter().children)
+
+
+class _ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """HTTP over a Unix domain socket, one thread per connection."""
+
+    daemon_threads = True
+
+
+class ScreeningServer:
+    """
+    JSON HTTP API for a ScreeningService, over TCP or a Unix socket.
+
+    Endpoints:
+        GET  /health   pool size, query count and default filter settings
+        POST /screen   {"filters": {...}, "offset": 0, "limit": 50}
+        POST /export   {"filters": {...}, "filename": "x.xlsx", "detailed": false}
+
+    "filters" holds FilterSettings overrides for that request only, e.g.
+    {"max_age": 35, "skill_query": "Compliance AND Mandarin"}.
+
+    Usage:
+        with ScreeningServer(service, port=8080):
+            ...
+        curl -X POST localhost:8080/screen -d '{"filters": {"max_age": 35}}'
+    """
+
+    def __init__(
+        self,
+        service: ScreeningService,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        socket_path: Optional[str] = None
+    ):
+        """
+        Bind the server.
+
+        Args:
+            service: The service answering requests
+            host: Interface to bind (TCP)
+            port: Port to bind (0 = pick a free port)
+            socket_path: Serve on this Unix socket instead of TCP
+        """
+        self.service = service
+        self.socket_path = socket_path
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            self._httpd = _ThreadingUnixHTTPServer(socket_path, self._make_handler())
+        else:
+            self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+            self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        """Base URL, or the Unix socket path."""
+        if self.socket_path:
+            return self.socket_path
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        """Serve requests until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._close()
+
+    def start(self) -> str:
+        """
+        Start serving in a background thread.
+
+        Returns:
+            The server's address
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.address
+
+    def stop(self) -> None:
+        """Stop the server and release the port or socket."""
+        self._httpd.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+        self._close()
+
+    def __enter__(self) -> "ScreeningServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _close(self) -> None:
+        """Close the listening socket and remove the socket file."""
+        self._httpd.server_close()
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    def _make_handler(self):
+        """Build the request handler class bound to this server."""
+        service = self.service
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.rstrip("/") == "/health":
+                    self._send(200, service.describe())
+                else:
+                    self._send(404, {"error": "unknown endpoint"})
+
+            def do_POST(self):
+                path = self.path.rstrip("/")
+                if path not in ("/screen", "/export"):
+                    self._send(404, {"error": "unknown endpoint"})
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                    if not isinstance(request, dict):
+                        raise ValueError("request body must be a JSON object")
+                    overrides = request.get("filters") or {}
+                    if not isinstance(overrides, dict):
+                        raise ValueError('"filters" must be a JSON object')
+                    if path == "/screen":
+                        response = service.screen(
+                            overrides,
+                            offset=int(request.get("offset", 0)),
+                            limit=request.get("limit")
+                        )
+                    else:
+                        response = service.export(
+                            overrides,
+                            filename=request.get("filename", "candidates.xlsx"),
+                            detailed=bool(request.get("detailed", False))
+                        )
+                except (ValueError, TypeError) as e:
+                    self._send(400, {"error": str(e)})
+                    return
+                self._send(200, response)
+
+            def _send(self, status, payload):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
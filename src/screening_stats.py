@@ -0,0 +1,328 @@
+"""Bounded-memory, mergeable statistics collected while screening."""
+
+from typing import Dict, List, Sequence, Tuple
+
+from .candidate import Candidate
+from .location_normalizer import default_normalizer
+
+
+class Histogram:
+    """
+    Fixed-bin histogram over [low, high) with underflow/overflow bins.
+
+    Memory is fixed by the bin layout; two histograms with the same
+    layout merge by adding their counts.
+    """
+
+    def __init__(self, low: float, high: float, bin_width: float):
+        """
+        Initialize the histogram.
+
+        Args:
+            low: Lower edge of the first bin
+            high: Upper edge of the last bin
+            bin_width: Width of each bin
+        """
+        self.low = low
+        self.high = high
+        self.bin_width = bin_width
+        self.counts: List[int] = [0] * int(round((high - low) / bin_width))
+        self.underflow = 0
+        self.overflow = 0
+
+    def add(self, value: float) -> None:
+        """Count one value."""
+        if value < self.low:
+            self.underflow += 1
+        elif value >= self.high:
+            self.overflow += 1
+        else:
+            self.counts[int((value - self.low) // self.bin_width)] += 1
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Add another histogram's counts into this one.
+
+        Raises:
+            ValueError: If the bin layouts differ
+        """
+        if (self.low, self.high, self.bin_width) != (other.low, other.high, other.bin_width):
+            raise ValueError("Cannot merge histograms with different bins")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    def rows(self) -> List[Tuple[str, int]]:
+        """
+        Return (bin label, count) pairs, underflow and overflow bins included.
+        """
+        rows = [(f"< {self.low:g}", self.underflow)]
+        for index, count in enumerate(self.counts):
+            start = self.low + index * self.bin_width
+            rows.append((f"{start:g}-{start + self.bin_width:g}", count))
+        rows.append((f">= {self.high:g}", self.overflow))
+        return rows
+
+    def state(self) -> dict:
+        """Return the histogram as a JSON-serializable dictionary."""
+        return {
+            "low": self.low,
+            "high": self.high,
+            "bin_width": self.bin_width,
+            "counts": list(self.counts),
+            "underflow": self.underflow,
+            "overflow": self.overflow,
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "Histogram":
+        """Rebuild a histogram saved with state()."""
+        histogram = cls(state["low"], state["high"], state["bin_width"])
+        histogram.counts = list(state["counts"])
+        histogram.underflow = state["underflow"]
+        histogram.overflow = state["overflow"]
+        return histogram
+
+
+class SpaceSaving:
+    """
+    Approximate top-k counter (Space-Saving) with a fixed number of slots.
+
+    Keeps at most `capacity` items. When full, a new item replaces the
+    least counted one and inherits its count as error, so counts are
+    overestimates by at most `errors[item]`. Items whose true count
+    exceeds total / capacity are guaranteed to be kept. Summaries merge
+    with bounded error (Agarwal et al., "Mergeable Summaries").
+    """
+
+    def __init__(self, capacity: int = 100):
+        """
+        Initialize the counter.
+
+        Args:
+            capacity: Maximum number of tracked items
+        """
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, item: str, count: int = 1) -> None:
+        """Count an item."""
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            victim = min(self.counts, key=self.counts.get)
+            floor = self.counts.pop(victim)
+            del self.errors[victim]
+            self.counts[item] = floor + count
+            self.errors[item] = floor
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """Merge another counter into this one, keeping the top capacity items."""
+        # An item missing from a full summary may still have up to its minimum count
+        own_floor = min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+        other_floor = min(other.counts.values()) if len(other.counts) >= other.capacity else 0
+
+        counts: Dict[str, int] = {}
+        errors: Dict[str, int] = {}
+        for item in set(self.counts) | set(other.counts):
+            counts[item] = self.counts.get(item, own_floor) + other.counts.get(item, other_floor)
+            errors[item] = (
+                self.errors.get(item, own_floor) + other.errors.get(item, other_floor)
+            )
+        kept = sorted(counts, key=counts.get, reverse=True)[:self.capacity]
+        self.counts = {item: counts[item] for item in kept}
+        self.errors = {item: errors[item] for item in kept}
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        """
+        Return the n most frequent items.
+
+        Returns:
+            (item, estimated count) pairs, most frequent first
+        """
+        return sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))[:n]
+
+    def state(self) -> dict:
+        """Return the counter as a JSON-serializable dictionary."""
+        return {
+            "capacity": self.capacity,
+            "counts": dict(self.counts),
+            "errors": dict(self.errors),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "SpaceSaving":
+        """Rebuild a counter saved with state()."""
+        counter = cls(state["capacity"])
+        counter.counts = dict(state["counts"])
+        counter.errors = dict(state["errors"])
+        return counter
+
+
+# Every breakdown is kept separately for each screening outcome
+OUTCOMES = ("passed", "rejected")
+
+
+class ScreeningStats:
+    """
+    Aggregate statistics fed by FilterManager while it screens.
+
+    Holds total/passed counts, per-filter rejection counts, age and
+    experience histograms, and approximate top locations, nationalities
+    and positions, each split by passed vs rejected. Memory does not grow
+    with the number of candidates, no candidate is retained, and stats
+    from parallel workers or shards are combined with merge().
+
+    Attach to a FilterManager with set_stats().
+    """
+
+    def __init__(self, capacity: int = 100):
+        """
+        Initialize empty statistics.
+
+        Args:
+            capacity: Slots per top-k counter (accuracy vs memory)
+        """
+        self.total = 0
+        self.passed = 0
+        self.rejections: Dict[str, int] = {}
+        self.age = {outcome: Histogram(15, 70, 5) for outcome in OUTCOMES}
+        self.experience = {outcome: Histogram(0, 20, 1) for outcome in OUTCOMES}
+        self.locations = {outcome: SpaceSaving(capacity) for outcome in OUTCOMES}
+        self.nationalities = {outcome: SpaceSaving(capacity) for outcome in OUTCOMES}
+        self.positions = {outcome: SpaceSaving(capacity) for outcome in OUTCOMES}
+
+    @property
+    def rejected(self) -> int:
+        """Candidates rejected by at least one filter."""
+        return self.total - self.passed
+
+    def record(self, candidate: Candidate, rejected_by: Sequence[str] = ()) -> None:
+        """
+        Record the outcome for one candidate.
+
+        Only summary fields are read, so lazy candidates are not hydrated.
+
+        Args:
+            candidate: The screened candidate
+            rejected_by: Names of the filters that rejected it (empty = passed)
+        """
+        self.total += 1
+        if rejected_by:
+            outcome = "rejected"
+            for name in rejected_by:
+                self.rejections[name] = self.rejections.get(name, 0) + 1
+        else:
+            outcome = "passed"
+            self.passed += 1
+
+        self.age[outcome].add(candidate.age)
+        self.experience[outcome].add(candidate.experience_years)
+        self.locations[outcome].add(default_normalizer.normalize(candidate.location).title())
+        self.nationalities[outcome].add(candidate.nationality.strip())
+        self.positions[outcome].add(candidate.current_position.strip())
+
+    def merge(self, other: "ScreeningStats") -> None:
+        """
+        Add another collector's statistics into this one.
+
+        Args:
+            other: Statistics from another worker, shard or run
+        """
+        self.total += other.total
+        self.passed += other.passed
+        for name, count in other.rejections.items():
+            self.rejections[name] = self.rejections.get(name, 0) + count
+        for outcome in OUTCOMES:
+            self.age[outcome].merge(other.age[outcome])
+            self.experience[outcome].merge(other.experience[outcome])
+            self.locations[outcome].merge(other.locations[outcome])
+            self.nationalities[outcome].merge(other.nationalities[outcome])
+            self.positions[outcome].merge(other.positions[outcome])
+
+    def breakdowns(self, top_n: int = 10) -> Dict[str, List[Tuple[str, int, int]]]:
+        """
+        Build passed-vs-rejected breakdown tables.
+
+        Args:
+            top_n: Rows per top-k table
+
+        Returns:
+            Table title -> rows of (label, passed count, rejected count)
+        """
+        tables: Dict[str, List[Tuple[str, int, int]]] = {}
+        for title, histograms in (("Age", self.age), ("Experience (Years)", self.experience)):
+            tables[title] = [
+                (label, passed, rejected)
+                for (label, passed), (_, rejected) in zip(
+                    histograms["passed"].rows(), histograms["rejected"].rows()
+                )
+                if passed or rejected
+            ]
+
+        for title, counters in (
+            ("Location", self.locations),
+            ("Nationality", self.nationalities),
+            ("Position", self.positions),
+        ):
+            passed = counters["passed"]
+            rejected = counters["rejected"]
+            labels: List[str] = []
+            for label, _ in passed.top(top_n) + rejected.top(top_n):
+                if label not in labels:
+                    labels.append(label)
+            tables[f"Top {title}s"] = [
+                (label, passed.counts.get(label, 0), rejected.counts.get(label, 0))
+                for label in labels
+            ]
+        return tables
+
+    def state(self) -> dict:
+        """
+        Return the full statistics as a JSON-serializable dictionary.
+
+        Unlike to_dict(), nothing is summarized, so from_state() restores
+        a collector that can keep recording and merging.
+        """
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "rejections": dict(self.rejections),
+            "age": {outcome: self.age[outcome].state() for outcome in OUTCOMES},
+            "experience": {outcome: self.experience[outcome].state() for outcome in OUTCOMES},
+            "locations": {outcome: self.locations[outcome].state() for outcome in OUTCOMES},
+            "nationalities": {outcome: self.nationalities[outcome].state() for outcome in OUTCOMES},
+            "positions": {outcome: self.positions[outcome].state() for outcome in OUTCOMES},
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "ScreeningStats":
+        """Rebuild statistics saved with state()."""
+        stats = cls()
+        stats.total = state["total"]
+        stats.passed = state["passed"]
+        stats.rejections = dict(state["rejections"])
+        for outcome in OUTCOMES:
+            stats.age[outcome] = Histogram.from_state(state["age"][outcome])
+            stats.experience[outcome] = Histogram.from_state(state["experience"][outcome])
+            stats.locations[outcome] = SpaceSaving.from_state(state["locations"][outcome])
+            stats.nationalities[outcome] = SpaceSaving.from_state(state["nationalities"][outcome])
+            stats.positions[outcome] = SpaceSaving.from_state(state["positions"][outcome])
+        return stats
+
+    def to_dict(self, top_n: int = 10) -> dict:
+        """Convert the statistics to a dictionary."""
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "rejected": self.rejected,
+            "rejections": dict(self.rejections),
+            "breakdowns": {
+                title: [list(row) for row in rows]
+                for title, rows in self.breakdowns(top_n).items()
+            },
+        }
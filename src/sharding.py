@@ -0,0 +1,276 @@
+"""Hash-partitioned screening: per-shard outputs and the merge step."""
+
+import hashlib
+import heapq
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field, fields
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .candidate import Candidate
+from .linkedin_client import normalize_linkedin_url
+from .loader import load_candidates
+from .screening_stats import ScreeningStats
+
+
+# Top-level "linkedin_url" string of a JSON Lines record (quotes inside
+# string values are escaped, so the key cannot match inside one)
+_URL_FIELD = re.compile(r'"linkedin_url"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard spec such as "2/8" (shard 2 of 8, zero-based).
+
+    Args:
+        spec: "i/K" with 0 <= i < K
+
+    Returns:
+        Tuple of (shard index, number of shards)
+
+    Raises:
+        ValueError: If the spec is malformed or out of range
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard {spec!r}, expected i/K (e.g. 0/4)") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {spec!r}: need 0 <= i < K")
+    return index, count
+
+
+def shard_of(linkedin_url: str, num_shards: int) -> int:
+    """
+    Assign a candidate to a shard by a stable hash of its LinkedIn URL.
+
+    URLs are normalized first, so every variant of one profile lands in
+    the same shard.
+
+    Args:
+        linkedin_url: Candidate's LinkedIn URL
+        num_shards: Number of shards
+
+    Returns:
+        Shard index in [0, num_shards)
+    """
+    digest = hashlib.blake2b(
+        normalize_linkedin_url(linkedin_url).encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big") % num_shards
+
+
+def select_shard(
+    candidates: Iterable[Candidate],
+    index: int,
+    num_shards: int
+) -> Iterator[Tuple[int, Candidate]]:
+    """
+    Yield the candidates of one shard with their position in the full input.
+
+    Positions let the merge step restore the single-node output order.
+
+    Args:
+        candidates: The full input, in order
+        index: Shard to keep
+        num_shards: Number of shards
+
+    Yields:
+        (input position, candidate) pairs
+    """
+    for position, candidate in enumerate(candidates):
+        if shard_of(candidate.linkedin_url, num_shards) == index:
+            yield position, candidate
+
+
+def select_shard_from_files(
+    paths: Sequence[str],
+    index: int,
+    num_shards: int
+) -> Iterator[Tuple[int, Candidate]]:
+    """
+    select_shard() over candidate files, parsing only this shard's records.
+
+    For JSON Lines files the LinkedIn URL is read from the raw line and
+    only lines of this shard are parsed in full, so each of K shards
+    parses about 1/K of the input. Positions match select_shard() over
+    load_candidates() of the same files.
+
+    Args:
+        paths: Candidate files, in input order
+        index: Shard to keep
+        num_shards: Number of shards
+
+    Yields:
+        (input position, candidate) pairs
+    """
+    position = 0
+    for path in paths:
+        if path.endswith(".json"):
+            for candidate in load_candidates(path):
+                if shard_of(candidate.linkedin_url, num_shards) == index:
+                    yield position, candidate
+                position += 1
+            continue
+
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                match = _URL_FIELD.search(line)
+                if match is None:
+                    candidate = Candidate.from_dict(json.loads(line))
+                    url = candidate.linkedin_url
+                else:
+                    candidate = None
+                    raw = match.group(1)
+                    url = raw[1:-1] if "\\" not in raw else json.loads(raw)
+                if shard_of(url, num_shards) == index:
+                    yield position, candidate or Candidate.from_dict(json.loads(line))
+                position += 1
+
+
+def _shard_name(index: int, num_shards: int) -> str:
+    return f"shard-{index}-of-{num_shards}"
+
+
+@dataclass
+class ShardSummary:
+    """
+    Everything but the passed records of one shard's output.
+
+    Attributes:
+        index: Shard index
+        num_shards: Number of shards in the run
+        run_key: Key of the input and filter configuration (shards must agree)
+        filters: Filter names, in registration order
+        stats: ScreeningStats.state() of the shard
+    """
+    index: int
+    num_shards: int
+    run_key: str
+    filters: List[str]
+    stats: dict = field(default_factory=dict)
+
+
+def write_shard(
+    directory: str,
+    summary: ShardSummary,
+    passed: Iterable[Tuple[int, Candidate]]
+) -> str:
+    """
+    Write one shard's output: passed records (JSONL) and a summary (JSON).
+
+    Files are written under temporary names and renamed at the end, so a
+    crashed shard never leaves a partial output for the merge.
+
+    Args:
+        directory: Output directory shared by all shards
+        summary: The shard's summary
+        passed: (input position, candidate) pairs that passed, in order
+
+    Returns:
+        Path of the summary file
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    base = os.path.join(directory, _shard_name(summary.index, summary.num_shards))
+
+    with open(base + ".jsonl.tmp", "w", encoding="utf-8") as f:
+        for position, candidate in passed:
+            f.write(json.dumps(
+                {"position": position, "candidate": candidate.to_dict()},
+                ensure_ascii=False
+            ))
+            f.write("\n")
+    with open(base + ".json.tmp", "w", encoding="utf-8") as f:
+        json.dump(asdict(summary), f)
+
+    os.replace(base + ".jsonl.tmp", base + ".jsonl")
+    os.replace(base + ".json.tmp", base + ".json")
+    return base + ".json"
+
+
+@dataclass
+class MergedShards:
+    """Result of merging all shard outputs of a run."""
+    num_shards: int
+    filters: List[str]
+    stats: ScreeningStats
+    passed: Iterator[Candidate]
+
+
+def merge_shards(directory: str, num_shards: Optional[int] = None) -> MergedShards:
+    """
+    Merge the outputs of all shards of a run.
+
+    Statistics are summed; passed records are
+    k-way merged by input position, so they stream out in the order a
+    single-node run would produce.
+
+    Args:
+        directory: Directory the shards wrote to
+        num_shards: Expected number of shards (inferred from the files if None)
+
+    Returns:
+        MergedShards; `passed` is a lazy iterator over the merged records
+
+    Raises:
+        ValueError: If shards are missing or disagree on the input and
+            filter configuration
+    """
+    known_fields = {f.name for f in fields(ShardSummary)}
+    found: List[ShardSummary] = []
+    for filename in sorted(os.listdir(directory)):
+        if filename.startswith("shard-") and filename.endswith(".json"):
+            with open(os.path.join(directory, filename), encoding="utf-8") as f:
+                data = json.load(f)
+            # Outputs of older versions carry fields that no longer exist
+            found.append(ShardSummary(**{k: v for k, v in data.items() if k in known_fields}))
+    if not found:
+        raise ValueError(f"No shard outputs in {directory}")
+    if num_shards is None:
+        counts = {summary.num_shards for summary in found}
+        if len(counts) > 1:
+            raise ValueError(f"Outputs of runs with {sorted(counts)} shards in {directory}")
+        num_shards = counts.pop()
+    summaries = {
+        summary.index: summary for summary in found if summary.num_shards == num_shards
+    }
+
+    missing = sorted(set(range(num_shards)) - set(summaries))
+    if missing:
+        raise ValueError(f"Missing outputs for shards {missing} of {num_shards}")
+    run_key = summaries[0].run_key
+    for summary in summaries.values():
+        if summary.run_key != run_key:
+            raise ValueError(
+                f"Shard {summary.index} was screened with a different input or filters"
+            )
+
+    stats = ScreeningStats()
+    for summary in summaries.values():
+        stats.merge(ScreeningStats.from_state(summary.stats))
+
+    paths = [
+        os.path.join(directory, _shard_name(index, num_shards) + ".jsonl")
+        for index in range(num_shards)
+    ]
+    merged = heapq.merge(*map(_read_passed, paths), key=lambda record: record[0])
+    return MergedShards(
+        num_shards=num_shards,
+        filters=summaries[0].filters,
+        stats=stats,
+        passed=(candidate for _, candidate in merged),
+    )
+
+
+def _read_passed(path: str) -> Iterator[Tuple[int, Candidate]]:
+    """Stream (position, candidate) records from a shard's JSONL file."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record["position"], Candidate.from_dict(record["candidate"])
@@ -0,0 +1,238 @@
+"""Inverted skill/language index with boolean bitmap queries."""
+
+import re
+from typing import Dict, Iterator, List, Sequence, Set, Tuple, Union
+
+from .candidate import Candidate
+
+
+# Parsed query node: ("term", skill) | ("not", node) | ("and"/"or", left, right)
+QueryNode = Tuple[Union[str, "QueryNode"], ...]
+
+_TOKEN_PATTERN = re.compile(r'\s*(\(|\)|"[^"]*"|[^\s()"]+)')
+_OPERATORS = {"AND", "OR", "NOT"}
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize a skill or language name (case and whitespace)."""
+    return " ".join(skill.lower().split())
+
+
+def parse_skill_query(query: str) -> QueryNode:
+    """
+    Parse a boolean skill query.
+
+    Grammar (operators are case-insensitive, NOT binds tightest, then AND):
+        expr   := term ("OR" term)*
+        term   := factor ("AND" factor)*
+        factor := "NOT" factor | "(" expr ")" | skill
+    A skill is a run of words (e.g. Risk Management) or a quoted string.
+
+    Example:
+        parse_skill_query("Compliance AND (Mandarin OR Cantonese)")
+
+    Args:
+        query: Query text
+
+    Returns:
+        Parsed query tree
+
+    Raises:
+        ValueError: If the query is malformed
+    """
+    tokens = [t for t in _TOKEN_PATTERN.findall(query) if t]
+    position = 0
+
+    def peek() -> str:
+        return tokens[position] if position < len(tokens) else ""
+
+    def take() -> str:
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_expr() -> QueryNode:
+        node = parse_term()
+        while peek().upper() == "OR":
+            take()
+            node = ("or", node, parse_term())
+        return node
+
+    def parse_term() -> QueryNode:
+        node = parse_factor()
+        while peek().upper() == "AND":
+            take()
+            node = ("and", node, parse_factor())
+        return node
+
+    def parse_factor() -> QueryNode:
+        token = peek()
+        if token.upper() == "NOT":
+            take()
+            return ("not", parse_factor())
+        if token == "(":
+            take()
+            node = parse_expr()
+            if peek() != ")":
+                raise ValueError(f"Missing ')' in skill query: {query!r}")
+            take()
+            return node
+        if token.startswith('"'):
+            take()
+            return ("term", normalize_skill(token.strip('"')))
+
+        words = []
+        while peek() and peek() not in ("(", ")") and peek().upper() not in _OPERATORS:
+            words.append(take())
+        if not words:
+            raise ValueError(f"Expected a skill at token {position} in query: {query!r}")
+        return ("term", normalize_skill(" ".join(words)))
+
+    node = parse_expr()
+    if position != len(tokens):
+        raise ValueError(f"Unexpected {tokens[position]!r} in skill query: {query!r}")
+    return node
+
+
+def evaluate_on_set(node: QueryNode, values: Set[str]) -> bool:
+    """
+    Evaluate a parsed query against one candidate's normalized values.
+
+    Args:
+        node: Parsed query tree
+        values: Normalized skills (or languages) of the candidate
+
+    Returns:
+        True if the candidate matches the query
+    """
+    op = node[0]
+    if op == "term":
+        return node[1] in values
+    if op == "not":
+        return not evaluate_on_set(node[1], values)
+    if op == "and":
+        return evaluate_on_set(node[1], values) and evaluate_on_set(node[2], values)
+    return evaluate_on_set(node[1], values) or evaluate_on_set(node[2], values)
+
+
+def positions_to_bitmap(positions: List[int], size: int) -> int:
+    """
+    Build an integer bitmap with the given bit positions set.
+
+    Args:
+        positions: Bit positions to set
+        size: Total number of positions in the collection
+
+    Returns:
+        Bitmap as a Python integer
+    """
+    buffer = bytearray(size // 8 + 1)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def bitmap_positions(bits: int) -> Iterator[int]:
+    """
+    Iterate over the set bit positions of an integer bitmap, in order.
+
+    Args:
+        bits: Bitmap as a Python integer
+
+    Yields:
+        Positions of set bits, lowest first
+    """
+    buffer = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(buffer):
+        while byte:
+            low = byte & -byte
+            yield (byte_index << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+def bitmap_count(bits: int) -> int:
+    """
+    Count the set bits of an integer bitmap.
+
+    Args:
+        bits: Bitmap as a Python integer (non-negative)
+
+    Returns:
+        Number of set bits
+    """
+    return bin(bits).count("1")
+
+
+class SkillIndex:
+    """
+    Inverted index from normalized skill to a bitmap of candidate positions.
+
+    Bitmaps are Python integers (bit i set = candidate i has the skill), so
+    AND/OR/NOT queries are answered with whole-bitmap &, | and ~ instead of
+    scanning every candidate's list.
+    """
+
+    def __init__(self, candidates: Sequence[Candidate], field: str = "skills"):
+        """
+        Build the index for a candidate collection.
+
+        Args:
+            candidates: Candidates to index; positions are their indices
+            field: Candidate list attribute to index ("skills" or "languages")
+        """
+        self.candidates = candidates
+        self.field = field
+        self.all_bits = (1 << len(candidates)) - 1
+        self._positions: Dict[int, int] = {}
+
+        postings: Dict[str, List[int]] = {}
+        for position, candidate in enumerate(candidates):
+            self._positions[id(candidate)] = position
+            for value in getattr(candidate, field):
+                postings.setdefault(normalize_skill(value), []).append(position)
+
+        self.postings: Dict[str, int] = {
+            value: positions_to_bitmap(positions, len(candidates))
+            for value, positions in postings.items()
+        }
+
+    def position_of(self, candidate: Candidate) -> int:
+        """
+        Get a candidate's position in the indexed collection.
+
+        Returns:
+            The position, or -1 if the candidate is not indexed
+        """
+        return self._positions.get(id(candidate), -1)
+
+    def query(self, query: Union[str, QueryNode]) -> int:
+        """
+        Answer a boolean query with bitmap operations.
+
+        Args:
+            query: Query text or parsed query tree
+
+        Returns:
+            Bitmap of matching candidate positions
+        """
+        node = parse_skill_query(query) if isinstance(query, str) else query
+        op = node[0]
+        if op == "term":
+            return self.postings.get(node[1], 0)
+        if op == "not":
+            return self.all_bits & ~self.query(node[1])
+        if op == "and":
+            return self.query(node[1]) & self.query(node[2])
+        return self.query(node[1]) | self.query(node[2])
+
+    def matches(self, query: Union[str, QueryNode]) -> List[Candidate]:
+        """
+        Get the candidates matching a query, in collection order.
+
+        Args:
+            query: Query text or parsed query tree
+
+        Returns:
+            List of matching candidates
+        """
+        return [self.candidates[p] for p in bitmap_positions(self.query(query))]
@@ -0,0 +1,85 @@
+"""Compile filters into SQL predicates over a CandidateStore."""
+
+from typing import Any, List, Optional, Tuple
+
+from .filters import (
+    BaseFilter,
+    AgeFilter,
+    ExperienceFilter,
+    LocationFilter,
+    BackgroundFilter,
+    AndFilter,
+    OrFilter,
+    NotFilter
+)
+from .location_normalizer import default_normalizer
+
+
+# (SQL boolean expression, bound parameters)
+SqlPredicate = Tuple[str, List[Any]]
+
+
+def _placeholders(values: List[Any]) -> str:
+    return ",".join("?" * len(values))
+
+
+def compile_filter(filter_instance: BaseFilter) -> Optional[SqlPredicate]:
+    """
+    Translate a filter into an equivalent SQL predicate.
+
+    Supported: AgeFilter, ExperienceFilter, LocationFilter (with the shared
+    normalizer), BackgroundFilter, and And/Or/Not expressions whose
+    children are all supported. Subclasses are not compiled, since they
+    may override apply().
+
+    Args:
+        filter_instance: The filter to translate
+
+    Returns:
+        (SQL expression, parameters), or None if it must run in Python
+    """
+    if isinstance(filter_instance, (AndFilter, OrFilter)):
+        parts = [compile_filter(child) for child in filter_instance.children]
+        if any(part is None for part in parts):
+            return None
+        joiner = " AND " if isinstance(filter_instance, AndFilter) else " OR "
+        sql = joiner.join(f"({part_sql})" for part_sql, _ in parts)
+        params = [param for _, part_params in parts for param in part_params]
+        return (sql or ("1" if isinstance(filter_instance, AndFilter) else "0")), params
+    if isinstance(filter_instance, NotFilter):
+        part = compile_filter(filter_instance.children[0])
+        if part is None:
+            return None
+        return f"NOT ({part[0]})", part[1]
+
+    if type(filter_instance) is AgeFilter:
+        return "age BETWEEN ? AND ?", [filter_instance.min_age, filter_instance.max_age]
+    if type(filter_instance) is ExperienceFilter:
+        return (
+            "experience_years BETWEEN ? AND ?",
+            [filter_instance.min_years, filter_instance.max_years]
+        )
+    if type(filter_instance) is LocationFilter and filter_instance.normalizer is default_normalizer:
+        excluded = sorted({default_normalizer.normalize(loc) for loc in filter_instance.excluded_locations})
+        if not excluded:
+            return "1", []
+        return f"location_id NOT IN ({_placeholders(excluded)})", excluded
+    if type(filter_instance) is BackgroundFilter:
+        preferred = sorted(set(filter_instance.preferred_backgrounds))
+        excluded = sorted(set(filter_instance.excluded_backgrounds))
+        if not preferred:
+            return "0", []
+        sql = (
+            f"id IN (SELECT candidate_id FROM backgrounds"
+            f" WHERE country IN ({_placeholders(preferred)}))"
+        )
+        params: List[Any] = list(preferred)
+        if excluded:
+            sql += (
+                f" AND id NOT IN (SELECT candidate_id FROM backgrounds"
+                f" WHERE country IN ({_placeholders(excluded)}))"
+            )
+            params += excluded
+        return sql, params
+
+    return None
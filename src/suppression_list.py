@@ -0,0 +1,277 @@
+"""Persistent suppression list of already contacted or rejected candidates."""
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import struct
+from itertools import islice
+from math import ceil, log
+from typing import Iterable, List, Optional, Tuple
+
+from .candidate import Candidate
+from .dedup import normalize_email
+from .linkedin_client import normalize_linkedin_url
+
+
+def suppression_keys(candidate: Candidate) -> List[str]:
+    """
+    Return the normalized identifiers a candidate is suppressed by.
+
+    Args:
+        candidate: The candidate
+
+    Returns:
+        "url:..." and (if present) "email:..." keys
+    """
+    keys = []
+    if candidate.linkedin_url:
+        keys.append("url:" + normalize_linkedin_url(candidate.linkedin_url))
+    email = normalize_email(candidate.email)
+    if email:
+        keys.append("email:" + email)
+    return keys
+
+
+def parse_entry(entry: str) -> Optional[str]:
+    """
+    Turn a raw suppression list line (a LinkedIn URL or an email) into a key.
+
+    Returns:
+        The normalized key, or None for blank lines
+    """
+    entry = entry.strip()
+    if not entry:
+        return None
+    if "@" in entry and "linkedin.com" not in entry.lower():
+        return "email:" + normalize_email(entry)
+    return "url:" + normalize_linkedin_url(entry)
+
+
+class BloomFilter:
+    """
+    Bloom filter stored in a memory-mapped file.
+
+    Opening it costs nothing beyond mapping the file; pages are read by
+    the OS on demand. Bits are set in place, so additions persist.
+
+    File layout: 8-byte magic, num_bits, num_hashes, count (uint64, LE),
+    then the bit array.
+    """
+
+    MAGIC = b"CANDBLM1"
+    HEADER = struct.Struct("<8sQQQ")
+
+    def __init__(self, path: str, expected_items: int = 10_000_000, false_positive_rate: float = 0.001):
+        """
+        Open a Bloom filter file, creating it if missing.
+
+        Args:
+            path: Bloom filter file
+            expected_items: Capacity of a new file (ignored if it exists)
+            false_positive_rate: Target false positive rate at capacity
+                (ignored if the file exists)
+        """
+        self.path = path
+        if not os.path.exists(path):
+            num_bits = max(64, ceil(-expected_items * log(false_positive_rate) / log(2) ** 2))
+            num_bits = (num_bits + 7) // 8 * 8
+            num_hashes = max(1, round(num_bits / expected_items * log(2)))
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(path, "wb") as f:
+                f.write(self.HEADER.pack(self.MAGIC, num_bits, num_hashes, 0))
+                f.truncate(self.HEADER.size + num_bits // 8)
+
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, self.num_bits, self.num_hashes, self.count = self.HEADER.unpack_from(self._map)
+        if magic != self.MAGIC:
+            self._map.close()
+            self._file.close()
+            raise ValueError(f"{path} is not a Bloom filter file")
+        self._bits = memoryview(self._map)[self.HEADER.size:]
+
+    def _positions(self, key: str) -> Tuple[int, int]:
+        """First bit position and stride of a key (double hashing over one digest)."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        return (
+            int.from_bytes(digest[:8], "little") % self.num_bits,
+            (int.from_bytes(digest[8:], "little") | 1) % self.num_bits,
+        )
+
+    def add(self, key: str) -> None:
+        """Set the bits of a key."""
+        bits = self._bits
+        num_bits = self.num_bits
+        position, stride = self._positions(key)
+        for _ in range(self.num_hashes):
+            bits[position >> 3] |= 1 << (position & 7)
+            position = (position + stride) % num_bits
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        """True if the key may have been added, False if it certainly was not."""
+        bits = self._bits
+        num_bits = self.num_bits
+        position, stride = self._positions(key)
+        for _ in range(self.num_hashes):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position = (position + stride) % num_bits
+        return True
+
+    def flush(self) -> None:
+        """Write the count and dirty pages to disk."""
+        struct.pack_into("<Q", self._map, 24, self.count)
+        self._map.flush()
+
+    def close(self) -> None:
+        """Flush and unmap the file."""
+        if not self._map.closed:
+            self.flush()
+            self._bits.release()
+            self._map.close()
+        self._file.close()
+
+
+class SuppressionList:
+    """
+    Set of LinkedIn URLs and emails that must never be shortlisted again.
+
+    Membership is checked against a memory-mapped Bloom filter; only its
+    (rare) positive answers are confirmed with an exact lookup in a SQLite
+    table, so false positives never suppress anyone. Neither structure is
+    loaded into memory, so opening a list of millions of entries is
+    instant.
+
+    Files: <path>.bloom and <path>.sqlite.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        expected_items: int = 10_000_000,
+        false_positive_rate: float = 0.001,
+        batch_size: int = 5000
+    ):
+        """
+        Open (or create) a suppression list.
+
+        Args:
+            path: Base path of the list files (without extension)
+            expected_items: Bloom filter capacity when creating the list
+            false_positive_rate: Bloom filter error rate at capacity
+            batch_size: Entries written per transaction by add_keys()
+        """
+        self.path = path
+        self.expected_items = expected_items
+        self.false_positive_rate = false_positive_rate
+        self.batch_size = batch_size
+        self.bloom = BloomFilter(path + ".bloom", expected_items, false_positive_rate)
+        self._conn = sqlite3.connect(path + ".sqlite", check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS suppressed (key TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        self.false_positives = 0
+
+    def add_keys(self, keys: Iterable[str]) -> int:
+        """
+        Add normalized keys (see suppression_keys() / parse_entry()).
+
+        Args:
+            keys: Keys to suppress
+
+        Returns:
+            Number of keys that were not already in the list
+        """
+        added = 0
+        iterator = iter(keys)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                break
+            # Keys absent from the Bloom filter are new unless the .bloom file
+            # lags the table (crash before flush(), file deleted or rebuilt)
+            fresh = [key for key in dict.fromkeys(batch) if key not in self.bloom]
+            known = set(fresh)
+            with self._conn:
+                cursor = self._conn.executemany(
+                    "INSERT OR IGNORE INTO suppressed (key) VALUES (?)", [(key,) for key in fresh]
+                )
+                for key in fresh:
+                    self.bloom.add(key)
+                added += max(cursor.rowcount, 0)
+                for key in batch:
+                    if key in known:
+                        continue
+                    known.add(key)
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO suppressed (key) VALUES (?)", (key,)
+                    )
+                    if cursor.rowcount:
+                        self.bloom.add(key)
+                        added += 1
+        self.bloom.flush()
+        return added
+
+    def add_candidates(self, candidates: Iterable[Candidate]) -> int:
+        """
+        Suppress candidates by LinkedIn URL and email (e.g. after an export).
+
+        Args:
+            candidates: Candidates to suppress
+
+        Returns:
+            Number of new keys added
+        """
+        return self.add_keys(
+            key for candidate in candidates for key in suppression_keys(candidate)
+        )
+
+    def contains_key(self, key: str) -> bool:
+        """Exact membership test for a normalized key."""
+        if key not in self.bloom:
+            return False
+        found = self._conn.execute(
+            "SELECT 1 FROM suppressed WHERE key = ?", (key,)
+        ).fetchone() is not None
+        if not found:
+            self.false_positives += 1
+        return found
+
+    def is_suppressed(self, candidate: Candidate) -> bool:
+        """
+        Check whether a candidate's URL or email is on the list.
+
+        The URL is checked first, so a lazy candidate is only fetched for
+        its email when the URL is not suppressed.
+        """
+        if candidate.linkedin_url:
+            if self.contains_key("url:" + normalize_linkedin_url(candidate.linkedin_url)):
+                return True
+        email = normalize_email(candidate.email)
+        return bool(email) and self.contains_key("email:" + email)
+
+    def __len__(self) -> int:
+        """Number of suppressed keys."""
+        return self.bloom.count
+
+    def close(self) -> None:
+        """Close the list files."""
+        self.bloom.close()
+        self._conn.close()
+
+    def __enter__(self) -> "SuppressionList":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # Worker processes reopen the files instead of copying them
+        return (
+            self.__class__,
+            (self.path, self.expected_items, self.false_positive_rate, self.batch_size)
+        )
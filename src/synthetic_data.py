@@ -0,0 +1,191 @@
+"""Seeded synthetic candidate generator for benchmarks and load tests."""
+
+import random
+from dataclasses import dataclass, field
+from itertools import accumulate
+from statistics import NormalDist
+from typing import Dict, Iterator, List, Tuple
+
+from .candidate import Candidate
+
+
+# (nationality, home country, languages) for each background profile
+BACKGROUND_PROFILES: Dict[str, Tuple[str, str, List[str]]] = {
+    "china": ("Chinese", "China", ["Mandarin"]),
+    "taiwan": ("Taiwanese", "Taiwan", ["Mandarin"]),
+    "hong_kong": ("Chinese", "Hong Kong", ["Cantonese"]),
+    "singapore": ("Singaporean", "Singapore", ["Mandarin"]),
+    "uk": ("British", "UK", []),
+    "australia": ("Australian", "Australia", []),
+    "new_zealand": ("New Zealander", "New Zealand", []),
+    "usa": ("American", "USA", []),
+    "india": ("Indian", "India", ["Hindi"]),
+    "pakistan": ("Pakistani", "Pakistan", ["Urdu"]),
+    "egypt": ("Egyptian", "Egypt", ["Arabic"]),
+    "uae": ("Emirati", "UAE", ["Arabic"]),
+    "philippines": ("Filipino", "Philippines", ["Tagalog"]),
+    "vietnam": ("Vietnamese", "Vietnam", ["Vietnamese"]),
+    "malaysia": ("Malaysian", "Malaysia", ["Malay"]),
+}
+
+# Common study/work destinations for candidates with an overseas background
+ABROAD_COUNTRIES = ["UK", "Australia", "USA", "Canada", "Singapore"]
+
+SKILLS_BY_POSITION: Dict[str, List[str]] = {
+    "Operation Manager": ["Operations", "Supply Chain", "Process Optimization", "Team Leadership", "Logistics"],
+    "Compliance Advisor": ["Compliance", "Risk Management", "AML", "Regulatory Compliance", "Policy Analysis"],
+    "Business Development Manager": ["Sales", "B2B", "CRM", "Negotiation", "Market Research"],
+    "Operations Analyst": ["Excel", "SQL", "Reporting", "Operations"],
+    "Account Manager": ["Client Relations", "CRM", "Sales"],
+    "Risk Analyst": ["Risk Assessment", "Financial Modelling", "Compliance"],
+}
+
+FIRST_NAMES = [
+    "Wei", "Ming", "Fang", "Jing", "Yang", "James", "Emily", "Sophie", "Michael", "Sarah",
+    "Raj", "Ahmed", "Olivia", "Jack", "Mei", "Hiroshi", "Anh", "Maria", "Daniel", "Aisha",
+]
+LAST_NAMES = [
+    "Zhang", "Li", "Wang", "Chen", "Liu", "Wilson", "Smith", "Williams", "Brown", "Thompson",
+    "Patel", "Hassan", "Nguyen", "Tan", "Lee", "Khan", "Santos", "Walker", "Kelly", "Wong",
+]
+
+
+@dataclass
+class SyntheticDistribution:
+    """
+    Tunable distributions for synthetic candidates.
+
+    Attributes:
+        age_mean: Mean of the (normal) age distribution
+        age_sd: Standard deviation of age
+        experience_mean: Mean of the (normal) years-of-experience distribution
+        experience_sd: Standard deviation of experience
+        location_weights: Relative weight of each location
+        background_weights: Relative weight of each BACKGROUND_PROFILES key
+        position_weights: Relative weight of each position title
+        abroad_rate: Probability of an extra education/work country abroad
+    """
+    age_mean: float = 31.0
+    age_sd: float = 7.0
+    experience_mean: float = 3.0
+    experience_sd: float = 2.5
+    location_weights: Dict[str, float] = field(default_factory=lambda: {
+        "Melbourne": 0.28, "Sydney": 0.25, "Brisbane": 0.15, "Perth": 0.12,
+        "Adelaide": 0.08, "Canberra": 0.07, "Hobart": 0.05,
+    })
+    background_weights: Dict[str, float] = field(default_factory=lambda: {
+        "china": 0.18, "taiwan": 0.03, "hong_kong": 0.05, "singapore": 0.04,
+        "uk": 0.12, "australia": 0.18, "new_zealand": 0.04, "usa": 0.04,
+        "india": 0.12, "pakistan": 0.03, "egypt": 0.02, "uae": 0.02,
+        "philippines": 0.05, "vietnam": 0.05, "malaysia": 0.03,
+    })
+    position_weights: Dict[str, float] = field(default_factory=lambda: {
+        "Operation Manager": 0.22, "Compliance Advisor": 0.2,
+        "Business Development Manager": 0.22, "Operations Analyst": 0.14,
+        "Account Manager": 0.12, "Risk Analyst": 0.1,
+    })
+    abroad_rate: float = 0.4
+
+    @classmethod
+    def from_filter_settings(
+        cls,
+        filter_settings,
+        in_range_share: float = 0.7,
+        excluded_location_share: float = 0.2
+    ) -> "SyntheticDistribution":
+        """
+        Build a distribution centred on a FilterSettings' ranges.
+
+        Args:
+            filter_settings: FilterSettings whose ranges to target
+            in_range_share: Share of candidates inside each age/experience range
+            excluded_location_share: Share of candidates in excluded locations
+
+        Returns:
+            SyntheticDistribution tuned to the given settings
+        """
+        z = NormalDist().inv_cdf((1 + in_range_share) / 2)
+        distribution = cls(
+            age_mean=(filter_settings.min_age + filter_settings.max_age) / 2,
+            age_sd=(filter_settings.max_age - filter_settings.min_age) / 2 / z,
+            experience_mean=(filter_settings.min_experience_years + filter_settings.max_experience_years) / 2,
+            experience_sd=(filter_settings.max_experience_years - filter_settings.min_experience_years) / 2 / z,
+        )
+
+        excluded = {loc.lower() for loc in filter_settings.excluded_locations}
+        allowed = {k: v for k, v in distribution.location_weights.items() if k.lower() not in excluded}
+        allowed_total = sum(allowed.values())
+        weights = {k: v / allowed_total * (1 - excluded_location_share) for k, v in allowed.items()}
+        for location in filter_settings.excluded_locations:
+            weights[location] = excluded_location_share / len(filter_settings.excluded_locations)
+        distribution.location_weights = weights
+        return distribution
+
+
+def generate_candidates(
+    count: int,
+    seed: int = 0,
+    distribution: SyntheticDistribution = None
+) -> Iterator[Candidate]:
+    """
+    Lazily generate synthetic candidates.
+
+    The same seed and distribution always yield the same candidates, so
+    results can be compared across runs and commits.
+
+    Args:
+        count: Number of candidates to generate
+        seed: Random seed
+        distribution: Distributions to sample from (defaults apply if None)
+
+    Yields:
+        Candidate objects with unique LinkedIn URLs
+    """
+    if distribution is None:
+        distribution = SyntheticDistribution()
+    rng = random.Random(seed)
+
+    def sampler(weights: Dict[str, float]):
+        keys = list(weights)
+        cum_weights = list(accumulate(weights.values()))
+        return lambda: rng.choices(keys, cum_weights=cum_weights)[0]
+
+    pick_location = sampler(distribution.location_weights)
+    pick_background = sampler(distribution.background_weights)
+    pick_position = sampler(distribution.position_weights)
+
+    for index in range(count):
+        age = int(min(65, max(18, round(rng.gauss(distribution.age_mean, distribution.age_sd)))))
+        experience = rng.gauss(distribution.experience_mean, distribution.experience_sd)
+        experience = min(float(age - 18), max(0.0, round(experience * 2) / 2))
+
+        nationality, home, languages = BACKGROUND_PROFILES[pick_background()]
+        education = [home]
+        work = [home]
+        if rng.random() < distribution.abroad_rate:
+            abroad = rng.choice(ABROAD_COUNTRIES)
+            if abroad != home:
+                (education if rng.random() < 0.5 else work).append(abroad)
+        location = pick_location()
+        if "Australia" not in work and rng.random() < 0.6:
+            work.append("Australia")
+
+        position = pick_position()
+        skills = rng.sample(SKILLS_BY_POSITION[position], k=min(3, len(SKILLS_BY_POSITION[position])))
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+
+        yield Candidate(
+            name=f"{first} {last}",
+            age=age,
+            experience_years=experience,
+            location=location,
+            nationality=nationality,
+            education_background=education,
+            work_background=work,
+            linkedin_url=f"https://linkedin.com/in/{first.lower()}{last.lower()}-{index:x}",
+            current_position=position,
+            skills=skills,
+            languages=languages + ["English"],
+            email=f"{first.lower()}.{last.lower()}{index}@example.com"
+        )